@@ -0,0 +1,78 @@
+"""
+Coste de los pesos adaptativos (árbol de Fenwick) con diccionarios grandes.
+
+Construye un índice sintético de N palabras repartidas en temáticas y
+mide la construcción, el robo (en unas pocas temáticas y en todas) y las
+actualizaciones tras una partida. Uso (desde la raíz del repo):
+
+    python -m benchmarks.adaptive_weights --words 100000 --theme-size 100
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.common import percentiles, write_results
+from dictionaries.adaptive import AdaptiveWeights
+from dictionaries.index import WEIGHTING_BY_WORD, WordIndex
+
+
+def _synthetic_index(num_words: int, theme_size: int) -> WordIndex:
+    themes = {
+        f"Temática {t}": [
+            {"word": f"palabra {t}-{i}", "hint": "pista"} for i in range(theme_size)
+        ]
+        for t in range(max(1, num_words // theme_size))
+    }
+    return WordIndex(themes)
+
+
+def _timed_us(func, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return percentiles(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pesos adaptativos: construcción, robo y actualización")
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--theme-size", type=int, default=100)
+    parser.add_argument("--selected", type=int, default=5, help="temáticas elegidas en el robo")
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--output", default="bench_adaptive_weights.json")
+    args = parser.parse_args()
+
+    index = _synthetic_index(args.words, args.theme_size)
+    start = time.perf_counter()
+    weights = AdaptiveWeights(index)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(0)
+    num_themes = len(index.theme_names)
+    selected = rng.sample(range(num_themes), min(args.selected, num_themes))
+    n = len(index)
+
+    results = {
+        "words": n,
+        "themes": num_themes,
+        "build_ms": build_ms,
+        "draw_selected_us": _timed_us(lambda: weights.draw(selected, WEIGHTING_BY_WORD, rng), args.repeat),
+        "record_outcome_us": _timed_us(
+            lambda: weights.record_outcome(rng.randrange(n), rng.random() < 0.5), args.repeat
+        ),
+        "note_played_us": _timed_us(lambda: weights.note_played(rng.randrange(n)), args.repeat),
+    }
+    out = write_results(args.output, "adaptive_weights", results)
+
+    print(f"{n} palabras en {num_themes} temáticas; construcción {build_ms:.1f} ms")
+    for key in ("draw_selected_us", "record_outcome_us", "note_played_us"):
+        stats = results[key]
+        print(f"{key:20s} p50 {stats['p50']:7.1f} µs  p99 {stats['p99']:7.1f} µs")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Arranque en frío: tiempo hasta el primer render de la pantalla de config.
+
+Lanza un proceso de Python nuevo con `-X importtime` que importa
+Streamlit, ejecuta `test.py` con `AppTest` una vez (primer render, con
+todas las importaciones de la app) y otra más (render en caliente). Se
+repite varias veces y se da la mediana. Uso (desde la raíz del repo):
+
+    python -m benchmarks.cold_start --repeat 5 --output bench_cold_start.json
+
+Además del tiempo, lista las importaciones más caras que ocurren durante
+el primer render, para ver qué módulo se ha colado en el arranque.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks.common import REPO_ROOT, write_results
+
+START_MARK = "@@first-render-start@@"
+END_MARK = "@@first-render-end@@"
+
+_CHILD = f"""
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+t1 = time.perf_counter()
+sys.stderr.write("{START_MARK}\\n"); sys.stderr.flush()
+at = AppTest.from_file({str(REPO_ROOT / "test.py")!r}, default_timeout=120)
+at.run()
+t2 = time.perf_counter()
+sys.stderr.write("{END_MARK}\\n"); sys.stderr.flush()
+at.run()
+t3 = time.perf_counter()
+assert at.session_state.game.phase == "config" and not at.exception, at.exception
+print(json.dumps({{
+    "streamlit_import_s": t1 - t0,
+    "first_render_s": t2 - t1,
+    "warm_render_s": t3 - t2,
+}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(módulo, self µs, acumulado µs) de las importaciones del primer render."""
+    imports = []
+    inside = False
+    for line in stderr.splitlines():
+        if line == START_MARK:
+            inside = True
+        elif line == END_MARK:
+            break
+        elif inside and line.startswith("import time:") and "|" in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            if not self_us.strip().isdigit():
+                continue  # cabecera
+            # El nombre lleva un espacio fijo y dos más por nivel de anidamiento
+            imports.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def run_once() -> Dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    imports = _parse_importtime(proc.stderr)
+    result["first_render_import_s"] = sum(self_us for _, self_us, _ in imports) / 1e6
+    # Sólo importaciones de primer nivel (sin sangría): ya incluyen a sus hijas
+    top_level = [(name, cum) for name, _, cum in imports if not name.startswith(" ")]
+    result["top_imports"] = sorted(top_level, key=lambda x: -x[1])[:15]
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque en frío de la app")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="bench_cold_start.json")
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.repeat)]
+    keys = ("streamlit_import_s", "first_render_s", "warm_render_s", "first_render_import_s")
+    results = {key: statistics.median(run[key] for run in runs) for key in keys}
+    results["repeat"] = args.repeat
+    results["top_imports"] = runs[-1]["top_imports"]
+    out = write_results(args.output, "cold_start", results)
+
+    print(f"import de streamlit:          {results['streamlit_import_s'] * 1e3:8.1f} ms")
+    print(f"primer render (config):       {results['first_render_s'] * 1e3:8.1f} ms")
+    print(f"  de ello, importaciones:     {results['first_render_import_s'] * 1e3:8.1f} ms")
+    print(f"render en caliente:           {results['warm_render_s'] * 1e3:8.1f} ms")
+    print("importaciones más caras del primer render (acumulado):")
+    for name, cumulative_us in results["top_imports"]:
+        print(f"  {cumulative_us / 1e3:8.1f} ms  {name}")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Utilidades compartidas por los benchmarks: percentiles y ficheros de resultados."""
+
+import json
+import math
+import platform
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def percentiles(samples: Iterable[float], points=(50, 90, 99)) -> Dict[str, float]:
+    """Percentiles por rango más cercano, más media y máximo."""
+    data: List[float] = sorted(samples)
+    if not data:
+        return {}
+    result = {}
+    for p in points:
+        rank = max(1, math.ceil(p * len(data) / 100))
+        result[f"p{p}"] = data[min(rank, len(data)) - 1]
+    result["mean"] = sum(data) / len(data)
+    result["max"] = data[-1]
+    return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def write_results(path: str, name: str, results: dict) -> Path:
+    """Guarda los resultados con metadatos para poder comparar entre commits."""
+    payload = {
+        "benchmark": name,
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    out = Path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return out
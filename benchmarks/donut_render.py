@@ -0,0 +1,82 @@
+"""
+Coste por tick del donut del temporizador: Plotly frente al SVG cacheado.
+
+Uso (desde la raíz del repo):
+
+    python -m benchmarks.donut_render [--total 180]
+
+Para Plotly se mide lo que hacía cada tick de `render_play_screen`:
+construir la figura, `update_layout` y serializarla a JSON (lo que
+`st.plotly_chart` manda al navegador). Si Plotly no está instalado se
+salta esa parte.
+"""
+
+import argparse
+import time
+
+from components.donut import donut_svg
+
+
+def _plotly_tick(total: int, remaining: int) -> str:
+    import plotly.graph_objects as go
+
+    used = total - remaining
+    fig = go.Figure(
+        data=[
+            go.Pie(
+                values=[used, remaining],
+                hole=0.6,
+                sort=False,
+                direction="clockwise",
+                marker=dict(
+                    colors=["#9b5de5", "#444444"],
+                    line=dict(color="#000000", width=1),
+                ),
+                textinfo="none",
+            )
+        ]
+    )
+    fig.update_layout(
+        showlegend=False,
+        margin=dict(l=0, r=0, t=0, b=0),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        width=260,
+        height=260,
+    )
+    return fig.to_json()
+
+
+def _measure(render, total: int):
+    """Tiempo medio por tick (µs) y bytes medios por tick de un timer completo."""
+    sizes = 0
+    start = time.perf_counter()
+    for remaining in range(total, -1, -1):
+        sizes += len(render(total, remaining).encode("utf-8"))
+    elapsed = time.perf_counter() - start
+    ticks = total + 1
+    return elapsed / ticks * 1e6, sizes / ticks
+
+
+def _report(name: str, result) -> None:
+    us, size = result
+    print(f"{name:<22} {us:>12.1f} µs/tick {size:>10.0f} B/tick")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--total", type=int, default=180, help="duración del timer en segundos")
+    args = parser.parse_args()
+
+    try:
+        _report("plotly (antes)", _measure(_plotly_tick, args.total))
+    except ImportError:
+        print("plotly (antes)         no instalado, se omite")
+
+    donut_svg.cache_clear()
+    _report("svg, caché fría", _measure(donut_svg, args.total))
+    _report("svg, caché caliente", _measure(donut_svg, args.total))
+
+
+if __name__ == "__main__":
+    main()
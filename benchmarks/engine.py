@@ -0,0 +1,101 @@
+"""
+Rendimiento del motor de reglas (`engine`) sin Streamlit.
+
+Mide cuántas partidas por segundo se reparten de principio a fin
+(configuración -> reparto -> revelación de todos -> temporizador ->
+vuelta al menú) y lo que cuesta cada operación por separado. Uso (desde
+la raíz del repo):
+
+    python -m benchmarks.engine --players 8 --impostors 2 --games 20000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.common import percentiles, write_results
+from dictionaries.index import get_word_index
+from engine import GameConfig, check_config, deal, deal_roles, draw_word, start_round
+from game_state import GameState
+from i18n import DEFAULT_LOCALE, LOCALES
+from voting import VoteTally
+
+
+def _timed_us(func, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return percentiles(samples)
+
+
+def _play_game(game: GameState, config: GameConfig) -> None:
+    start_round(game, config)
+    while game.current_player() is not None:
+        game.show_role()
+        game.next_player()
+    game.start_timer(0.0)
+    game.back_to_config()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Motor de reglas: partidas por segundo y coste por operación")
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--impostors", type=int, default=2)
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=20_000)
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=DEFAULT_LOCALE)
+    parser.add_argument("--decoy", action="store_true", help="modo infiltrado (palabra parecida)")
+    parser.add_argument("--output", default="bench_engine.json")
+    args = parser.parse_args()
+
+    themes = get_word_index(args.locale).theme_names
+    config = GameConfig(
+        players=tuple(f"Jugador {i}" for i in range(1, args.players + 1)),
+        num_impostors=args.impostors,
+        selected_themes=themes,
+        decoy_words=args.decoy,
+        locale=args.locale,
+    )
+    rng = random.Random(0)
+    game = GameState()
+    _play_game(game, config)  # calienta cachés (índice, muestreador, similitud)
+
+    start = time.perf_counter()
+    for _ in range(args.games):
+        _play_game(game, config)
+    seconds = time.perf_counter() - start
+
+    tally = VoteTally(args.players)
+    results = {
+        "players": args.players,
+        "impostors": args.impostors,
+        "decoy": args.decoy,
+        "games": args.games,
+        "games_per_second": args.games / seconds,
+        "check_config_us": _timed_us(lambda: check_config(config), args.repeat),
+        "deal_roles_us": _timed_us(lambda: deal_roles(args.players, args.impostors, rng), args.repeat),
+        "draw_word_us": _timed_us(
+            lambda: draw_word(themes, config.word_weighting, None, rng, args.locale), args.repeat
+        ),
+        "deal_us": _timed_us(lambda: deal(config), args.repeat),
+        "full_game_us": _timed_us(lambda: _play_game(game, config), args.repeat),
+        "vote_us": _timed_us(
+            lambda: tally.cast(rng.randrange(args.players), rng.randrange(args.players)), args.repeat
+        ),
+    }
+    out = write_results(args.output, "engine", results)
+
+    print(
+        f"{args.games} partidas de {args.players} jugadores en {seconds:.2f} s: "
+        f"{results['games_per_second']:,.0f} partidas/s"
+    )
+    for key in ("check_config_us", "deal_roles_us", "draw_word_us", "deal_us", "full_game_us", "vote_us"):
+        stats = results[key]
+        print(f"{key:16s} p50 {stats['p50']:7.1f} µs  p99 {stats['p99']:7.1f} µs")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Memoria por sesión del estado de la partida: claves sueltas frente a GameState.
+
+Crea N partidas de 8 jugadores con el formato antiguo (un dict con las
+~11 claves de partida, listas de índices incluidas) y con `GameState`, y
+mide con tracemalloc lo que ocupan. También da el tamaño serializado.
+Uso (desde la raíz del repo):
+
+    python -m benchmarks.game_state --sessions 10000 --players 8
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.common import write_results
+from game_state import GameState
+from roles import ImpostorSet, RevealOrder
+
+WORD, HINT, THEME = "Mercado", "fragor", "🏙️ Ciudad"
+
+
+def _legacy_state(num_players: int, rng: random.Random) -> dict:
+    start = rng.randrange(num_players)
+    return {
+        "phase": "play",
+        "impostor_indices": rng.sample(range(num_players), 2),
+        "reveal_order": [(start + i) % num_players for i in range(num_players)],
+        "reveal_pos": num_players,
+        "is_revealed": False,
+        "civil_word": WORD,
+        "impostor_hint": HINT,
+        "theme_name": THEME,
+        "countdown_started_at": time.time(),
+        "game_seed": rng.getrandbits(63),
+        "game_id": "%032x" % rng.getrandbits(128),
+    }
+
+
+def _game_state(num_players: int, rng: random.Random) -> GameState:
+    return GameState(
+        phase="play",
+        impostors=ImpostorSet(num_players, rng.sample(range(num_players), 2)),
+        reveal_order=RevealOrder(rng.randrange(num_players), num_players),
+        reveal_pos=num_players,
+        civil_word=WORD,
+        impostor_hint=HINT,
+        theme_name=THEME,
+        countdown_started_at=time.time(),
+        seed=rng.getrandbits(63),
+        game_id="%032x" % rng.getrandbits(128),
+    )
+
+
+def _bytes_per_session(factory, sessions: int, num_players: int) -> float:
+    rng = random.Random(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = [factory(num_players, rng) for _ in range(sessions)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del states
+    return used / sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memoria del estado de partida por sesión")
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--output", default="bench_game_state.json")
+    args = parser.parse_args()
+
+    sample = _game_state(args.players, random.Random(0))
+    results = {
+        "sessions": args.sessions,
+        "players": args.players,
+        "legacy_bytes_per_session": _bytes_per_session(_legacy_state, args.sessions, args.players),
+        "game_state_bytes_per_session": _bytes_per_session(_game_state, args.sessions, args.players),
+        "footprint_bytes": sample.footprint(),
+        "binary_bytes": len(sample.to_bytes()),
+        "json_bytes": len(sample.to_json().encode("utf-8")),
+    }
+    out = write_results(args.output, "game_state", results)
+
+    print(f"claves sueltas (dict):   {results['legacy_bytes_per_session']:8.0f} B/sesión")
+    print(f"GameState:               {results['game_state_bytes_per_session']:8.0f} B/sesión")
+    print(f"GameState.footprint():   {results['footprint_bytes']:8d} B")
+    print(f"serializado binario:     {results['binary_bytes']:8d} B")
+    print(f"serializado JSON:        {results['json_bytes']:8d} B")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Simulador de clientes para el servidor de salas (`server`).
+
+Abre primero muchas conexiones ociosas (jugadores esperando en el lobby
+de sus salas) y, con ellas abiertas, juega partidas completas en varias
+mesas a la vez: crear sala, unirse, configurar, repartir, ver el rol,
+temporizador, votar. Mide la latencia de cada operación, los bytes que
+llegan a cada cliente y, si arranca él el servidor, su memoria. Uso
+(desde la raíz del repo):
+
+    python -m benchmarks.room_server --idle 2000 --tables 50 --players 8
+    python -m benchmarks.room_server --port 8765      # contra un servidor ya arrancado
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.common import REPO_ROOT, percentiles, write_results
+from dictionaries.index import get_word_index
+from server.app import raise_fd_limit
+from server.client import RoomClient
+
+HOST = "127.0.0.1"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def _spawn_server(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "server", "--host", HOST, "--port", str(port)],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("el servidor no ha arrancado")
+
+
+def _rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+async def _health(port: int) -> dict:
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+    data = await reader.read()
+    writer.close()
+    return json.loads(data.split(b"\r\n\r\n", 1)[1])
+
+
+class Timings:
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+
+    async def timed(self, name: str, awaitable):
+        start = time.perf_counter()
+        result = await awaitable
+        self.samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+        return result
+
+
+async def _open_room(port: int, size: int, timings: Timings, prefix: str) -> List[RoomClient]:
+    """Una sala en el lobby: el primero la crea y los demás se unen."""
+    host = await timings.timed("connect_ms", RoomClient.connect(HOST, port))
+    await host.send("create", name=f"{prefix}-0", locale="es")
+    await timings.timed("create_ms", host.expect("joined"))
+    clients = [host]
+    for i in range(1, size):
+        client = await timings.timed("connect_ms", RoomClient.connect(HOST, port))
+        await client.send("join", code=host.code, name=f"{prefix}-{i}")
+        await timings.timed("join_ms", client.expect("joined"))
+        clients.append(client)
+    return clients
+
+
+async def _play_table(port: int, size: int, theme: str, timings: Timings, table: int) -> List[RoomClient]:
+    clients = await _open_room(port, size, timings, f"mesa{table}")
+    host = clients[0]
+
+    async def everyone(key, value):
+        await asyncio.gather(*(c.wait_for(key, value) for c in clients))
+
+    await everyone("members", [f"mesa{table}-{i}" for i in range(size)])
+    await host.send("configure", num_impostors=1, selected_themes=[theme])
+    await timings.timed("configure_ms", everyone("selected_themes", [theme]))
+
+    await host.send("start")
+    await timings.timed("start_ms", everyone("phase", "reveal"))
+    for client in clients:
+        await client.send("role")
+    roles = await asyncio.gather(*(timings.timed("role_ms", c.expect("role")) for c in clients))
+
+    await host.send("timer")
+    await timings.timed("timer_ms", everyone("phase", "play"))
+    await host.send("start_vote")
+    await everyone("phase", "vote")
+    # Todos votan al primero que no sea ellos; al votar el último se cierra sola
+    for seat, client in enumerate(clients):
+        await client.send("vote", target=0 if seat else 1)
+    await timings.timed("vote_ms", everyone("phase", "lobby"))
+
+    assert sum(role["impostor"] for role in roles) <= 1
+    assert host.state["last_result"] is not None
+    return clients
+
+
+async def run(args) -> dict:
+    spawned = None
+    port = args.port
+    if not port:
+        port = _free_port()
+        spawned = _spawn_server(port)
+
+    theme = get_word_index("es").theme_names[0]
+    timings = Timings()
+    idle: List[RoomClient] = []
+    tables: List[RoomClient] = []
+    try:
+        rss_before = _rss_kb(spawned.pid) if spawned else None
+
+        # Conexiones ociosas: salas en el lobby que no hacen nada
+        start = time.perf_counter()
+        rooms = [
+            _open_room(port, args.players, timings, f"ociosa{r}")
+            for r in range(args.idle // args.players)
+        ]
+        for i in range(0, len(rooms), args.concurrency):
+            for clients in await asyncio.gather(*rooms[i:i + args.concurrency]):
+                idle.extend(clients)
+        idle_seconds = time.perf_counter() - start
+        rss_idle = _rss_kb(spawned.pid) if spawned else None
+
+        # Con todas ellas abiertas, partidas completas en paralelo
+        start = time.perf_counter()
+        for clients in await asyncio.gather(
+            *(_play_table(port, args.players, theme, timings, t) for t in range(args.tables))
+        ):
+            tables.extend(clients)
+        play_seconds = time.perf_counter() - start
+
+        await asyncio.sleep(args.hold)
+        health = await _health(port)
+    finally:
+        await asyncio.gather(*(c.close() for c in idle + tables))
+        if spawned is not None:
+            spawned.terminate()
+            spawned.wait()
+
+    results = {
+        "idle_connections": len(idle),
+        "idle_connect_seconds": idle_seconds,
+        "tables": args.tables,
+        "players": args.players,
+        "games_seconds": play_seconds,
+        "server_connections": health["connections"],
+        "server_rooms": health["rooms"],
+        "bytes_per_table_client": sum(c.received_bytes for c in tables) / max(1, len(tables)),
+    }
+    if rss_before is not None and rss_idle is not None:
+        results["server_rss_kb"] = rss_idle
+        results["server_kb_per_idle_connection"] = (rss_idle - rss_before) / max(1, len(idle))
+    for name, samples in timings.samples.items():
+        results[name] = percentiles(samples)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Carga del servidor de salas (asyncio)")
+    parser.add_argument("--port", type=int, default=0, help="0 = arranca un servidor propio")
+    parser.add_argument("--idle", type=int, default=2000, help="conexiones ociosas en lobbies")
+    parser.add_argument("--tables", type=int, default=50, help="mesas jugando a la vez")
+    parser.add_argument("--players", type=int, default=8, help="jugadores por sala")
+    parser.add_argument("--concurrency", type=int, default=50, help="salas ociosas abiertas a la vez")
+    parser.add_argument("--hold", type=float, default=1.0, help="segundos con todo abierto al final")
+    parser.add_argument("--output", default="bench_room_server.json")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    results = asyncio.run(run(args))
+    out = write_results(args.output, "room_server", results)
+
+    print(
+        f"{results['idle_connections']} conexiones ociosas en {results['idle_connect_seconds']:.1f} s; "
+        f"{args.tables} mesas de {args.players} en {results['games_seconds']:.2f} s"
+    )
+    print(f"el servidor veía {results['server_connections']} conexiones y {results['server_rooms']} salas")
+    if "server_kb_per_idle_connection" in results:
+        print(
+            f"memoria del servidor: {results['server_rss_kb'] / 1024:.0f} MB, "
+            f"{results['server_kb_per_idle_connection']:.1f} KB por conexión ociosa"
+        )
+    print(f"bytes recibidos por cliente en una partida: {results['bytes_per_table_client']:.0f}")
+    for name in ("connect_ms", "create_ms", "join_ms", "configure_ms", "start_ms", "role_ms", "timer_ms", "vote_ms"):
+        stats = results.get(name)
+        if stats:
+            print(f"{name:13s} p50 {stats['p50']:7.2f} ms  p99 {stats['p99']:7.2f} ms")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
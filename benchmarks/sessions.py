@@ -0,0 +1,186 @@
+"""
+Prueba de carga sin navegador: N sesiones recorriendo la app completa.
+
+Cada sesión es un `AppTest` de Streamlit sobre `test.py` (las vistas
+reales) que pasa por config → reveal → ready → play. `AppTest` usa estado
+global de Streamlit y no se puede ejecutar en varios hilos a la vez, así
+que la concurrencia se consigue con procesos: cada worker lleva su parte
+de las sesiones y las hace avanzar fase a fase, midiendo el CPU de cada
+fase por separado. Uso (desde la raíz del repo):
+
+    python -m benchmarks.sessions --sessions 50 --workers 8 \\
+        --timer-mode client --output bench_sessions.json
+
+Informa de percentiles de latencia por rerun y fase, memoria por sesión,
+CPU por segundo de temporizador y bytes por rerun (tamaño serializado de
+los elementos que la app manda al navegador).
+"""
+
+import argparse
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.common import REPO_ROOT, percentiles, write_results
+
+APP_FILE = str(REPO_ROOT / "test.py")
+PHASES = ("config", "reveal", "ready", "play")
+
+
+def _tree_bytes(node) -> int:
+    """Suma del tamaño protobuf de todos los elementos del árbol."""
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        total += _tree_bytes(child)
+    return total
+
+
+def _button(at: AppTest, label_start: str = "", key: str = ""):
+    if key:
+        return at.button(key=key)
+    for button in at.button:
+        if button.label.startswith(label_start):
+            return button
+    raise LookupError(f"No hay ningún botón '{label_start}' en fase {at.session_state.game.phase}")
+
+
+class Session:
+    """Una sesión simulada con sus medidas por fase."""
+
+    def __init__(self, args) -> None:
+        self.args = args
+        self.at = AppTest.from_file(APP_FILE, default_timeout=args.timeout)
+        self.latencies: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+        self.bytes: Dict[str, List[int]] = {phase: [] for phase in PHASES}
+
+    def _run(self, phase: str, action: Callable[[], None] = None) -> None:
+        start = time.perf_counter()
+        if action is not None:
+            action()
+        self.at.run()
+        self.latencies[phase].append(time.perf_counter() - start)
+        self.bytes[phase].append(_tree_bytes(self.at._tree))
+        if self.at.exception:
+            raise RuntimeError(f"Excepción en fase {phase}: {self.at.exception}")
+
+    def config(self) -> None:
+        at = self.at
+        self._run("config")
+        key = f"theme_picker_{at.session_state['locale']}_{at.session_state['themes_rev']}"
+        self._run("config", lambda: at.multiselect(key=key).set_value(self.args.themes))
+        at.session_state["countdown_seconds"] = self.args.timer_seconds
+        at.session_state["timer_mode"] = self.args.timer_mode
+        self._run("config", lambda: _button(at, "🎮").click())
+
+    def reveal(self) -> None:
+        at = self.at
+        while at.session_state["game"].phase == "reveal":
+            self._run("reveal", lambda: _button(at, key="show_role_button").click())
+            self._run("reveal", lambda: _button(at, key="hide_and_next_button").click())
+
+    def ready(self) -> None:
+        self._run("ready")
+
+    def play(self) -> None:
+        # El botón "Empezar temporizador" arrancaría el timer completo (60 s
+        # como mínimo), así que entramos en la fase de juego directamente y
+        # ajustamos el reloj para cubrir sólo los reruns que interesan.
+        game = self.at.session_state["game"]
+        total = self.args.timer_seconds
+        if self.args.timer_mode == "server":
+            # Quedan `ticks` segundos: la medida incluye los sleep(1) del bucle
+            ticks = self.args.timer_ticks
+            game.start_timer(time.time() - (total - ticks))
+            self._run("play")
+        else:
+            # En modo cliente el servidor sólo ejecuta al empezar y al expirar
+            game.start_timer(time.time())
+            self._run("play")
+            game.countdown_started_at = time.time() - total - 1
+            self._run("play")
+
+
+def _worker(args, count: int) -> dict:
+    """Ejecuta `count` sesiones en este proceso y devuelve sus medidas."""
+    tracemalloc.start()
+    mem_before = tracemalloc.get_traced_memory()[0]
+    sessions = [Session(args) for _ in range(count)]
+
+    cpu: Dict[str, float] = {}
+    for phase in PHASES:
+        cpu_start = time.process_time()
+        for session in sessions:
+            getattr(session, phase)()
+        cpu[phase] = time.process_time() - cpu_start
+
+    mem_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "memory": mem_after - mem_before,
+        "cpu": cpu,
+        "latencies": {p: [x for s in sessions for x in s.latencies[p]] for p in PHASES},
+        "bytes": {p: [x for s in sessions for x in s.bytes[p]] for p in PHASES},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prueba de carga multi-sesión con AppTest")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4, help="procesos en paralelo")
+    parser.add_argument("--timer-mode", choices=("client", "server"), default="client")
+    parser.add_argument("--timer-seconds", type=int, default=60)
+    parser.add_argument("--timer-ticks", type=int, default=3, help="reruns de 1 s en modo server")
+    parser.add_argument("--themes", nargs="+", default=["🦁 Animales", "🍔 Comida"])
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", default="bench_sessions.json")
+    args = parser.parse_args()
+
+    workers = max(1, min(args.workers, args.sessions))
+    counts = [args.sessions // workers + (i < args.sessions % workers) for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_worker, [args] * workers, counts))
+
+    # Segundos de temporizador que ha cubierto la fase de juego
+    timer_seconds = args.timer_ticks if args.timer_mode == "server" else args.timer_seconds
+
+    cpu = {phase: sum(part["cpu"][phase] for part in parts) for phase in PHASES}
+    results = {
+        "config": vars(args),
+        "memory_per_session_bytes": sum(part["memory"] for part in parts) / args.sessions,
+        "cpu_per_timer_second": cpu["play"] / (args.sessions * timer_seconds),
+        "phases": {},
+    }
+    for phase in PHASES:
+        latencies = [x for part in parts for x in part["latencies"][phase]]
+        sizes = [x for part in parts for x in part["bytes"][phase]]
+        results["phases"][phase] = {
+            "reruns": len(latencies),
+            "latency_s": percentiles(latencies),
+            "bytes_per_rerun": percentiles(sizes),
+            "cpu_s": cpu[phase],
+        }
+
+    out = write_results(args.output, "sessions", results)
+
+    print(f"{'fase':<8} {'reruns':>7} {'p50 ms':>8} {'p99 ms':>8} {'B/rerun':>9} {'CPU s':>7}")
+    for phase, data in results["phases"].items():
+        lat = data["latency_s"]
+        print(
+            f"{phase:<8} {data['reruns']:>7} {lat.get('p50', 0) * 1e3:>8.1f} "
+            f"{lat.get('p99', 0) * 1e3:>8.1f} {data['bytes_per_rerun'].get('mean', 0):>9.0f} "
+            f"{data['cpu_s']:>7.2f}"
+        )
+    print(f"memoria por sesión: {results['memory_per_session_bytes'] / 1024:.1f} KiB")
+    print(f"CPU por segundo de temporizador: {results['cpu_per_timer_second'] * 1e3:.2f} ms")
+    print(f"resultados en {out}")
+
+
+if __name__ == "__main__":
+    main()
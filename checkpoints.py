@@ -0,0 +1,228 @@
+"""
+Puntos de control de la partida en disco, para sobrevivir a reinicios.
+
+Si el servidor se reinicia (p. ej. en un despliegue) o el navegador se
+reconecta con una sesión nueva, la partida en `reveal`, `ready` o `play`
+se perdía. Ahora, en cuanto cambia el estado de la partida, se guarda un
+fichero JSON pequeño con la partida, los jugadores y el temporizador, y
+la URL lleva un token (`?partida=...`) que lo identifica. Una sesión
+nueva que llega con ese token recupera la partida con una sola lectura,
+con el `countdown_started_at` original.
+
+Las escrituras son atómicas (fichero temporal + `os.replace`), así que
+un corte a mitad de escritura deja el checkpoint anterior intacto. El
+directorio se elige con IMPOSTOR_CHECKPOINT_DIR; con varias réplicas
+debe ser un directorio compartido.
+"""
+
+import json
+import logging
+import os
+import re
+import secrets
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import streamlit as st
+
+from game_state import PHASE_CONFIG, PHASE_ROOM, GameState
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR_ENV = "IMPOSTOR_CHECKPOINT_DIR"
+RESUME_PARAM = "partida"
+CHECKPOINT_TTL_SECONDS = 12 * 60 * 60  # una partida no dura tanto
+PURGE_INTERVAL_SECONDS = 60 * 60
+
+_FORMAT_VERSION = 1
+_TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+class CheckpointStore:
+    """Un fichero JSON por token, escrito de forma atómica."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._last_purge = 0.0
+
+    def _path(self, token: str) -> Optional[Path]:
+        # El token viene de la URL: nada de rutas raras
+        if not _TOKEN_RE.match(token or ""):
+            return None
+        return self.directory / f"{token}.json"
+
+    def save(self, token: str, payload: dict) -> None:
+        path = self._path(token)
+        if path is None:
+            raise ValueError("Token de checkpoint no válido")
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{token}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._maybe_purge()
+
+    def load(self, token: str) -> Optional[dict]:
+        path = self._path(token)
+        if path is None:
+            return None
+        try:
+            payload = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.exception("Checkpoint ilegible: %s", path.name)
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != _FORMAT_VERSION:
+            return None
+        return payload
+
+    def delete(self, token: str) -> None:
+        path = self._path(token)
+        if path is not None:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _maybe_purge(self) -> None:
+        now = time.time()
+        if now - self._last_purge < PURGE_INTERVAL_SECONDS:
+            return
+        self._last_purge = now
+        limit = now - CHECKPOINT_TTL_SECONDS
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < limit:
+                    path.unlink()
+            except OSError:
+                pass
+
+
+@st.cache_resource
+def get_checkpoint_store() -> Optional[CheckpointStore]:
+    """Almacén compartido del proceso, o None si no se puede usar el directorio."""
+    directory = os.environ.get(CHECKPOINT_DIR_ENV) or os.path.join(
+        tempfile.gettempdir(), "impostorapp-checkpoints"
+    )
+    try:
+        return CheckpointStore(directory)
+    except OSError:
+        logger.exception("No se pueden guardar checkpoints en %s", directory)
+        return None
+
+
+def _has_live_game(game: GameState) -> bool:
+    return game.phase not in (PHASE_CONFIG, PHASE_ROOM)
+
+
+def resume_from_query() -> bool:
+    """
+    Si la URL trae un token de partida y esta sesión todavía no tiene
+    ninguna, recupera la partida guardada. Devuelve True si la ha recuperado.
+    """
+    if st.session_state.checkpoint_token:
+        return False
+    token = st.query_params.get(RESUME_PARAM)
+    store = get_checkpoint_store()
+    if not token or store is None:
+        return False
+
+    payload = store.load(token)
+    if payload is None:
+        # Checkpoint caducado, de una partida ya terminada o ilegible
+        store.delete(token)
+        del st.query_params[RESUME_PARAM]
+        return False
+
+    # Se lee todo antes de tocar la sesión: un checkpoint a medias no la cambia
+    try:
+        game = GameState.from_dict(payload["game"])
+        players = [str(name) for name in payload["players"]]
+        if len(players) != game.impostors.num_players:
+            raise ValueError("Los jugadores no cuadran con la partida")
+        countdown_seconds = int(payload["countdown_seconds"])
+        timer_mode = str(payload["timer_mode"])
+        saved = game.to_bytes()
+    except (LookupError, TypeError, ValueError, AttributeError, struct.error):
+        # Corrupto, de un formato anterior o editado a mano: no se recupera
+        logger.exception("Checkpoint no válido: %s", token)
+        store.delete(token)
+        del st.query_params[RESUME_PARAM]
+        return False
+
+    st.session_state.game = game
+    st.session_state.players = players
+    st.session_state.player_keys = None
+    st.session_state.players_rev += 1
+    st.session_state.countdown_seconds = countdown_seconds
+    st.session_state.timer_mode = timer_mode
+    st.session_state.checkpoint_token = token
+    st.session_state.checkpoint_saved = saved
+    return True
+
+
+def discard_checkpoint() -> None:
+    """Borra el checkpoint de esta sesión (fichero y parámetro de la URL)."""
+    token = st.session_state.get("checkpoint_token") or st.query_params.get(RESUME_PARAM)
+    store = get_checkpoint_store()
+    if token and store is not None:
+        store.delete(token)
+    st.session_state.checkpoint_token = None
+    st.session_state.checkpoint_saved = None
+    st.query_params.pop(RESUME_PARAM, None)
+
+
+def sync_checkpoint() -> None:
+    """
+    Guarda la partida si ha cambiado desde el último checkpoint (una
+    comparación de ~100 bytes por rerun) y lo borra al volver al menú.
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return
+    game = st.session_state.game
+    token = st.session_state.checkpoint_token
+
+    if not _has_live_game(game):
+        if token:
+            discard_checkpoint()
+        return
+
+    snapshot = game.to_bytes()
+    if snapshot == st.session_state.checkpoint_saved:
+        return
+
+    if not token:
+        token = secrets.token_urlsafe(16)
+        st.session_state.checkpoint_token = token
+    payload = {
+        "version": _FORMAT_VERSION,
+        "saved_at": time.time(),
+        "game": game.to_dict(),
+        "players": list(st.session_state.players),
+        "countdown_seconds": st.session_state.countdown_seconds,
+        "timer_mode": st.session_state.timer_mode,
+    }
+    try:
+        store.save(token, payload)
+    except OSError:
+        # Sin checkpoint la partida sigue funcionando; sólo no se podrá recuperar
+        logger.exception("No se pudo guardar el checkpoint de la partida")
+        return
+    st.session_state.checkpoint_saved = snapshot
+    if st.query_params.get(RESUME_PARAM) != token:
+        st.query_params[RESUME_PARAM] = token
@@ -0,0 +1,99 @@
+import html as html_lib
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from state import get_fragment_decorator, safe_rerun
+
+
+# Plantilla del temporizador. La cuenta atrás y el donut se dibujan en el
+# navegador: el servidor sólo manda esto una vez al entrar en la pantalla.
+_COUNTDOWN_HTML = """
+<div id="countdown" style="text-align:center; font-family:sans-serif;">
+  <h2 id="label" style="margin:0 0 12px 0;">__LABEL__ <b id="clock">--:--</b> 🕒</h2>
+  <svg width="__SIZE__" height="__SIZE__" viewBox="0 0 42 42">
+    <circle cx="21" cy="21" r="15.9155" fill="transparent"
+            stroke="#444444" stroke-width="6.5"></circle>
+    <circle id="used" cx="21" cy="21" r="15.9155" fill="transparent"
+            stroke="#9b5de5" stroke-width="6.5" stroke-dasharray="0 100"
+            transform="rotate(-90 21 21)"></circle>
+  </svg>
+</div>
+<script>
+  (function () {
+    var total = __TOTAL__;
+    var deadline = Date.now() + __REMAINING__ * 1000;
+    var clock = document.getElementById("clock");
+    var used = document.getElementById("used");
+
+    try {
+      // Mismo color de texto que la app (tema claro u oscuro)
+      var color = window.parent.getComputedStyle(window.parent.document.body).color;
+      document.getElementById("label").style.color = color;
+    } catch (e) {
+      document.getElementById("label").style.color = "#888888";
+    }
+
+    function pad(n) { return (n < 10 ? "0" : "") + n; }
+
+    function tick() {
+      var remaining = Math.max(0, Math.ceil((deadline - Date.now()) / 1000));
+      clock.textContent = pad(Math.floor(remaining / 60)) + ":" + pad(remaining % 60);
+      var pct = total > 0 ? 100 * (total - remaining) / total : 100;
+      used.setAttribute("stroke-dasharray", pct + " " + (100 - pct));
+      if (remaining > 0) {
+        setTimeout(tick, 250);
+      }
+    }
+    tick();
+  })();
+</script>
+"""
+
+
+def render_countdown(
+    remaining: int, total: int, size: int = 260, label: str = "🕒 Tiempo restante:"
+) -> None:
+    """
+    Dibuja la cuenta atrás y el donut, que avanzan solos en el navegador.
+
+    El servidor sólo vuelve a mandar este HTML cuando hay un rerun (al
+    empezar, al acabar el tiempo o al pulsar un botón).
+    """
+    html = (
+        _COUNTDOWN_HTML.replace("__TOTAL__", str(int(total)))
+        .replace("__REMAINING__", str(int(remaining)))
+        .replace("__SIZE__", str(int(size)))
+        .replace("__LABEL__", html_lib.escape(label))
+    )
+    iframe = getattr(st, "iframe", None)
+    if iframe is not None:
+        # Streamlit reciente: st.components.v1.html está obsoleto
+        iframe(html, height=size + 70)
+    else:
+        components.html(html, height=size + 70)
+
+
+def supports_client_countdown() -> bool:
+    """True si esta versión de Streamlit tiene fragmentos (st.fragment)."""
+    return get_fragment_decorator() is not None
+
+
+def schedule_rerun_at_expiry(remaining: int, get_remaining) -> None:
+    """
+    Pide al servidor un único rerun completo cuando se acabe el tiempo.
+
+    Usa un fragmento con `run_every` igual al tiempo que falta: no se
+    ejecuta nada más hasta ese momento. Cualquier rerun completo anterior
+    (p. ej. volver al menú) lo cancela.
+    """
+    fragment = get_fragment_decorator()
+    if fragment is None or remaining <= 0:
+        return
+
+    @fragment(run_every=remaining + 0.5)
+    def _expiry_watcher() -> None:
+        if get_remaining() <= 0:
+            safe_rerun()
+
+    _expiry_watcher()
@@ -0,0 +1,37 @@
+from functools import lru_cache
+
+import streamlit as st
+
+
+# Mismos colores que el antiguo donut de Plotly
+USED_COLOR = "#9b5de5"       # violeta para la parte consumida
+REMAINING_COLOR = "#444444"  # gris oscuro para el resto
+
+
+@lru_cache(maxsize=2048)
+def donut_svg(total: int, remaining: int, size: int = 260) -> str:
+    """
+    SVG en línea del reloj circular para (total, remaining).
+
+    El círculo tiene perímetro 100 (r = 15.9155), así que el trazo violeta
+    es directamente el porcentaje consumido. Cacheado: como total va de 60
+    a 600 segundos, cada par distinto se genera una sola vez por proceso.
+    """
+    total = max(0, int(total))
+    remaining = max(0, min(int(remaining), total))
+    used_pct = 100.0 if total == 0 else 100.0 * (total - remaining) / total
+    return (
+        f'<div style="text-align:center;">'
+        f'<svg width="{size}" height="{size}" viewBox="0 0 42 42">'
+        f'<circle cx="21" cy="21" r="15.9155" fill="transparent" '
+        f'stroke="{REMAINING_COLOR}" stroke-width="6.5"/>'
+        f'<circle cx="21" cy="21" r="15.9155" fill="transparent" '
+        f'stroke="{USED_COLOR}" stroke-width="6.5" '
+        f'stroke-dasharray="{used_pct:.2f} {100 - used_pct:.2f}" '
+        f'transform="rotate(-90 21 21)"/>'
+        f"</svg></div>"
+    )
+
+
+def render_donut(total: int, remaining: int, size: int = 260) -> None:
+    st.markdown(donut_svg(total, remaining, size), unsafe_allow_html=True)
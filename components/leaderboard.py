@@ -0,0 +1,31 @@
+import html
+from typing import Optional
+
+import streamlit as st
+
+from i18n import t
+from voting import Leaderboard
+
+TOP_PLAYERS = 10
+
+
+def render_leaderboard(board: Leaderboard, me: Optional[str] = None, k: int = TOP_PLAYERS) -> None:
+    """
+    Los k primeros de la clasificación y, si `me` no está entre ellos, su
+    puesto. No recorre la clasificación entera: cuesta lo mismo con 10
+    jugadores que con 500.
+    """
+    if not len(board):
+        st.caption(t("vote.no_scores"))
+        return
+
+    rows = [
+        f"{i}. {'**' if name == me else ''}{html.escape(name)}{'**' if name == me else ''} — {score}"
+        for i, (name, score) in enumerate(board.top(k), start=1)
+    ]
+    st.markdown(t("vote.leaderboard", rounds=board.rounds))
+    st.markdown("  \n".join(rows))
+
+    rank = board.rank(me) if me is not None else None
+    if rank is not None and rank > k:
+        st.caption(t("vote.your_rank", rank=rank, total=len(board), score=board.scores[me]))
@@ -1,45 +1,221 @@
+"""
+Lista de jugadores de la pantalla de configuración.
+
+Pensada también para grupos grandes (eventos de 100+ personas): se puede
+pegar una lista entera de golpe, la lista se edita por páginas en una
+sola tabla (`st.data_editor`) que se guarda de una vez, y los repetidos
+se detectan con un índice de nombres normalizados (sin mayúsculas ni
+tildes, ver `textnorm.fold_text`). Así el coste de cada rerun depende del
+tamaño de la página, no del número de jugadores.
+"""
+
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
 import streamlit as st
 
+from i18n import get_locale, t
 from state import safe_rerun
+from textnorm import fold_text
+
+PAGE_SIZE = 20
+MAX_NAMES_IN_WARNING = 10
+
+
+def _clean_name(name: Optional[str]) -> str:
+    return " ".join((name or "").split())
+
+
+class _NameIndex:
+    """
+    Cuántas veces sale cada nombre normalizado en la lista. Cuenta también
+    los repetidos que ya vinieran en ella (p. ej. de un checkpoint o una
+    sala), así que `size` siempre es la longitud de la lista que indexa.
+    """
+
+    __slots__ = ("counts", "size")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.counts = Counter(fold_text(name) for name in names)
+        self.size = sum(self.counts.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.counts
+
+    def add(self, key: str) -> None:
+        self.counts[key] += 1
+        self.size += 1
+
+    def remove(self, key: str) -> None:
+        count = self.counts[key] - 1
+        if count > 0:
+            self.counts[key] = count
+        else:
+            del self.counts[key]
+        self.size -= 1
+
+
+def _player_keys() -> _NameIndex:
+    """Índice de nombres normalizados de la lista actual (se rehace si no cuadra)."""
+    players = st.session_state.players
+    keys = st.session_state.get("player_keys")
+    if not isinstance(keys, _NameIndex) or keys.size != len(players):
+        keys = _NameIndex(players)
+        st.session_state.player_keys = keys
+    return keys
+
+
+def _players_changed() -> None:
+    # Cambia la key de la tabla para que no arrastre ediciones viejas
+    st.session_state.players_rev += 1
+
+
+def add_players(names: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """Añade los nombres nuevos al final. Devuelve (añadidos, repetidos)."""
+    keys = _player_keys()
+    players = st.session_state.players
+    added, repeated = [], []
+    for name in names:
+        name = _clean_name(name)
+        if not name:
+            continue
+        key = fold_text(name)
+        if key in keys:
+            repeated.append(name)
+        else:
+            keys.add(key)
+            players.append(name)
+            added.append(name)
+    if added:
+        _players_changed()
+    return added, repeated
+
+
+def replace_players(start: int, end: int, names: Iterable[str]) -> List[str]:
+    """Sustituye players[start:end] por `names`. Devuelve los repetidos descartados."""
+    keys = _player_keys()
+    players = st.session_state.players
+    for old in players[start:end]:
+        keys.remove(fold_text(old))
+
+    kept, repeated = [], []
+    for name in names:
+        name = _clean_name(name)
+        if not name:
+            continue
+        key = fold_text(name)
+        if key in keys:
+            repeated.append(name)
+        else:
+            keys.add(key)
+            kept.append(name)
+
+    players[start:end] = kept
+    _players_changed()
+    return repeated
+
+
+def clear_players() -> None:
+    st.session_state.players.clear()
+    st.session_state.player_keys = _NameIndex()
+    _players_changed()
+
+
+def _warn_repeated(repeated: List[str]) -> None:
+    if not repeated:
+        return
+    shown = ", ".join(repeated[:MAX_NAMES_IN_WARNING])
+    if len(repeated) > MAX_NAMES_IN_WARNING:
+        shown = t("players.and_more", names=shown, count=len(repeated) - MAX_NAMES_IN_WARNING)
+    st.warning(t("players.repeated", names=shown))
+
+
+def _render_add_forms() -> None:
+    with st.form("add_player_form", clear_on_submit=True):
+        new_player_name = st.text_input(
+            t("players.name"),
+            placeholder=t("common.name_placeholder"),
+        )
+        add_clicked = st.form_submit_button(t("players.add"))
+
+    if add_clicked:
+        if not _clean_name(new_player_name):
+            st.warning(t("players.empty_name"))
+        else:
+            _, repeated = add_players([new_player_name])
+            if repeated:
+                st.warning(t("players.already_listed"))
+
+    with st.expander(t("players.paste")):
+        with st.form("bulk_players_form", clear_on_submit=True):
+            pasted = st.text_area(
+                t("players.one_per_line"),
+                placeholder=t("players.paste_placeholder"),
+                height=150,
+            )
+            bulk_clicked = st.form_submit_button(t("players.add_all"))
+
+    if bulk_clicked:
+        added, repeated = add_players(pasted.splitlines())
+        if added:
+            st.success(t("players.added", count=len(added)))
+        _warn_repeated(repeated)
+
+
+def _render_players_page() -> None:
+    players = st.session_state.players
+    num_pages = (len(players) - 1) // PAGE_SIZE + 1
+
+    page = 1
+    if num_pages > 1:
+        # Si la lista ha encogido, la página guardada puede no existir ya
+        if st.session_state.get("players_page", 1) > num_pages:
+            st.session_state.players_page = num_pages
+        page = st.number_input(
+            t("players.page"),
+            min_value=1,
+            max_value=num_pages,
+            step=1,
+            key="players_page",
+        )
+
+    start = (page - 1) * PAGE_SIZE
+    end = min(start + PAGE_SIZE, len(players))
+    st.caption(t("players.page_caption", first=start + 1, last=end, total=len(players)))
+
+    name_column = t("players.column")
+    with st.form("players_page_form"):
+        edited = st.data_editor(
+            {name_column: players[start:end]},
+            num_rows="dynamic",
+            hide_index=True,
+            # Con el idioma cambia la columna: tabla nueva, sin ediciones viejas
+            key=f"players_editor_{get_locale()}_{st.session_state.players_rev}",
+        )
+        save_clicked = st.form_submit_button(t("players.save"))
+
+    if save_clicked:
+        repeated = replace_players(start, end, edited[name_column])
+        if repeated:
+            # Se muestra tras el rerun, con la tabla ya actualizada
+            st.session_state.players_notice = repeated
+        safe_rerun()
 
 
 def render_players_section() -> None:
-    st.subheader("Jugadores")
-
-    # Input simple (sin key): tras un rerun se borra y el usuario escribe el siguiente
-    new_player_name = st.text_input(
-        "Nombre del jugador",
-        placeholder="Ejemplo: Ana",
-    )
-
-    add_col, _ = st.columns([1, 3])
-    with add_col:
-        if st.button("Añadir jugador"):
-            name = (new_player_name or "").strip()
-            if not name:
-                st.warning("Escribe un nombre antes de añadir.")
-            elif name in st.session_state.players:
-                st.warning("Ese nombre ya está en la lista.")
-            else:
-                st.session_state.players.append(name)
-                safe_rerun()
+    st.subheader(t("players.title"))
+
+    _warn_repeated(st.session_state.pop("players_notice", None) or [])
+    _render_add_forms()
 
     # Lista de jugadores
-    players = st.session_state.players
-    if not players:
-        st.info("Todavía no hay jugadores añadidos.")
+    if not st.session_state.players:
+        st.info(t("players.none"))
     else:
-        st.markdown("**Lista de jugadores:**")
-        for i, name in enumerate(list(players)):
-            col_name, col_del = st.columns([4, 1])
-            col_name.write(f"- {name}")
-            if col_del.button("✖️", key=f"delete_player_{i}"):
-                try:
-                    del st.session_state.players[i]
-                except IndexError:
-                    pass
-                safe_rerun()
-
-    st.markdown(
-        f"**Número actual de jugadores:** {len(st.session_state.players)}"
-    )
+        st.markdown(t("players.list"))
+        _render_players_page()
+        if st.button(t("players.clear")):
+            clear_players()
+            safe_rerun()
+
+    st.markdown(t("players.count", count=len(st.session_state.players)))
@@ -0,0 +1,61 @@
+from typing import Optional
+
+import streamlit as st
+
+from i18n import t
+
+
+def render_role_card(
+    is_impostor: bool,
+    theme_name: Optional[str],
+    civil_word: str,
+    impostor_hint: Optional[str],
+    decoy_word: Optional[str] = None,
+) -> None:
+    """
+    Muestra la temática y el rol (con palabra o pista) de un jugador.
+
+    En el modo infiltrado (`decoy_word`) el impostor ve la tarjeta de civil
+    con su palabra parecida: no sabe que es el impostor.
+    """
+    st.markdown(
+        f"<p style='text-align:center;'>{t('role.theme', theme=theme_name)}</p>",
+        unsafe_allow_html=True,
+    )
+
+    if is_impostor and decoy_word:
+        civil_word = decoy_word
+        is_impostor = False
+
+    if is_impostor:
+        st.markdown(
+            f"<h3 style='text-align:center;'>{t('role.impostor')}</h3>",
+            unsafe_allow_html=True,
+        )
+        if impostor_hint:
+            st.markdown(
+                f"<p style='text-align:center;'>{t('role.hint')}</p>",
+                unsafe_allow_html=True,
+            )
+            st.markdown(
+                f"<p style='text-align:center;'><b>👉 {impostor_hint}</b></p>",
+                unsafe_allow_html=True,
+            )
+        else:
+            st.markdown(
+                f"<p style='text-align:center;'>{t('role.no_hint')}</p>",
+                unsafe_allow_html=True,
+            )
+    else:
+        st.markdown(
+            f"<h3 style='text-align:center;'>{t('role.civilian')}</h3>",
+            unsafe_allow_html=True,
+        )
+        st.markdown(
+            f"<p style='text-align:center;'>{t('role.word')}</p>",
+            unsafe_allow_html=True,
+        )
+        st.markdown(
+            f"<p style='text-align:center;'><b>👉 {civil_word}</b></p>",
+            unsafe_allow_html=True,
+        )
@@ -1,3 +1,12 @@
-from .default_words import THEMES
+from .loader import Dictionary, get_dictionary, get_dictionary_version
 
-__all__ = ["THEMES"]
\ No newline at end of file
+__all__ = ["THEMES", "Dictionary", "get_dictionary", "get_dictionary_version"]
+
+
+def __getattr__(name):
+    # THEMES (el diccionario por defecto) sólo se importa si alguien lo pide
+    if name == "THEMES":
+        from .default_words import THEMES
+
+        return THEMES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
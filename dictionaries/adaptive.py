@@ -0,0 +1,253 @@
+"""
+Pesos adaptativos por palabra, aprendidos de las partidas jugadas.
+
+Algunas palabras son demasiado fáciles (los civiles pillan al impostor
+enseguida) o demasiado difíciles (nunca lo pillan). Cada palabra guarda
+cuántas rondas han ganado civiles e impostores, con decaimiento
+exponencial para que pese más lo reciente, y su peso baja cuanto más
+desequilibrado es ese resultado. Además, las últimas palabras jugadas en
+todo el servidor (no sólo en esta sesión) con el modo adaptativo se
+penalizan durante unas cuantas partidas; las partidas sin él no tocan
+los pesos al repartir.
+
+Los pesos viven en un árbol de Fenwick sobre la tabla plana del índice
+(ver `dictionaries.index`), donde cada temática es un tramo contiguo:
+actualizar una palabra y robar dentro de una temática son O(log n).
+Cada temática lleva además la suma de sus pesos, así que elegir temática
+no recorre el árbol. Hay un objeto por idioma, compartido por todas las
+sesiones del proceso; los contadores ocupan 4 bytes por palabra y el
+árbol 8.
+"""
+
+import random
+import threading
+from array import array
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from i18n import DEFAULT_LOCALE
+
+from .index import WEIGHTING_BY_WORD, WordIndex, get_word_index
+
+OUTCOME_DECAY = 0.9      # cada resultado nuevo de una palabra multiplica los viejos por esto
+MIN_BALANCE = 0.2        # peso de una palabra que siempre gana el mismo bando
+RECENT_GAMES = 32        # cuántas palabras jugadas recuerda el servidor
+RECENT_PENALTY = 0.95    # la palabra recién jugada pesa 1 - 0.95 = 0.05...
+RECENT_DECAY = 0.85      # ...y recupera peso con cada partida que pasa
+
+
+class AdaptiveWeights:
+    """Pesos de todas las palabras de un índice, en un árbol de Fenwick."""
+
+    __slots__ = (
+        "index",
+        "lock",
+        "civilian_wins",
+        "impostor_wins",
+        "weights",
+        "tree",
+        "theme_totals",
+        "played",
+        "last_played",
+    )
+
+    def __init__(self, index: WordIndex, previous: Optional["AdaptiveWeights"] = None) -> None:
+        n = len(index)
+        self.index = index
+        self.lock = threading.Lock()
+        self.civilian_wins = array("f", bytes(4 * n))
+        self.impostor_wins = array("f", bytes(4 * n))
+        self.played = 0                            # partidas apuntadas en el servidor
+        self.last_played: Dict[int, int] = {}      # palabra reciente -> partida en la que salió
+        if previous is not None:
+            self._carry_over(previous)
+
+        self.weights = array("d", (self._weight(i) for i in range(n)))
+        # Construcción del árbol en O(n)
+        tree = array("d", bytes(8 * (n + 1)))
+        for i in range(1, n + 1):
+            tree[i] += self.weights[i - 1]
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self.tree = tree
+        # Suma de los pesos de cada temática: elegir temática no toca el árbol
+        self.theme_totals = array(
+            "d",
+            (sum(self.weights[start:start + size]) for start, size in zip(index.theme_start, index.theme_size)),
+        )
+
+    def _carry_over(self, previous: "AdaptiveWeights") -> None:
+        """Conserva las estadísticas de las palabras que siguen tras recargar el diccionario."""
+        ids = {key: i for i, key in enumerate(_word_keys(self.index))}
+        old_keys = list(_word_keys(previous.index))
+        for old_id, key in enumerate(old_keys):
+            new_id = ids.get(key)
+            if new_id is not None:
+                self.civilian_wins[new_id] = previous.civilian_wins[old_id]
+                self.impostor_wins[new_id] = previous.impostor_wins[old_id]
+        self.played = previous.played
+        for old_id, game in previous.last_played.items():
+            new_id = ids.get(old_keys[old_id])
+            if new_id is not None:
+                self.last_played[new_id] = game
+
+    # ---------- Pesos ----------
+
+    def _weight(self, word_id: int) -> float:
+        civilian, impostor = self.civilian_wins[word_id], self.impostor_wins[word_id]
+        # Probabilidad (suavizada) de que gane el impostor: 0.5 es lo ideal
+        p = (impostor + 1.0) / (civilian + impostor + 2.0)
+        weight = MIN_BALANCE + (1.0 - MIN_BALANCE) * 4.0 * p * (1.0 - p)
+        last = self.last_played.get(word_id)
+        if last is None:
+            return weight
+        age = self.played - 1 - last  # 0 = la última partida del servidor
+        return weight * (1.0 - RECENT_PENALTY * RECENT_DECAY ** age)
+
+    def _refresh(self, word_id: int) -> None:
+        delta = self._weight(word_id) - self.weights[word_id]
+        if not delta:
+            return
+        self.weights[word_id] += delta
+        self.theme_totals[self.index.word_theme[word_id]] += delta
+        tree, n = self.tree, len(self.weights)
+        i = word_id + 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def weight_of(self, word_id: int) -> float:
+        return self.weights[word_id]
+
+    # ---------- Consultas en el árbol ----------
+
+    def _prefix(self, count: int) -> float:
+        """Suma de los pesos de las palabras [0, count)."""
+        tree = self.tree
+        total = 0.0
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def _find(self, target: float) -> int:
+        """Primera palabra cuya suma acumulada supera `target`."""
+        tree, n = self.tree, len(self.weights)
+        pos = 0
+        step = 1 << n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def theme_weight(self, theme_id: int) -> float:
+        return self.theme_totals[theme_id]
+
+    def draw(self, theme_ids: Sequence[int], weighting: str, rng=random) -> Optional[int]:
+        """
+        Id de una palabra de las temáticas dadas, con probabilidad
+        proporcional a su peso. Con weighting="word" la temática sale según
+        la suma de sus pesos; si no, todas las temáticas salen por igual.
+
+        Primero se elige la temática (con `theme_totals`) y sólo después se
+        baja al árbol, una vez: O(log n) por robo, más O(T) para sumar las
+        T temáticas con weighting="word".
+        """
+        index = self.index
+        with self.lock:
+            totals = self.theme_totals
+            if weighting == WEIGHTING_BY_WORD:
+                chosen = None
+                target = rng.random() * sum(totals[t] for t in theme_ids)
+                for theme_id in theme_ids:
+                    total = totals[theme_id]
+                    if total > 0:
+                        chosen = theme_id
+                    if target < total:
+                        break
+                    target -= total
+                if chosen is None:
+                    return None
+            else:
+                if not theme_ids:
+                    return None
+                chosen = theme_ids[rng.randrange(len(theme_ids))]
+                if not index.theme_size[chosen]:
+                    # Las temáticas vacías no cuentan (ThemeSampler ya las quita):
+                    # repetir el sorteo entre las demás sigue siendo uniforme
+                    non_empty = [t for t in theme_ids if index.theme_size[t]]
+                    if not non_empty:
+                        return None
+                    chosen = non_empty[rng.randrange(len(non_empty))]
+                target = rng.random() * totals[chosen]
+
+            start, size = index.theme_start[chosen], index.theme_size[chosen]
+            word_id = self._find(self._prefix(start) + target)
+        # Por redondeo puede caer justo en el borde del tramo
+        return min(max(word_id, start), start + size - 1)
+
+    # ---------- Actualizaciones ----------
+
+    def note_played(self, word_id: int) -> None:
+        """Penaliza la palabra recién jugada y devuelve peso a las anteriores."""
+        with self.lock:
+            self.last_played[word_id] = self.played
+            self.played += 1
+            # Ha cambiado la edad de todas las recientes: como mucho RECENT_GAMES palabras
+            for recent_id, game in list(self.last_played.items()):
+                if self.played - 1 - game >= RECENT_GAMES:
+                    del self.last_played[recent_id]
+                self._refresh(recent_id)
+
+    def record_outcome(self, word_id: int, impostor_won: bool) -> None:
+        with self.lock:
+            self.civilian_wins[word_id] = self.civilian_wins[word_id] * OUTCOME_DECAY + (not impostor_won)
+            self.impostor_wins[word_id] = self.impostor_wins[word_id] * OUTCOME_DECAY + impostor_won
+            self._refresh(word_id)
+
+
+def _word_keys(index: WordIndex) -> Iterable[Tuple[str, str]]:
+    names, themes = index.theme_names, index.word_theme
+    return ((names[themes[i]], word) for i, word in enumerate(index.words))
+
+
+_weights: Dict[str, AdaptiveWeights] = {}
+_weights_lock = threading.Lock()
+
+
+def get_adaptive_weights(locale: str = DEFAULT_LOCALE) -> AdaptiveWeights:
+    """Pesos de un idioma, compartidos por el proceso; se rehacen si cambia el diccionario."""
+    index = get_word_index(locale)
+    weights = _weights.get(locale)
+    if weights is None or weights.index is not index:
+        with _weights_lock:
+            weights = _weights.get(locale)
+            if weights is None or weights.index is not index:
+                weights = AdaptiveWeights(index, weights)
+                _weights[locale] = weights
+    return weights
+
+
+def note_played(index: WordIndex, word_id: int, locale: str = DEFAULT_LOCALE) -> None:
+    """Apunta que se acaba de jugar la palabra `word_id` de `index` (la robada)."""
+    weights = get_adaptive_weights(locale)
+    if weights.index is not index:
+        # El diccionario se ha recargado entre robar la palabra y ahora
+        theme_name = index.theme_names[index.theme_of(word_id)]
+        word_id = weights.index.word_id(theme_name, index.words[word_id])
+        if word_id is None:
+            return
+    weights.note_played(word_id)
+
+
+def record_outcome(
+    theme_name: Optional[str], word: str, impostor_won: bool, locale: str = DEFAULT_LOCALE
+) -> None:
+    """Apunta quién ha ganado una ronda jugada con esa palabra."""
+    weights = get_adaptive_weights(locale)
+    word_id = weights.index.word_id(theme_name, word)
+    if word_id is not None:
+        weights.record_outcome(word_id, impostor_won)
@@ -0,0 +1,121 @@
+"""
+Baraja de palabras sin repetición para una sesión.
+
+Guarda sólo ids de palabras del índice global (4 bytes por palabra) y un
+cursor. La baraja se mezcla de forma perezosa: cada robo intercambia una
+carta pendiente al azar con la del cursor (Fisher–Yates incremental), así
+que robar es O(1) y al agotarse basta con devolver el cursor a 0.
+"""
+
+import random
+from array import array
+from typing import FrozenSet, Iterable, Optional
+
+from .index import WordIndex
+
+
+class WordDeck:
+    """Permutación perezosa de las palabras de las temáticas seleccionadas."""
+
+    __slots__ = ("index", "theme_ids", "ids", "cursor")
+
+    def __init__(self, index: WordIndex, theme_names: Iterable[str] = ()) -> None:
+        self.index = index
+        self.theme_ids: FrozenSet[int] = frozenset()
+        self.ids = array("I")  # ids[:cursor] ya han salido, ids[cursor:] pendientes
+        self.cursor = 0
+        self.sync(theme_names)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def remaining(self) -> int:
+        return len(self.ids) - self.cursor
+
+    def sync(self, theme_names: Iterable[str]) -> None:
+        """
+        Ajusta la baraja a una nueva selección de temáticas.
+
+        Las palabras de temáticas quitadas se eliminan y las de temáticas
+        nuevas se añaden como pendientes; lo ya jugado se conserva.
+        """
+        index = self.index
+        wanted = frozenset(
+            index.theme_ids[name] for name in theme_names if name in index.theme_ids
+        )
+        if wanted == self.theme_ids:
+            return
+
+        removed = self.theme_ids - wanted
+        added = wanted - self.theme_ids
+
+        if removed:
+            word_theme = index.word_theme
+            kept = array("I")
+            cursor = 0
+            for pos, word_id in enumerate(self.ids):
+                if word_theme[word_id] in removed:
+                    continue
+                kept.append(word_id)
+                if pos < self.cursor:
+                    cursor += 1
+            self.ids = kept
+            self.cursor = cursor
+
+        for theme_id in sorted(added):
+            start = index.theme_start[theme_id]
+            self.ids.extend(range(start, start + index.theme_size[theme_id]))
+
+        self.theme_ids = wanted
+
+    def rebase(self, index: WordIndex) -> "WordDeck":
+        """
+        Pasa la baraja a un índice nuevo (p. ej. tras recargar el diccionario)
+        sin olvidar qué palabras han salido ya en este ciclo.
+        """
+        old = self.index
+        played = {
+            (old.theme_names[old.word_theme[word_id]], old.words[word_id])
+            for word_id in self.ids[: self.cursor]
+        }
+        names = [old.theme_names[theme_id] for theme_id in self.theme_ids]
+
+        deck = WordDeck(index, names)
+        ids = deck.ids
+        cursor = 0
+        for pos, word_id in enumerate(ids):
+            if (index.theme_names[index.word_theme[word_id]], index.words[word_id]) in played:
+                ids[pos], ids[cursor] = ids[cursor], ids[pos]
+                cursor += 1
+        deck.cursor = cursor
+        return deck
+
+    def draw(self, rng=random) -> Optional[int]:
+        """Roba la siguiente palabra; al agotarse la baraja se vuelve a mezclar."""
+        ids = self.ids
+        n = len(ids)
+        if not n:
+            return None
+        if self.cursor >= n:
+            self.cursor = 0
+
+        pos = self.cursor
+        pick = rng.randrange(pos, n)
+        ids[pos], ids[pick] = ids[pick], ids[pos]
+        self.cursor = pos + 1
+        return ids[pos]
+
+
+def sync_deck(deck: Optional[WordDeck], index: WordIndex, theme_names: Iterable[str]) -> WordDeck:
+    """
+    Devuelve `deck` ajustada a `index` y a las temáticas dadas, creando una
+    baraja nueva si no había ninguna. Si el diccionario se ha recargado, la
+    baraja se pasa al índice nuevo conservando lo ya jugado.
+    """
+    if deck is None:
+        return WordDeck(index, theme_names)
+    if deck.index is not index:
+        deck = deck.rebase(index)
+    deck.sync(theme_names)
+    return deck
@@ -2,7 +2,8 @@
 Diccionarios de ejemplo para ImpostorApp.
 
 Puedes añadir más temáticas y palabras modificando este archivo
-o creando otros dentro de la carpeta `dictionaries/`.
+o creando ficheros JSON, CSV o TOML dentro de la carpeta `dictionaries/`
+(ver `loader.py`); estos se recargan en caliente sin reiniciar el servidor.
 """
 
 # Estructura:
@@ -379,3 +380,19 @@ THEMES = {
     ]
 
 }
+
+# Categoría y etiquetas de cada temática, para agruparlas y filtrarlas en
+# el menú (ver dictionaries/themes.py). Las temáticas sin entrada aquí
+# salen como "sin categoría".
+THEME_META = {
+    "🏙️ Ciudad":               {"category": "Cultura general", "tags": ("familiar",)},
+    "🦁 Animales":             {"category": "Naturaleza", "tags": ("familiar", "niños")},
+    "🍔 Comida":               {"category": "Cultura general", "tags": ("familiar", "niños")},
+    "📲 Tecnología":           {"category": "Cultura general", "tags": ("familiar",)},
+    "💁🏻‍♀️ Personas Famosas": {"category": "Ocio", "tags": ("personas",)},
+    "🍃 Naturaleza":           {"category": "Naturaleza", "tags": ("familiar", "niños")},
+    "⚽️ Deportes":             {"category": "Ocio", "tags": ("familiar",)},
+    "👑 Clash Royale":         {"category": "Ocio", "tags": ("videojuegos",)},
+    "🐬 Local":                {"category": "Del grupo", "tags": ("personas", "privada")},
+    "Ⓜ️ Manyanet":             {"category": "Del grupo", "tags": ("personas", "privada")},
+}
@@ -0,0 +1,201 @@
+"""
+Índice de muestreo precalculado sobre los diccionarios.
+
+La tabla plana de palabras se construye una sola vez por versión del
+diccionario (ver `loader.get_dictionary`) y los muestreadores se cachean
+por idioma, versión y conjunto de temáticas seleccionadas, así que
+empezar una partida no construye ninguna lista. Al rehacer un índice se
+vacía esa caché, para que no retenga el índice viejo.
+"""
+
+import random
+import threading
+from array import array
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from i18n import DEFAULT_LOCALE
+
+from .loader import get_dictionary
+
+# Modos de muestreo que puede elegir el anfitrión
+WEIGHTING_BY_THEME = "theme"  # temática al azar y luego palabra (comportamiento clásico)
+WEIGHTING_BY_WORD = "word"    # todas las palabras con la misma probabilidad
+
+
+class WordIndex:
+    """
+    Tabla plana con todas las palabras de todas las temáticas.
+
+    Las palabras de cada temática ocupan un tramo contiguo
+    [theme_start[t], theme_start[t] + theme_size[t]) de la tabla.
+    """
+
+    __slots__ = (
+        "version",
+        "theme_names",
+        "theme_ids",
+        "words",
+        "hints",
+        "word_theme",
+        "theme_start",
+        "theme_size",
+        "theme_meta",
+    )
+
+    def __init__(self, themes, version: int = 0, meta=None) -> None:
+        names = []
+        words = []
+        hints = []
+        word_theme = array("H")
+        starts = array("I")
+        sizes = array("I")
+
+        for theme_id, (name, entries) in enumerate(themes.items()):
+            names.append(name)
+            starts.append(len(words))
+            count = 0
+            for entry in entries or []:
+                words.append(entry.get("word", "PALABRA_DE_EJEMPLO"))
+                hints.append(entry.get("hint"))  # puede ser None
+                word_theme.append(theme_id)
+                count += 1
+            sizes.append(count)
+
+        self.version = version
+        self.theme_names: Tuple[str, ...] = tuple(names)
+        self.theme_ids = {name: i for i, name in enumerate(names)}
+        self.words: Tuple[str, ...] = tuple(words)
+        self.hints: Tuple[Optional[str], ...] = tuple(hints)
+        self.word_theme = word_theme
+        self.theme_start = starts
+        self.theme_size = sizes
+        self.theme_meta = meta or {}  # categoría y etiquetas (ver dictionaries.themes)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def theme_of(self, word_id: int) -> int:
+        """Devuelve el id de la temática a la que pertenece una palabra."""
+        return self.word_theme[word_id]
+
+    def word_id(
+        self, theme_name: Optional[str], word: str, guess: Optional[int] = None
+    ) -> Optional[int]:
+        """
+        Id de una palabra por temática y texto. Si `guess` ya es ese id (el
+        que se guardó al robarla) se devuelve sin buscar; si no, recorre
+        sólo su temática. Sirve para datos que deben sobrevivir a una
+        recarga del índice.
+        """
+        theme_id = self.theme_ids.get(theme_name)
+        if theme_id is None:
+            return None
+        start = self.theme_start[theme_id]
+        end = start + self.theme_size[theme_id]
+        if guess is not None and start <= guess < end and self.words[guess] == word:
+            return guess
+        for word_id in range(start, end):
+            if self.words[word_id] == word:
+                return word_id
+        return None
+
+
+class ThemeSampler:
+    """
+    Muestreador O(1) para un conjunto fijo de temáticas.
+
+    Usa el método de alias (Vose) sobre las temáticas, ponderadas por su
+    número de palabras, para el modo "por palabra"; el modo "por temática"
+    elige una temática uniforme. En ambos casos la palabra dentro de la
+    temática se elige con un único randrange sobre su tramo.
+    """
+
+    __slots__ = ("index", "theme_ids", "starts", "sizes", "total", "_prob", "_alias")
+
+    def __init__(self, index: WordIndex, theme_ids: Iterable[int]) -> None:
+        ids = array("I", sorted(t for t in theme_ids if index.theme_size[t] > 0))
+        self.index = index
+        self.theme_ids = ids
+        self.starts = array("I", (index.theme_start[t] for t in ids))
+        self.sizes = array("I", (index.theme_size[t] for t in ids))
+        self.total = sum(self.sizes)
+        self._prob, self._alias = _build_alias(self.sizes)
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def alias_tables(self) -> Tuple[array, array]:
+        """Tablas (probabilidad, alias) del modo por palabra, p. ej. para simularlo."""
+        return self._prob, self._alias
+
+    def draw(self, weighting: str = WEIGHTING_BY_THEME, rng=random) -> int:
+        """Devuelve el id global de una palabra elegida al azar."""
+        k = len(self.sizes)
+        slot = rng.randrange(k)
+        if weighting == WEIGHTING_BY_WORD and rng.random() >= self._prob[slot]:
+            slot = self._alias[slot]
+        return self.starts[slot] + rng.randrange(self.sizes[slot])
+
+
+def _build_alias(weights) -> Tuple[array, array]:
+    """Tablas de probabilidad y alias de Vose para unos pesos enteros."""
+    n = len(weights)
+    prob = array("d", bytes(8 * n))
+    alias = array("I", bytes(4 * n))
+    total = sum(weights)
+    if not n or not total:
+        return prob, alias
+
+    scaled = [w * n / total for w in weights]
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] = (scaled[g] + scaled[s]) - 1.0
+        (small if scaled[g] < 1.0 else large).append(g)
+
+    # Lo que queda tiene probabilidad 1 (salvo errores de redondeo)
+    for i in large + small:
+        prob[i] = 1.0
+        alias[i] = i
+
+    return prob, alias
+
+
+_indexes: Dict[str, WordIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_word_index(locale: str = DEFAULT_LOCALE) -> WordIndex:
+    """Índice de un idioma, compartido por todas las sesiones; se rehace si cambia la versión."""
+    dictionary = get_dictionary(locale)
+    index = _indexes.get(locale)
+    if index is None or index.version != dictionary.version:
+        with _indexes_lock:
+            # Otra sesión puede haberlo rehecho mientras esperábamos
+            index = _indexes.get(locale)
+            if index is None or index.version != dictionary.version:
+                index = WordIndex(dictionary.themes, dictionary.version, dictionary.meta)
+                _indexes[locale] = index
+                # Cada muestreador apunta a su índice: fuera los del viejo
+                _sampler_for.cache_clear()
+    return index
+
+
+@lru_cache(maxsize=256)
+def _sampler_for(locale: str, version: int, themes: FrozenSet[str]) -> ThemeSampler:
+    # El índice no forma parte de la clave (ver get_word_index)
+    index = _indexes[locale]
+    ids = [index.theme_ids[name] for name in themes if name in index.theme_ids]
+    return ThemeSampler(index, ids)
+
+
+def get_theme_sampler(selected_themes: Iterable[str], locale: str = DEFAULT_LOCALE) -> ThemeSampler:
+    """Muestreador cacheado para un conjunto de temáticas (el orden da igual)."""
+    index = get_word_index(locale)
+    return _sampler_for(locale, index.version, frozenset(selected_themes))
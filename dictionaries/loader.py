@@ -0,0 +1,307 @@
+"""
+Carga de diccionarios desde disco con recarga en caliente.
+
+Cada idioma tiene su propio diccionario, que se carga la primera vez que
+una sesión lo pide y luego comparten todas. Se leen los ficheros de
+temáticas de `dictionaries/<idioma>/`; el español (idioma por defecto)
+incluye además `default_words.THEMES` y los ficheros sueltos de
+`dictionaries/`, como antes de haber idiomas. Formatos:
+
+- JSON: {"Temática": [{"word": "...", "hint": "..."}, ...], ...}
+- CSV:  cabecera `theme,word,hint` (la pista es opcional)
+- TOML: una tabla por temática, p. ej. [["🦁 Animales"]] word = "..." hint = "..."
+
+Cada temática puede llevar además categoría y etiquetas (ver
+`dictionaries.themes`): en JSON, con una clave `"_meta"`
+({"Temática": {"category": "...", "tags": ["...", ...]}}); en CSV, con
+las columnas opcionales `category` y `tags` (separadas por `;`).
+
+Todo se parsea una sola vez a una estructura inmutable compartida por
+todas las sesiones. Cada cierto tiempo se comprueba el mtime de los
+ficheros y sólo se vuelven a leer los que han cambiado; si su contenido
+(hash) cambia de verdad, se incrementa la versión del diccionario y todas
+las cachés derivadas (nombres de temáticas, índices de muestreo...) se
+invalidan al ver la versión nueva.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from i18n import DEFAULT_LOCALE
+
+logger = logging.getLogger(__name__)
+
+DICTIONARY_DIR = Path(__file__).resolve().parent
+SUPPORTED_SUFFIXES = (".json", ".csv", ".toml")
+
+# Cada cuántos segundos, como mucho, se vuelve a mirar el disco
+RESCAN_INTERVAL = 2.0
+
+Themes = Mapping[str, Tuple[Mapping[str, Optional[str]], ...]]
+
+
+ThemeMeta = Mapping[str, Mapping[str, object]]
+
+META_KEY = "_meta"
+
+_NO_META: ThemeMeta = MappingProxyType({})
+
+
+class Dictionary(NamedTuple):
+    """Instantánea inmutable del diccionario con su número de versión."""
+
+    version: int
+    themes: Themes
+    meta: ThemeMeta = _NO_META  # temática -> {"category": str, "tags": (str, ...)}
+
+
+class _FileEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    themes: Dict[str, List[Dict[str, Optional[str]]]]
+    meta: Dict[str, Dict[str, object]]
+
+
+class _LocaleState:
+    """Ficheros leídos y última instantánea del diccionario de un idioma."""
+
+    __slots__ = ("locale", "lock", "files", "current", "last_scan")
+
+    def __init__(self, locale: str) -> None:
+        self.locale = locale
+        self.lock = threading.Lock()
+        self.files: Dict[Path, _FileEntry] = {}
+        self.current: Optional[Dictionary] = None
+        self.last_scan = 0.0
+
+
+_states: Dict[str, _LocaleState] = {}
+_states_lock = threading.Lock()
+
+
+def _state_for(locale: str) -> _LocaleState:
+    state = _states.get(locale)
+    if state is None:
+        if not locale.isalpha():
+            raise ValueError(f"Idioma no válido: {locale!r}")
+        with _states_lock:
+            state = _states.setdefault(locale, _LocaleState(locale))
+    return state
+
+
+def _entry(word, hint=None) -> Dict[str, Optional[str]]:
+    word = str(word).strip()
+    hint = str(hint).strip() if hint not in (None, "") else None
+    return {"word": word, "hint": hint or None}
+
+
+def _meta_entry(category=None, tags=()) -> Dict[str, object]:
+    if isinstance(tags, str):
+        tags = tags.split(";")
+    category = str(category).strip() if category not in (None, "") else None
+    return {
+        "category": category or None,
+        "tags": tuple(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip())),
+    }
+
+
+def _parse_json(data: bytes):
+    raw = json.loads(data.decode("utf-8"))
+    meta = {
+        str(name): _meta_entry(item.get("category"), item.get("tags") or ())
+        for name, item in raw.pop(META_KEY, {}).items()
+    }
+    themes = {}
+    for name, entries in raw.items():
+        parsed = []
+        for item in entries:
+            if isinstance(item, str):
+                parsed.append(_entry(item))
+            elif isinstance(item, (list, tuple)):
+                parsed.append(_entry(*item[:2]))
+            else:
+                parsed.append(_entry(item["word"], item.get("hint")))
+        themes[str(name)] = parsed
+    return themes, meta
+
+
+def _parse_csv(data: bytes):
+    themes: Dict[str, list] = {}
+    meta: Dict[str, Dict[str, object]] = {}
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    for row in reader:
+        name = (row.get("theme") or "").strip()
+        word = (row.get("word") or "").strip()
+        if not name or not word:
+            continue
+        themes.setdefault(name, []).append(_entry(word, row.get("hint")))
+        # La categoría y las etiquetas basta con ponerlas en una fila
+        if name not in meta and (row.get("category") or row.get("tags")):
+            meta[name] = _meta_entry(row.get("category"), row.get("tags") or ())
+    return themes, meta
+
+
+def _parse_toml(data: bytes):
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise RuntimeError("Hace falta Python 3.11+ (o el paquete tomli) para leer TOML")
+    raw = tomllib.loads(data.decode("utf-8"))
+    themes = {
+        str(name): [_entry(item["word"], item.get("hint")) for item in entries]
+        for name, entries in raw.items()
+    }
+    return themes, {}
+
+
+_PARSERS = {
+    ".json": _parse_json,
+    ".csv": _parse_csv,
+    ".toml": _parse_toml,
+}
+
+
+def read_theme_file(path: Path) -> Dict[str, List[Dict[str, Optional[str]]]]:
+    """Lee un fichero de temáticas (JSON, CSV o TOML) sin pasar por la caché."""
+    path = Path(path)
+    parser = _PARSERS.get(path.suffix)
+    if parser is None:
+        raise ValueError(f"Formato no soportado: {path.suffix} (usa {', '.join(SUPPORTED_SUFFIXES)})")
+    themes, _ = parser(path.read_bytes())
+    return themes
+
+
+def _freeze(themes_list) -> Themes:
+    """Une las temáticas de todas las fuentes en una estructura de sólo lectura."""
+    merged: Dict[str, list] = {}
+    for themes in themes_list:
+        for name, entries in themes.items():
+            merged.setdefault(name, []).extend(entries)
+    return MappingProxyType(
+        {
+            name: tuple(MappingProxyType(dict(entry)) for entry in entries)
+            for name, entries in merged.items()
+        }
+    )
+
+
+def _freeze_meta(meta_list) -> ThemeMeta:
+    """Une la categoría y etiquetas de todas las fuentes (las etiquetas se suman)."""
+    merged: Dict[str, Dict[str, object]] = {}
+    for meta in meta_list:
+        for name, item in meta.items():
+            current = merged.setdefault(name, {"category": None, "tags": ()})
+            current["category"] = current["category"] or item["category"]
+            current["tags"] = tuple(dict.fromkeys(current["tags"] + item["tags"]))
+    return MappingProxyType({name: MappingProxyType(item) for name, item in merged.items()})
+
+
+def theme_files(locale: str = DEFAULT_LOCALE) -> List[Path]:
+    """Ficheros de temáticas de un idioma."""
+    directories = [DICTIONARY_DIR / locale]
+    if locale == DEFAULT_LOCALE:
+        directories.insert(0, DICTIONARY_DIR)
+    return sorted(
+        path
+        for directory in directories
+        if directory.is_dir()
+        for path in directory.iterdir()
+        if path.suffix in SUPPORTED_SUFFIXES and path.is_file()
+    )
+
+
+def _rescan(state: _LocaleState) -> bool:
+    """Relee los ficheros modificados. Devuelve True si algún contenido cambió."""
+    files = state.files
+    changed = False
+    seen = set()
+
+    for path in theme_files(state.locale):
+        seen.add(path)
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+
+        old = files.get(path)
+        if old is not None and (old.mtime_ns, old.size) == (stat.st_mtime_ns, stat.st_size):
+            continue
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        if old is not None and old.digest == digest:
+            # Se ha tocado el fichero pero el contenido es el mismo
+            files[path] = old._replace(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            continue
+
+        try:
+            themes, meta = _PARSERS[path.suffix](data)
+        except Exception:
+            # Un fichero roto no debe tumbar las partidas en curso:
+            # seguimos con la última versión buena que tuviéramos.
+            logger.exception("No se pudo leer el diccionario %s", path.name)
+            continue
+
+        files[path] = _FileEntry(stat.st_mtime_ns, stat.st_size, digest, themes, meta)
+        changed = True
+
+    for path in list(files):
+        if path not in seen:
+            del files[path]
+            changed = True
+
+    return changed
+
+
+def get_dictionary(locale: str = DEFAULT_LOCALE, force: bool = False) -> Dictionary:
+    """
+    Devuelve la instantánea actual del diccionario de un idioma.
+
+    Como mucho una vez cada RESCAN_INTERVAL segundos mira si algún fichero
+    ha cambiado en disco; el resto de llamadas sólo leen una variable.
+    """
+    state = _state_for(locale)
+    now = time.monotonic()
+    current = state.current
+    if current is not None and not force and now - state.last_scan < RESCAN_INTERVAL:
+        return current
+
+    with state.lock:
+        if state.current is not None and not force and now - state.last_scan < RESCAN_INTERVAL:
+            return state.current
+        state.last_scan = now
+        if _rescan(state) or state.current is None:
+            entries = [entry for _, entry in sorted(state.files.items())]
+            sources = [entry.themes for entry in entries]
+            meta = [entry.meta for entry in entries]
+            if locale == DEFAULT_LOCALE:
+                # El diccionario por defecto se importa aquí, en el primer uso
+                from .default_words import THEME_META as DEFAULT_META
+                from .default_words import THEMES as DEFAULT_THEMES
+
+                sources.insert(0, DEFAULT_THEMES)
+                meta.insert(0, {name: _meta_entry(**item) for name, item in DEFAULT_META.items()})
+            version = 0 if state.current is None else state.current.version + 1
+            state.current = Dictionary(version, _freeze(sources), _freeze_meta(meta))
+        return state.current
+
+
+def get_dictionary_version(locale: str = DEFAULT_LOCALE) -> int:
+    """Versión actual del diccionario (sube cada vez que cambia el contenido)."""
+    return get_dictionary(locale).version
@@ -0,0 +1,266 @@
+"""
+Índice de palabras parecidas, para el modo infiltrado.
+
+En el modo infiltrado los impostores no reciben una pista sino otra
+palabra de la misma temática, parecida a la de los civiles. Para cada
+palabra se precalculan sus K vecinas más cercanas dentro de su temática,
+por similitud coseno de trigramas de caracteres de la palabra y, con
+menos peso, de su pista (sin red ni modelos externos, sólo NumPy).
+
+Las vecinas se guardan en disco por temática, con el hash de su contenido
+como clave: al cambiar un fichero de diccionario sólo se recalculan las
+temáticas que han cambiado. En memoria queda una matriz n x K de ids, y
+el reparto pasa el id de la palabra que acaba de robar, así que buscar la
+del infiltrado al empezar la partida es leer una fila (sin buscar la
+palabra). Se puede precalcular todo antes de desplegar:
+
+    python -m dictionaries.similarity            # todos los idiomas
+    python -m dictionaries.similarity --locale en
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import random
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from i18n import DEFAULT_LOCALE, LOCALES
+from textnorm import fold_text
+
+from .index import WordIndex, get_word_index
+from .loader import DICTIONARY_DIR
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_DIR_ENV = "IMPOSTOR_SIMILARITY_DIR"
+NEIGHBOURS = 8           # vecinas guardadas por palabra
+DECOY_CHOICES = 3        # el infiltrado recibe una de las 3 más parecidas
+HASH_BUCKETS = 4096      # dimensión de los vectores de trigramas
+HINT_WEIGHT = 0.5        # peso de los trigramas de la pista frente a los de la palabra
+
+# Cambia si cambia cómo se calcula la similitud: invalida la caché entera
+_CACHE_VERSION = "v1"
+
+
+def _trigrams(text: str) -> List[str]:
+    padded = f"  {fold_text(text)} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _theme_vectors(words, hints):
+    """Vectores normalizados (trigramas con hashing) de las palabras de una temática."""
+    import numpy as np
+
+    vectors = np.zeros((len(words), HASH_BUCKETS), dtype=np.float32)
+    for row, (word, hint) in enumerate(zip(words, hints)):
+        for gram in _trigrams(word):
+            vectors[row, zlib.crc32(gram.encode("utf-8")) % HASH_BUCKETS] += 1.0
+        for gram in _trigrams(hint or ""):
+            vectors[row, zlib.crc32(gram.encode("utf-8")) % HASH_BUCKETS] += HINT_WEIGHT
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def theme_neighbours(words, hints, k: int = NEIGHBOURS):
+    """
+    Matriz (len(words), k) con las posiciones de las k palabras más
+    parecidas de cada una dentro de la temática (-1 si no hay tantas).
+    """
+    import numpy as np
+
+    m = len(words)
+    result = np.full((m, k), -1, dtype=np.int16 if m <= 0x7FFF else np.int32)
+    if m < 2:
+        return result
+
+    vectors = _theme_vectors(words, hints)
+    similarity = vectors @ vectors.T
+    # Ni ella misma ni la misma palabra escrita de otra forma
+    np.fill_diagonal(similarity, -np.inf)
+    groups: Dict[str, List[int]] = {}
+    for i, word in enumerate(words):
+        groups.setdefault(fold_text(word), []).append(i)
+    for group in groups.values():
+        if len(group) > 1:
+            similarity[np.ix_(group, group)] = -np.inf
+
+    take = min(k, m - 1)
+    # Orden estable: con empates gana la que aparece antes en el diccionario
+    order = np.argsort(-similarity, axis=1, kind="stable")[:, :take]
+    valid = np.take_along_axis(similarity, order, axis=1) > -np.inf
+    result[:, :take] = np.where(valid, order, -1)
+    return result
+
+
+def _theme_digest(words, hints) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_CACHE_VERSION}:{NEIGHBOURS}:{HASH_BUCKETS}:{HINT_WEIGHT}".encode())
+    for word, hint in zip(words, hints):
+        h.update(word.encode("utf-8"))
+        h.update(b"\x00")
+        h.update((hint or "").encode("utf-8"))
+        h.update(b"\x01")
+    return h.hexdigest()
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get(SIMILARITY_DIR_ENV) or DICTIONARY_DIR / ".cache")
+
+
+def _cache_path(locale: str) -> Path:
+    return cache_dir() / f"similarity-{locale}.npz"
+
+
+def _load_cache(path: Path) -> Dict[str, object]:
+    import numpy as np
+
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        logger.exception("Caché de similitud ilegible: %s", path)
+        return {}
+
+
+def _save_cache(path: Path, themes: Dict[str, object]) -> None:
+    """Escritura atómica (fichero temporal + os.replace), como los checkpoints."""
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **themes)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class SimilarityIndex:
+    """Vecinas de todas las palabras de un índice: una matriz n x K de ids globales."""
+
+    __slots__ = ("index", "neighbours", "rebuilt_themes")
+
+    def __init__(self, index: WordIndex, neighbours, rebuilt_themes: int = 0) -> None:
+        self.index = index
+        self.neighbours = neighbours
+        self.rebuilt_themes = rebuilt_themes
+
+    def similar(self, word_id: int) -> Tuple[int, ...]:
+        """Ids de las palabras más parecidas, de más a menos (una fila, O(k))."""
+        return tuple(int(i) for i in self.neighbours[word_id] if i >= 0)
+
+    def pick_decoy(self, word_id: int, rng=random) -> Optional[int]:
+        candidates = self.similar(word_id)[:DECOY_CHOICES]
+        if not candidates:
+            return None
+        return candidates[rng.randrange(len(candidates))]
+
+
+def build_similarity_index(index: WordIndex, locale: str, save: bool = True) -> SimilarityIndex:
+    """
+    Construye el índice de un diccionario reutilizando la caché de disco:
+    sólo se calculan las temáticas cuyo contenido no está en ella.
+    """
+    import numpy as np
+
+    path = _cache_path(locale)
+    cached = _load_cache(path)
+    neighbours = np.full((len(index), NEIGHBOURS), -1, dtype=np.int32)
+    kept: Dict[str, object] = {}
+    rebuilt = 0
+
+    for theme_id in range(len(index.theme_names)):
+        start, size = index.theme_start[theme_id], index.theme_size[theme_id]
+        words = index.words[start:start + size]
+        hints = index.hints[start:start + size]
+        digest = _theme_digest(words, hints)
+        local = cached.get(digest)
+        if local is None or local.shape != (size, NEIGHBOURS):
+            local = theme_neighbours(words, hints)
+            rebuilt += 1
+        kept[digest] = local
+        block = local.astype(np.int32)
+        neighbours[start:start + size] = np.where(block >= 0, block + start, -1)
+
+    # Sólo se escribe si algo ha cambiado (temáticas nuevas o borradas)
+    if save and (rebuilt or kept.keys() != cached.keys()):
+        try:
+            _save_cache(path, kept)
+        except OSError:
+            # Sin caché en disco funciona igual; la próxima vez se recalcula
+            logger.exception("No se pudo guardar la caché de similitud en %s", path)
+
+    return SimilarityIndex(index, neighbours, rebuilt)
+
+
+_indexes: Dict[str, SimilarityIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_similarity_index(locale: str = DEFAULT_LOCALE) -> SimilarityIndex:
+    """Índice de un idioma, compartido por el proceso; se rehace si cambia el diccionario."""
+    index = get_word_index(locale)
+    similarity = _indexes.get(locale)
+    if similarity is None or similarity.index is not index:
+        with _indexes_lock:
+            similarity = _indexes.get(locale)
+            if similarity is None or similarity.index is not index:
+                similarity = build_similarity_index(index, locale)
+                _indexes[locale] = similarity
+    return similarity
+
+
+def pick_decoy_word(
+    index: WordIndex, word_id: int, rng=random, locale: str = DEFAULT_LOCALE
+) -> Optional[str]:
+    """
+    Palabra parecida a la `word_id` de `index` (la que se acaba de robar),
+    de su misma temática, o None si no hay ninguna.
+    """
+    similarity = get_similarity_index(locale)
+    if similarity.index is not index:
+        # El diccionario se ha recargado entre robar la palabra y ahora
+        theme_name = index.theme_names[index.theme_of(word_id)]
+        word_id = similarity.index.word_id(theme_name, index.words[word_id])
+        if word_id is None:
+            return None
+    decoy = similarity.pick_decoy(word_id, rng)
+    return None if decoy is None else similarity.index.words[decoy]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Precalcula el índice de palabras parecidas")
+    parser.add_argument("--locale", choices=sorted(LOCALES), help="por defecto, todos")
+    parser.add_argument("--show", metavar="PALABRA", help="muestra las vecinas de una palabra")
+    args = parser.parse_args(argv)
+
+    for locale in [args.locale] if args.locale else list(LOCALES):
+        index = get_word_index(locale)
+        similarity = build_similarity_index(index, locale)
+        print(
+            f"{locale}: {len(index)} palabras, {len(index.theme_names)} temáticas, "
+            f"{similarity.rebuilt_themes} recalculadas -> {_cache_path(locale)}"
+        )
+        if args.show:
+            key = fold_text(args.show)
+            for word_id, word in enumerate(index.words):
+                if fold_text(word) == key:
+                    near = ", ".join(index.words[i] for i in similarity.similar(word_id))
+                    print(f"  {word}: {near}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Metadatos de las temáticas para el selector del menú.
+
+Para cada temática se precalcula una vez por versión del diccionario su
+número de palabras, cuántas tienen pista, su categoría y sus etiquetas,
+junto con los nombres normalizados para buscar (`textnorm.fold_text`).
+Los reruns sólo filtran tuplas ya hechas: con cientos de temáticas, el
+menú no recorre las palabras ni vuelve a construir listas de nombres.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from i18n import DEFAULT_LOCALE
+from textnorm import fold_text
+
+from .index import WordIndex, get_word_index
+
+
+class ThemeInfo(NamedTuple):
+    name: str
+    words: int
+    hinted: int                # palabras con una pista que tenga letras
+    category: Optional[str]
+    tags: Tuple[str, ...]
+
+    @property
+    def hint_coverage(self) -> float:
+        return self.hinted / self.words if self.words else 0.0
+
+
+class ThemeCatalog:
+    """Temáticas de una versión del diccionario, ordenadas por categoría y nombre."""
+
+    __slots__ = ("version", "themes", "by_name", "categories", "tags", "_search_keys")
+
+    def __init__(self, index: WordIndex) -> None:
+        infos = []
+        for theme_id, name in enumerate(index.theme_names):
+            start, size = index.theme_start[theme_id], index.theme_size[theme_id]
+            hinted = sum(
+                1
+                for hint in index.hints[start:start + size]
+                if hint and any(c.isalnum() for c in hint)
+            )
+            item = index.theme_meta.get(name) or {}
+            infos.append(
+                ThemeInfo(name, size, hinted, item.get("category"), tuple(item.get("tags", ())))
+            )
+        # Sin categoría al final
+        infos.sort(key=lambda info: (info.category is None, info.category or "", info.name))
+
+        self.version = index.version
+        self.themes: Tuple[ThemeInfo, ...] = tuple(infos)
+        self.by_name: Dict[str, ThemeInfo] = {info.name: info for info in infos}
+        self.categories: Tuple[str, ...] = tuple(
+            dict.fromkeys(info.category for info in infos if info.category)
+        )
+        self.tags: Tuple[str, ...] = tuple(sorted({tag for info in infos for tag in info.tags}))
+        # Texto en el que se busca: nombre, categoría y etiquetas, normalizados
+        self._search_keys: Tuple[str, ...] = tuple(
+            fold_text(" ".join((info.name, info.category or "") + info.tags)) for info in infos
+        )
+
+    def __len__(self) -> int:
+        return len(self.themes)
+
+    def filter(
+        self,
+        query: str = "",
+        category: Optional[str] = None,
+        tag: Optional[str] = None,
+    ) -> Tuple[str, ...]:
+        """Nombres de las temáticas que cumplen los filtros (vacíos = todas)."""
+        words = fold_text(query).split()
+        return tuple(
+            info.name
+            for info, key in zip(self.themes, self._search_keys)
+            if (category is None or info.category == category)
+            and (tag is None or tag in info.tags)
+            and all(word in key for word in words)
+        )
+
+    def with_tag(self, tag: str) -> Tuple[str, ...]:
+        return tuple(info.name for info in self.themes if tag in info.tags)
+
+    def known(self, names: Iterable[str]) -> list:
+        """Los nombres que existen en esta versión (descarta temáticas borradas)."""
+        return [name for name in names if name in self.by_name]
+
+
+@lru_cache(maxsize=8)
+def _catalog_for(index: WordIndex) -> ThemeCatalog:
+    return ThemeCatalog(index)
+
+
+def get_theme_catalog(locale: str = DEFAULT_LOCALE) -> ThemeCatalog:
+    """Catálogo cacheado de la versión actual del diccionario de un idioma."""
+    return _catalog_for(get_word_index(locale))
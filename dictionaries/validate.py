@@ -0,0 +1,253 @@
+"""
+Validación y normalización de diccionarios (herramienta offline).
+
+Revisa el diccionario por defecto y los ficheros de `dictionaries/` (o
+los que se pasen por línea de comandos) y avisa de:
+
+- palabras repetidas, dentro de una temática o entre temáticas, sin
+  distinguir mayúsculas ni tildes (y de las que sólo cambian en eso);
+- casi repetidas: a distancia de edición 1 ("Pinguino" / "Pingüinos");
+- pistas que faltan, que son la propia palabra o que no tienen letras
+  (sólo emojis o signos);
+- espacios de más y temáticas demasiado grandes.
+
+Está pensada para pasar en cada cambio de contenido: las repetidas se
+buscan con un índice hash de claves normalizadas y las casi repetidas
+con un índice de borrados (cada palabra se indexa por las variantes que
+resultan de quitarle una letra), así que no se compara todo con todo.
+100k palabras se revisan en unos segundos. Uso:
+
+    python -m dictionaries.validate
+    python -m dictionaries.validate --locale en
+    python -m dictionaries.validate mis_palabras.csv --format json
+    python -m dictionaries.validate --normalize limpio.json
+
+Sale con código 1 si hay errores (con --strict, también si hay avisos).
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from i18n import DEFAULT_LOCALE, LOCALES
+from textnorm import fold_text
+
+from .loader import read_theme_file, theme_files
+
+ERROR = "error"
+WARNING = "aviso"
+
+DEFAULT_MAX_THEME_SIZE = 2000
+NEAR_MIN_LENGTH = 5  # por debajo, distancia 1 da demasiados falsos positivos ("Oso" / "Ojo")
+
+
+class Entry(NamedTuple):
+    source: str
+    theme: str
+    word: str
+    hint: Optional[str]
+
+
+class Issue(NamedTuple):
+    level: str
+    kind: str
+    source: str
+    theme: str
+    word: str
+    detail: str
+
+
+def iter_entries(
+    paths: Optional[Iterable[Path]] = None,
+    include_default: bool = True,
+    locale: str = DEFAULT_LOCALE,
+) -> Iterator[Entry]:
+    """Entradas de las fuentes indicadas (por defecto, todas las que carga la app en ese idioma)."""
+    if include_default and locale == DEFAULT_LOCALE:
+        from .default_words import THEMES
+
+        for theme, entries in THEMES.items():
+            for item in entries:
+                yield Entry("default_words.py", theme, item["word"], item.get("hint"))
+
+    for path in theme_files(locale) if paths is None else paths:
+        for theme, entries in read_theme_file(path).items():
+            for item in entries:
+                yield Entry(Path(path).name, theme, item["word"], item.get("hint"))
+
+
+def _has_letters(text: str) -> bool:
+    return any(c.isalnum() for c in text)
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True si a y b están a distancia de Levenshtein <= 1."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+def _entry_checks(entry: Entry) -> Iterator[Issue]:
+    word, hint = entry.word, entry.hint
+    where = entry.source, entry.theme, word
+
+    if not word.strip():
+        yield Issue(ERROR, "palabra vacía", *where, "")
+        return
+    if word != " ".join(word.split()):
+        yield Issue(WARNING, "espacios", *where, "espacios al principio, al final o dobles")
+
+    if hint is None or not hint.strip():
+        yield Issue(WARNING, "sin pista", *where, "los impostores no tendrán pista")
+    elif not _has_letters(hint):
+        yield Issue(WARNING, "pista sin letras", *where, f"pista {hint!r}")
+    elif fold_text(hint) == fold_text(word):
+        yield Issue(ERROR, "pista = palabra", *where, f"pista {hint!r}")
+    elif fold_text(word) in fold_text(hint).split():
+        yield Issue(WARNING, "pista contiene la palabra", *where, f"pista {hint!r}")
+
+
+def validate(entries: Iterable[Entry], max_theme_size: int = DEFAULT_MAX_THEME_SIZE) -> List[Issue]:
+    """Revisa las entradas y devuelve la lista de problemas encontrados."""
+    issues: List[Issue] = []
+    by_key: Dict[str, List[Entry]] = defaultdict(list)
+    theme_sizes: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    for entry in entries:
+        issues.extend(_entry_checks(entry))
+        theme_sizes[entry.source, entry.theme] += 1
+        if entry.word.strip():
+            by_key[fold_text(entry.word)].append(entry)
+
+    for (source, theme), size in theme_sizes.items():
+        if size > max_theme_size:
+            issues.append(
+                Issue(WARNING, "temática enorme", source, theme, "", f"{size} palabras (máx. {max_theme_size})")
+            )
+
+    # Repetidas exactas (tras normalizar)
+    for key, group in by_key.items():
+        if len(group) < 2:
+            continue
+        first = group[0]
+        spellings = sorted({e.word for e in group})
+        for other in group[1:]:
+            same_theme = (other.source, other.theme) == (first.source, first.theme)
+            level = ERROR if same_theme else WARNING
+            kind = "repetida en la temática" if same_theme else "repetida en otra temática"
+            detail = f"también en {first.theme} ({first.source})"
+            if len(spellings) > 1:
+                detail += f"; grafías distintas: {', '.join(spellings)}"
+            issues.append(Issue(level, kind, other.source, other.theme, other.word, detail))
+
+    # Casi repetidas: índice de borrados sobre las claves distintas. Cada
+    # variante apunta a la primera clave que la generó; sólo las variantes
+    # compartidas (pocas) guardan la lista completa.
+    owner: Dict[str, str] = {}
+    shared: Dict[str, List[str]] = {}
+    for key in by_key:
+        if len(key) < NEAR_MIN_LENGTH:
+            continue
+        variants = {key[:i] + key[i + 1:] for i in range(len(key))}
+        variants.add(key)
+        for variant in variants:
+            other = owner.setdefault(variant, key)
+            if other is not key:
+                group = shared.get(variant)
+                if group is None:
+                    shared[variant] = [other, key]
+                else:
+                    group.append(key)
+    del owner
+
+    reported = set()
+    for keys in shared.values():
+        for i, a in enumerate(keys):
+            for b in keys[i + 1:]:
+                pair = (a, b) if a < b else (b, a)
+                if pair in reported or not _within_one_edit(a, b):
+                    continue
+                reported.add(pair)
+                ea, eb = by_key[pair[0]][0], by_key[pair[1]][0]
+                issues.append(
+                    Issue(
+                        WARNING,
+                        "casi repetida",
+                        eb.source,
+                        eb.theme,
+                        eb.word,
+                        f"se parece a {ea.word!r} ({ea.theme}, {ea.source})",
+                    )
+                )
+    return issues
+
+
+def normalize(entries: Iterable[Entry]) -> Dict[str, List[Dict[str, Optional[str]]]]:
+    """
+    Versión limpia del diccionario, en el formato JSON que lee `loader`:
+    espacios normalizados, sin repetidas dentro de cada temática y sin
+    pistas vacías, sin letras o iguales a la palabra.
+    """
+    themes: Dict[str, List[Dict[str, Optional[str]]]] = {}
+    seen = set()
+    for entry in entries:
+        word = " ".join(entry.word.split())
+        if not word:
+            continue
+        theme = " ".join(entry.theme.split())
+        key = (theme, fold_text(word))
+        if key in seen:
+            continue
+        seen.add(key)
+        hint = " ".join((entry.hint or "").split()) or None
+        if hint is not None and (not _has_letters(hint) or fold_text(hint) == fold_text(word)):
+            hint = None
+        themes.setdefault(theme, []).append({"word": word, "hint": hint})
+    return themes
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Valida los diccionarios de ImpostorApp")
+    parser.add_argument("files", nargs="*", type=Path, help="ficheros a revisar (por defecto, todos)")
+    parser.add_argument("--no-default", action="store_true", help="no incluir default_words.py")
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=DEFAULT_LOCALE)
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    parser.add_argument("--max-theme-size", type=int, default=DEFAULT_MAX_THEME_SIZE)
+    parser.add_argument("--strict", action="store_true", help="los avisos también hacen fallar")
+    parser.add_argument("--normalize", metavar="SALIDA", help="escribe una versión limpia en JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.files or None
+    include_default = not args.no_default and not args.files
+    entries = list(iter_entries(paths, include_default, args.locale))
+    issues = validate(entries, args.max_theme_size)
+
+    if args.normalize:
+        with open(args.normalize, "w", encoding="utf-8") as out:
+            json.dump(normalize(entries), out, ensure_ascii=False, indent=2)
+
+    errors = sum(issue.level == ERROR for issue in issues)
+    warnings = len(issues) - errors
+    if args.format == "json":
+        json.dump([issue._asdict() for issue in issues], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for issue in sorted(issues, key=lambda i: (i.level != ERROR, i.kind, i.source, i.theme, i.word)):
+            print(f"[{issue.level}] {issue.kind}: {issue.theme} / {issue.word} ({issue.source}) {issue.detail}")
+        print(f"{len(entries)} palabras revisadas: {errors} errores, {warnings} avisos", file=sys.stderr)
+
+    sys.exit(1 if errors or (args.strict and warnings) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Motor del juego en Python puro: las reglas sin Streamlit.
+
+    from engine import GameConfig, start_round
+    from game_state import GameState
+
+    game = GameState()
+    config = GameConfig(players=("Ana", "Luis", "Marta"), selected_themes=("🍔 Comida",))
+    start_round(game, config)      # o deal(config) si no hace falta un GameState
+    while game.current_player() is not None:
+        game.next_player()
+
+Las vistas (`game_logic`), las salas y los simuladores son capas finas
+encima. Los errores llevan la clave del texto en `i18n` (`e.key`).
+"""
+
+from game_state import GameState, PhaseError
+
+from .errors import ConfigError, EngineError
+from .rules import (
+    Deal,
+    GameConfig,
+    check_config,
+    deal,
+    deal_roles,
+    draw_word,
+    new_game_seed,
+    pick_random_word_from_themes,
+    replay_roles,
+    start_round,
+    validate_game_config,
+)
+
+__all__ = [
+    "ConfigError",
+    "Deal",
+    "EngineError",
+    "GameConfig",
+    "GameState",
+    "PhaseError",
+    "check_config",
+    "deal",
+    "deal_roles",
+    "draw_word",
+    "new_game_seed",
+    "pick_random_word_from_themes",
+    "replay_roles",
+    "start_round",
+    "validate_game_config",
+]
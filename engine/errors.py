@@ -0,0 +1,19 @@
+"""Errores del motor de reglas."""
+
+
+class EngineError(Exception):
+    """
+    Error de las reglas del juego.
+
+    Como en las salas, lleva la clave del texto en `i18n` en vez del texto:
+    el motor no sabe en qué idioma está quien lo usa.
+    """
+
+    def __init__(self, key: str) -> None:
+        super().__init__(key)
+        self.key = key
+
+
+class ConfigError(EngineError):
+    """Configuración de partida inválida (pocos jugadores, sin temáticas...)."""
+
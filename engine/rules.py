@@ -0,0 +1,267 @@
+"""
+Reglas de una partida, sin Streamlit: configuración -> reparto -> estado.
+
+Todo lo de aquí recibe lo que necesita como argumentos (jugadores,
+idioma, generador...) y devuelve resultados o lanza `ConfigError`; no lee
+ni escribe `st.session_state` ni pinta nada. Las vistas (`game_logic`),
+las salas, los simuladores y cualquier otro frontend lo usan igual.
+"""
+
+import random
+import secrets
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence, Tuple
+
+from dictionaries.adaptive import get_adaptive_weights, note_played
+from dictionaries.deck import WordDeck
+from dictionaries.index import WEIGHTING_BY_THEME, WordIndex, get_theme_sampler, get_word_index
+from dictionaries.similarity import pick_decoy_word
+from game_state import GameState
+from i18n import DEFAULT_LOCALE
+from roles import ImpostorSet, RevealOrder
+
+from .errors import ConfigError
+
+if TYPE_CHECKING:
+    from tournament import Round
+
+
+class GameConfig(NamedTuple):
+    """Todo lo que decide cómo se reparte una partida."""
+
+    players: Tuple[str, ...]
+    num_impostors: int = 1
+    selected_themes: Tuple[str, ...] = ()
+    hint_for_impostors: bool = True
+    word_weighting: str = WEIGHTING_BY_THEME
+    adaptive_words: bool = False
+    decoy_words: bool = False
+    locale: str = DEFAULT_LOCALE
+
+
+class Deal(NamedTuple):
+    """Reparto de una partida: roles, palabra y lo que ve cada bando."""
+
+    impostors: ImpostorSet
+    reveal_order: RevealOrder
+    theme_name: Optional[str]
+    civil_word: str
+    impostor_hint: Optional[str]
+    decoy_word: Optional[str]
+    seed: Optional[int]  # None si el reparto no sale de una semilla (torneos)
+
+
+def new_game_seed() -> int:
+    """Semilla nueva para una partida (cabe en un INTEGER de SQLite)."""
+    return secrets.randbits(63)
+
+
+def validate_game_config(
+    num_players: int,
+    num_impostors: int,
+    selected_themes: Sequence[str],
+) -> Optional[str]:
+    """
+    Devuelve la clave (en `i18n`) del error de la configuración, o None si
+    es válida. Quien la muestra la traduce al idioma de su sesión.
+    """
+    if num_players < 3:
+        return "error.min_players"
+    if num_impostors < 1:
+        return "error.min_impostors"
+    if num_impostors > num_players:
+        return "error.too_many_impostors"
+    if not selected_themes:
+        return "error.no_themes"
+    return None
+
+
+def check_config(config: GameConfig) -> None:
+    """Lanza ConfigError si con esta configuración no se puede jugar."""
+    error = validate_game_config(
+        len(config.players), config.num_impostors, config.selected_themes
+    )
+    if error:
+        raise ConfigError(error)
+
+
+def deal_roles(
+    num_players: int,
+    num_impostors: int,
+    rng: random.Random = random,
+) -> Tuple[ImpostorSet, RevealOrder]:
+    """Elige impostores y orden de revelación. Devuelve (impostor_indices, reveal_order)."""
+    # Elegimos impostores al azar
+    impostor_indices = ImpostorSet(num_players, rng.sample(range(num_players), num_impostors))
+
+    # Elegimos jugador de inicio: el orden de revelación es una rotación desde él
+    reveal_order = RevealOrder(rng.randrange(num_players), num_players)
+    return impostor_indices, reveal_order
+
+
+def replay_roles(seed: int, num_players: int, num_impostors: int) -> Tuple[ImpostorSet, RevealOrder]:
+    """
+    Vuelve a repartir los roles de una partida a partir de su semilla.
+
+    Los roles se reparten con el generador recién creado, antes de sacar
+    la palabra, así que salen igual aunque la palabra viniera de la baraja
+    o el diccionario haya cambiado desde entonces.
+    """
+    return deal_roles(num_players, num_impostors, random.Random(seed))
+
+
+def _sample_word(
+    selected_themes: Sequence[str],
+    weighting: str,
+    rng: random.Random,
+    locale: str,
+    adaptive: bool,
+) -> Tuple[Optional[WordIndex], Optional[int]]:
+    """(índice, id) de una palabra de las temáticas, o (None, None) si no tienen ninguna."""
+    if not selected_themes:
+        return None, None
+    sampler = get_theme_sampler(selected_themes, locale)
+    if not sampler:
+        return None, None
+
+    if adaptive:
+        weights = get_adaptive_weights(locale)
+        if weights.index is sampler.index:
+            return sampler.index, weights.draw(sampler.theme_ids, weighting, rng)
+
+    return sampler.index, sampler.draw(weighting, rng)
+
+
+def _draw(
+    selected_themes: Sequence[str],
+    weighting: str,
+    deck: Optional[WordDeck],
+    rng: random.Random,
+    locale: str,
+    adaptive: bool,
+) -> Tuple[Optional[WordIndex], Optional[int]]:
+    """Como `_sample_word`, pero robando primero de la baraja si la hay."""
+    word_id = deck.draw(rng) if deck is not None else None
+    if word_id is None:
+        return _sample_word(selected_themes, weighting, rng, locale, adaptive)
+    return deck.index, word_id
+
+
+def _word_entry(index: Optional[WordIndex], word_id: Optional[int], selected_themes: Sequence[str]):
+    """(nombre_tematica, palabra, pista) de una palabra del índice."""
+    if index is None or word_id is None:
+        # No debería ocurrir si validamos antes, pero por seguridad
+        theme_name = selected_themes[0] if selected_themes else "Sin temática"
+        return theme_name, "PALABRA_DE_EJEMPLO", "PISTA_DE_EJEMPLO"
+    theme_name = index.theme_names[index.theme_of(word_id)]
+    return theme_name, index.words[word_id], index.hints[word_id]
+
+
+def pick_random_word_from_themes(
+    selected_themes: Sequence[str],
+    weighting: str = WEIGHTING_BY_THEME,
+    rng: random.Random = random,
+    locale: str = DEFAULT_LOCALE,
+    adaptive: bool = False,
+):
+    """
+    Elige aleatoriamente una palabra y pista de las temáticas seleccionadas.
+
+    Con weighting="theme" primero se elige la temática y luego la palabra;
+    con weighting="word" todas las palabras tienen la misma probabilidad.
+    Con adaptive=True cada palabra pesa según sus resultados y lo reciente
+    que haya salido en el servidor (ver dictionaries.adaptive).
+
+    Devuelve (nombre_tematica, palabra_civiles, pista_impostores o None).
+    """
+    index, word_id = _sample_word(selected_themes, weighting, rng, locale, adaptive)
+    return _word_entry(index, word_id, selected_themes)
+
+
+def draw_word(
+    selected_themes: Sequence[str],
+    weighting: str = WEIGHTING_BY_THEME,
+    deck: Optional[WordDeck] = None,
+    rng: random.Random = random,
+    locale: str = DEFAULT_LOCALE,
+    adaptive: bool = False,
+):
+    """
+    Elige (nombre_tematica, palabra, pista). Si se pasa una baraja ya
+    sincronizada con las temáticas, se roba de ella sin repetir palabras.
+    """
+    index, word_id = _draw(selected_themes, weighting, deck, rng, locale, adaptive)
+    return _word_entry(index, word_id, selected_themes)
+
+
+def deal(
+    config: GameConfig,
+    deck: Optional[WordDeck] = None,
+    seed: Optional[int] = None,
+    round_: Optional["Round"] = None,
+) -> Deal:
+    """
+    Reparte una partida: comprueba la configuración, elige roles y palabra
+    (o toma los de la ronda de un torneo) y, en el modo infiltrado, la
+    palabra parecida de los impostores.
+
+    Con la misma semilla salen los mismos roles (ver replay_roles). En el
+    modo adaptativo, la palabra jugada se apunta en los pesos del servidor.
+    """
+    check_config(config)
+
+    # Cada partida tiene su propio generador, creado a partir de una semilla
+    # que se guarda: así se puede repetir el sorteo y las sesiones no
+    # comparten el estado del `random` global entre hilos.
+    if seed is None:
+        seed = new_game_seed()
+    rng = random.Random(seed)
+    locale = config.locale
+
+    if round_ is not None:
+        # Ronda de un torneo: ya está todo decidido en el calendario, y la
+        # semilla no la repetiría
+        seed = None
+        impostors, reveal_order = round_.impostors, round_.reveal_order
+        theme_name, civil_word, impostor_hint = round_.theme_name, round_.word, round_.hint
+        index = get_word_index(locale)
+        # El id del calendario vale mientras no se recargue el diccionario
+        word_id = index.word_id(theme_name, civil_word, round_.word_id)
+    else:
+        # Primero los roles y después la palabra (ver replay_roles)
+        impostors, reveal_order = deal_roles(len(config.players), config.num_impostors, rng)
+        index, word_id = _draw(
+            config.selected_themes, config.word_weighting, deck, rng, locale, config.adaptive_words
+        )
+        theme_name, civil_word, impostor_hint = _word_entry(index, word_id, config.selected_themes)
+    if config.adaptive_words and word_id is not None:
+        # Salga como salga, penaliza la palabra en todo el servidor por un rato
+        note_played(index, word_id, locale)
+
+    decoy_word = None
+    if config.decoy_words and word_id is not None:
+        decoy_word = pick_decoy_word(index, word_id, rng, locale)
+    if not config.hint_for_impostors or decoy_word is not None:
+        impostor_hint = None
+
+    return Deal(impostors, reveal_order, theme_name, civil_word, impostor_hint, decoy_word, seed)
+
+
+def start_round(
+    game: GameState,
+    config: GameConfig,
+    deck: Optional[WordDeck] = None,
+    seed: Optional[int] = None,
+    round_: Optional["Round"] = None,
+) -> Deal:
+    """Reparte una partida y la empieza en `game` (pasa a la revelación de roles)."""
+    dealt = deal(config, deck, seed, round_)
+    game.start(
+        dealt.impostors,
+        dealt.reveal_order,
+        dealt.theme_name,
+        dealt.civil_word,
+        dealt.impostor_hint,
+        dealt.seed,
+        dealt.decoy_word,
+    )
+    return dealt
@@ -1,89 +1,141 @@
-import random
-from typing import List
+"""
+Capa fina entre las vistas y el motor (`engine`): lee la configuración
+de `st.session_state`, llama a las reglas y muestra sus errores.
+"""
 
-import streamlit as st
+from typing import TYPE_CHECKING, List, Optional, Sequence
 
-from dictionaries import THEMES
+import streamlit as st
 
+from dictionaries.adaptive import record_outcome
+from dictionaries.deck import WordDeck, sync_deck
+from dictionaries.index import WEIGHTING_BY_THEME, get_word_index
+from engine import ConfigError, GameConfig, start_round
+from i18n import get_locale, t
+from state import get_game
+from voting import VoteResult, VoteTally
 
-def get_theme_names() -> List[str]:
-    """Devuelve la lista de temáticas disponibles."""
-    if not THEMES:
-        # Fallback por si el usuario borra todo accidentalmente
-        return ["General"]
-    return list(THEMES.keys())
+if TYPE_CHECKING:
+    from tournament import Tournament
 
 
-def pick_random_word_from_themes(selected_themes: List[str]):
+def get_theme_names(locale: Optional[str] = None) -> Sequence[str]:
     """
-    Elige aleatoriamente una temática de las seleccionadas y,
-    dentro de ella, una palabra y pista.
-
-    Devuelve (nombre_tematica, palabra_civiles, pista_impostores o None).
+    Devuelve las temáticas disponibles (por defecto, en el idioma de la
+    sesión). Es la tupla cacheada del índice: no se copia en cada rerun.
     """
-    if not selected_themes:
-        # No debería ocurrir si validamos antes, pero por seguridad
-        return "Sin temática", "PALABRA_DE_EJEMPLO", "PISTA_DE_EJEMPLO"
-
-    theme_name = random.choice(selected_themes)
-    entries = THEMES.get(theme_name, [])
+    theme_names = get_word_index(locale or get_locale()).theme_names
+    if not theme_names:
+        # Fallback por si el usuario borra todo accidentalmente
+        return ("General",)
+    return theme_names
 
-    if not entries:
-        return theme_name, "PALABRA_DE_EJEMPLO", "PISTA_DE_EJEMPLO"
 
-    choice = random.choice(entries)
-    word = choice.get("word", "PALABRA_DE_EJEMPLO")
-    hint = choice.get("hint")  # puede ser None
-    return theme_name, word, hint
+def sync_word_deck(selected_themes: List[str]) -> WordDeck:
+    """
+    Devuelve la baraja sin repetición de la sesión, ajustada a las
+    temáticas seleccionadas (si no cambian, no hace nada). Si cambia el
+    idioma, cambia el índice y la baraja se rehace.
+    """
+    index = get_word_index(get_locale())
+    deck = sync_deck(st.session_state.get("word_deck"), index, selected_themes)
+    st.session_state.word_deck = deck
+    return deck
 
 
 def start_game(
     num_impostors: int,
     hint_for_impostors: bool,
     selected_themes: List[str],
+    word_weighting: str = WEIGHTING_BY_THEME,
+    no_repeat_words: bool = False,
+    adaptive_words: bool = False,
+    decoy_words: bool = False,
+    tournament: Optional["Tournament"] = None,
 ) -> None:
-    """Configura una nueva partida y pasa a la fase de revelación de roles."""
-    players = st.session_state.players
-    num_players = len(players)
-
-    # Validaciones de seguridad (además de las del menú)
-    if num_players < 3:
-        st.error("Tiene que haber al menos 3 jugadores.")
-        return
-
-    if num_impostors < 1:
-        st.error("Tiene que haber al menos un impostor.")
-        return
-
-    if num_impostors > num_players:
-        st.error("El número de impostores no puede superar al número de jugadores.")
-        return
+    """
+    Configura una nueva partida y pasa a la fase de revelación de roles.
 
-    if not selected_themes:
-        st.error("Debes seleccionar al menos una temática.")
+    Con decoy_words=True (modo infiltrado) los impostores reciben, en vez
+    de la pista, otra palabra parecida de la misma temática. Si se pasa un
+    torneo, roles y palabra son los de su siguiente ronda.
+    """
+    players = st.session_state.players
+    config = GameConfig(
+        players=tuple(players),
+        num_impostors=num_impostors,
+        selected_themes=tuple(selected_themes),
+        hint_for_impostors=hint_for_impostors,
+        word_weighting=word_weighting,
+        adaptive_words=adaptive_words,
+        decoy_words=decoy_words,
+        locale=get_locale(),
+    )
+
+    # start_round vuelve a validar la configuración (además del menú)
+    game = get_game()
+    try:
+        if tournament is not None and not tournament.finished:
+            dealt = start_round(game, config, round_=tournament.peek())
+            # La ronda sólo se gasta si el reparto ha salido bien
+            tournament.next_round()
+        else:
+            deck = sync_word_deck(selected_themes) if no_repeat_words else None
+            dealt = start_round(game, config, deck)
+    except ConfigError as e:
+        st.error(t(e.key))
         return
 
-    # Elegimos temática, palabra y pista
-    theme_name, civil_word, impostor_hint = pick_random_word_from_themes(selected_themes)
-
-    if not hint_for_impostors:
-        impostor_hint = None
-
-    # Elegimos impostores al azar
-    impostor_indices = random.sample(range(num_players), num_impostors)
-
-    # Elegimos jugador de inicio y construimos el orden de revelación
-    start_index = random.randrange(num_players)
-    reveal_order = [(start_index + i) % num_players for i in range(num_players)]
-
-    # Guardamos todo en session_state (pero no tocamos la config base)
-    st.session_state.phase = "reveal"
+    # De la configuración sólo guardamos lo que se ha usado
     st.session_state.num_impostors = num_impostors
-    st.session_state.impostor_indices = impostor_indices
-    st.session_state.reveal_order = reveal_order
-    st.session_state.reveal_pos = 0
-    st.session_state.is_revealed = False
-    st.session_state.civil_word = civil_word
-    st.session_state.impostor_hint = impostor_hint
-    st.session_state.theme_name = theme_name
     st.session_state.hint_for_impostors = hint_for_impostors
+    st.session_state.word_weighting = word_weighting
+    st.session_state.decoy_words = decoy_words
+    st.session_state.vote_tally = None
+    st.session_state.vote_result = None
+
+    # Historial (sólo si está activado; no bloquea). Importación diferida
+    # para no cargar sqlite3 hasta la primera partida.
+    from history import record_game
+
+    game.game_id = record_game(
+        players=list(players),
+        impostor_indices=dealt.impostors,
+        theme=dealt.theme_name,
+        word=dealt.civil_word,
+        hint=dealt.impostor_hint,
+        start_index=dealt.reveal_order[0],
+        countdown_seconds=st.session_state.get("countdown_seconds"),
+        seed=dealt.seed,
+    )
+
+
+def get_vote_tally() -> VoteTally:
+    """Votación de la partida en curso (se crea al llegar a la fase de votar)."""
+    tally = st.session_state.get("vote_tally")
+    num_players = get_game().num_players
+    if tally is None or tally.num_players != num_players:
+        tally = VoteTally(num_players)
+        st.session_state.vote_tally = tally
+        st.session_state.vote_result = None
+    return tally
+
+
+def finish_vote() -> VoteResult:
+    """
+    Cierra la votación: suma los puntos a la clasificación de la sesión y
+    apunta quién ha ganado para los pesos de la palabra.
+    """
+    game = get_game()
+    result = get_vote_tally().result(game.impostors)
+    st.session_state.leaderboard.apply(st.session_state.players, result)
+    record_outcome(game.theme_name, game.civil_word, result.impostors_won, get_locale())
+    st.session_state.vote_result = result
+    return result
+
+
+def end_vote() -> None:
+    """Vuelve al menú tras ver el resultado de la votación."""
+    st.session_state.vote_tally = None
+    st.session_state.vote_result = None
+    get_game().back_to_config()
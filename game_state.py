@@ -0,0 +1,275 @@
+"""
+Estado de la partida de una sesión en un único objeto.
+
+Antes la partida estaba repartida en ~15 claves sueltas de
+`st.session_state` y cada vista reseteaba a mano las que se acordaba.
+Ahora vive en `st.session_state.game` (un `GameState`) y sólo cambia a
+través de sus métodos, que comprueban que el cambio de fase es válido:
+
+    config -> reveal -> ready -> play -> (vote ->) config
+    config <-> room
+
+La configuración del menú (jugadores, temáticas, temporizador...) sigue
+en claves propias porque la leen y escriben los widgets.
+
+Se puede guardar o mover entera con `to_json()` o `to_bytes()` (unos
+pocos cientos de bytes); `footprint()` mide lo que ocupa en memoria.
+"""
+
+import json
+import struct
+import sys
+from dataclasses import dataclass, field
+from typing import Optional
+
+from roles import ImpostorSet, RevealOrder
+
+PHASE_CONFIG = "config"
+PHASE_REVEAL = "reveal"
+PHASE_READY = "ready"
+PHASE_PLAY = "play"
+PHASE_ROOM = "room"
+PHASE_VOTE = "vote"
+
+# El orden importa: to_bytes guarda la posición de la fase en esta tupla
+PHASES = (PHASE_CONFIG, PHASE_REVEAL, PHASE_READY, PHASE_PLAY, PHASE_ROOM, PHASE_VOTE)
+
+_TRANSITIONS = {
+    PHASE_CONFIG: {PHASE_REVEAL, PHASE_ROOM},
+    PHASE_REVEAL: {PHASE_READY, PHASE_CONFIG},
+    PHASE_READY: {PHASE_PLAY, PHASE_CONFIG},
+    PHASE_PLAY: {PHASE_VOTE, PHASE_CONFIG},
+    PHASE_VOTE: {PHASE_CONFIG},
+    PHASE_ROOM: {PHASE_CONFIG},
+}
+
+# Formato binario: cabecera fija + bitset de impostores + 5 textos (u16 + utf-8).
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<BBBIIIdq")
+_TEXT_LEN = struct.Struct("<H")
+
+_FLAG_REVEALED = 1
+_FLAG_HAS_HINT = 2
+_FLAG_HAS_THEME = 4
+_FLAG_HAS_TIMER = 8
+_FLAG_HAS_SEED = 16
+_FLAG_HAS_GAME_ID = 32
+_FLAG_HAS_DECOY = 64
+
+
+class PhaseError(ValueError):
+    """Cambio de fase no permitido (p. ej. de config directamente a play)."""
+
+
+@dataclass(slots=True)
+class GameState:
+    phase: str = PHASE_CONFIG
+    impostors: ImpostorSet = field(default_factory=lambda: ImpostorSet(0))
+    reveal_order: RevealOrder = field(default_factory=lambda: RevealOrder(0, 0))
+    reveal_pos: int = 0             # posición actual en reveal_order
+    is_revealed: bool = False       # si el jugador actual está viendo su rol
+    civil_word: str = ""
+    impostor_hint: Optional[str] = None
+    decoy_word: Optional[str] = None  # modo infiltrado: la palabra de los impostores
+    theme_name: Optional[str] = None
+    countdown_started_at: Optional[float] = None
+    seed: Optional[int] = None      # semilla del sorteo (ver engine.replay_roles)
+    game_id: Optional[str] = None   # id en el historial, si está activado
+
+    # ---------- Transiciones ----------
+
+    def go(self, phase: str) -> None:
+        if phase not in _TRANSITIONS.get(self.phase, ()):
+            raise PhaseError(f"No se puede pasar de '{self.phase}' a '{phase}'")
+        self.phase = phase
+
+    @property
+    def num_players(self) -> int:
+        return len(self.reveal_order)
+
+    def start(
+        self,
+        impostors: ImpostorSet,
+        reveal_order: RevealOrder,
+        theme_name: Optional[str],
+        civil_word: str,
+        impostor_hint: Optional[str],
+        seed: Optional[int] = None,
+        decoy_word: Optional[str] = None,
+    ) -> None:
+        """Nueva partida repartida: pasa a la revelación de roles."""
+        self.go(PHASE_REVEAL)
+        self.impostors = impostors
+        self.reveal_order = reveal_order
+        self.reveal_pos = 0
+        self.is_revealed = False
+        self.civil_word = civil_word
+        self.impostor_hint = impostor_hint
+        self.decoy_word = decoy_word
+        self.theme_name = theme_name
+        self.countdown_started_at = None
+        self.seed = seed
+        self.game_id = None
+
+    def current_player(self) -> Optional[int]:
+        """Índice del jugador que revela ahora, o None si ya han revelado todos."""
+        if self.reveal_pos >= self.num_players:
+            return None
+        return self.reveal_order[self.reveal_pos]
+
+    def show_role(self) -> None:
+        self.is_revealed = True
+
+    def next_player(self) -> None:
+        """Oculta el rol actual y pasa al siguiente (o a "ready" si era el último)."""
+        self.is_revealed = False
+        self.reveal_pos += 1
+        if self.reveal_pos >= self.num_players:
+            self.go(PHASE_READY)
+
+    def start_timer(self, now: float) -> None:
+        self.go(PHASE_PLAY)
+        self.countdown_started_at = now
+
+    def back_to_config(self) -> None:
+        """Vuelve al menú descartando la partida (la configuración no se toca)."""
+        self.go(PHASE_CONFIG)
+        self.impostors = ImpostorSet(0)
+        self.reveal_order = RevealOrder(0, 0)
+        self.reveal_pos = 0
+        self.is_revealed = False
+        self.countdown_started_at = None
+
+    # ---------- Serialización ----------
+
+    def to_dict(self) -> dict:
+        return {
+            "phase": self.phase,
+            "num_players": self.num_players,
+            "impostors": list(self.impostors),
+            "start_index": self.reveal_order.start,
+            "reveal_pos": self.reveal_pos,
+            "is_revealed": self.is_revealed,
+            "civil_word": self.civil_word,
+            "impostor_hint": self.impostor_hint,
+            "decoy_word": self.decoy_word,
+            "theme_name": self.theme_name,
+            "countdown_started_at": self.countdown_started_at,
+            "seed": self.seed,
+            "game_id": self.game_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameState":
+        num_players = data.get("num_players", 0)
+        phase = data.get("phase", PHASE_CONFIG)
+        if phase not in PHASES:
+            raise ValueError(f"Fase desconocida: {phase!r}")
+        return cls(
+            phase=phase,
+            impostors=ImpostorSet(num_players, data.get("impostors", ())),
+            reveal_order=RevealOrder(data.get("start_index", 0), num_players),
+            reveal_pos=data.get("reveal_pos", 0),
+            is_revealed=data.get("is_revealed", False),
+            civil_word=data.get("civil_word", ""),
+            impostor_hint=data.get("impostor_hint"),
+            decoy_word=data.get("decoy_word"),
+            theme_name=data.get("theme_name"),
+            countdown_started_at=data.get("countdown_started_at"),
+            seed=data.get("seed"),
+            game_id=data.get("game_id"),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "GameState":
+        return cls.from_dict(json.loads(text))
+
+    def to_bytes(self) -> bytes:
+        """Serialización binaria compacta (ver _HEADER)."""
+        flags = (
+            (_FLAG_REVEALED if self.is_revealed else 0)
+            | (_FLAG_HAS_HINT if self.impostor_hint is not None else 0)
+            | (_FLAG_HAS_THEME if self.theme_name is not None else 0)
+            | (_FLAG_HAS_TIMER if self.countdown_started_at is not None else 0)
+            | (_FLAG_HAS_SEED if self.seed is not None else 0)
+            | (_FLAG_HAS_GAME_ID if self.game_id is not None else 0)
+            | (_FLAG_HAS_DECOY if self.decoy_word is not None else 0)
+        )
+        parts = [
+            _HEADER.pack(
+                _FORMAT_VERSION,
+                PHASES.index(self.phase),
+                flags,
+                self.num_players,
+                self.reveal_order.start,
+                self.reveal_pos,
+                self.countdown_started_at or 0.0,
+                self.seed or 0,
+            ),
+            self.impostors.to_bytes(),
+        ]
+        texts = (self.civil_word, self.impostor_hint, self.theme_name, self.game_id, self.decoy_word)
+        for text in texts:
+            raw = (text or "").encode("utf-8")
+            parts.append(_TEXT_LEN.pack(len(raw)))
+            parts.append(raw)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameState":
+        version, phase, flags, num_players, start, reveal_pos, started_at, seed = (
+            _HEADER.unpack_from(data)
+        )
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Versión de formato desconocida: {version}")
+        offset = _HEADER.size
+        bits_len = (num_players + 7) // 8
+        impostors = ImpostorSet.from_bytes(num_players, data[offset:offset + bits_len])
+        offset += bits_len
+
+        texts = []
+        for _ in range(5):
+            (length,) = _TEXT_LEN.unpack_from(data, offset)
+            offset += _TEXT_LEN.size
+            texts.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        civil_word, hint, theme_name, game_id, decoy_word = texts
+
+        return cls(
+            phase=PHASES[phase],
+            impostors=impostors,
+            reveal_order=RevealOrder(start, num_players),
+            reveal_pos=reveal_pos,
+            is_revealed=bool(flags & _FLAG_REVEALED),
+            civil_word=civil_word,
+            impostor_hint=hint if flags & _FLAG_HAS_HINT else None,
+            decoy_word=decoy_word if flags & _FLAG_HAS_DECOY else None,
+            theme_name=theme_name if flags & _FLAG_HAS_THEME else None,
+            countdown_started_at=started_at if flags & _FLAG_HAS_TIMER else None,
+            seed=seed if flags & _FLAG_HAS_SEED else None,
+            game_id=game_id if flags & _FLAG_HAS_GAME_ID else None,
+        )
+
+    def footprint(self) -> int:
+        """
+        Bytes que ocupa en memoria el estado: el objeto y lo que cuelga de él.
+
+        Es una cota superior: cuenta también los textos, aunque la palabra,
+        la pista y la temática suelen ser las mismas cadenas del diccionario.
+        """
+        total = sys.getsizeof(self) + sys.getsizeof(self.impostors) + sys.getsizeof(self.reveal_order)
+        for value in (
+            self.civil_word,
+            self.impostor_hint,
+            self.decoy_word,
+            self.theme_name,
+            self.countdown_started_at,
+            self.seed,
+            self.game_id,
+        ):
+            if value is not None:
+                total += sys.getsizeof(value)
+        return total
@@ -0,0 +1,390 @@
+"""
+Historial de partidas en SQLite (opcional).
+
+Se activa definiendo la variable de entorno IMPOSTOR_HISTORY_DB con la ruta
+del fichero. Las vistas sólo meten eventos en una cola en memoria; un hilo
+en segundo plano los escribe por lotes (modo WAL), así que dibujar una
+pantalla nunca espera al disco.
+
+Exportar sin cargar la tabla entera en memoria:
+
+    python history.py export --format jsonl > partidas.jsonl
+    python history.py export --format csv --player Ana --since 2026-01-01
+
+Cada partida guarda la semilla de su sorteo, así que el reparto de roles
+se puede repetir para resolver discusiones:
+
+    python history.py replay <id de la partida>
+"""
+
+import argparse
+import atexit
+import csv
+import json
+import logging
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DB_ENV = "IMPOSTOR_HISTORY_DB"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    played_at REAL NOT NULL,
+    played_on TEXT NOT NULL,
+    source TEXT NOT NULL,
+    theme TEXT,
+    word TEXT,
+    hint TEXT,
+    num_players INTEGER NOT NULL,
+    num_impostors INTEGER NOT NULL,
+    start_index INTEGER NOT NULL,
+    countdown_seconds INTEGER,
+    seed INTEGER
+);
+CREATE TABLE IF NOT EXISTS game_players (
+    game_id TEXT NOT NULL REFERENCES games(id),
+    seat INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    is_impostor INTEGER NOT NULL,
+    PRIMARY KEY (game_id, seat)
+);
+CREATE INDEX IF NOT EXISTS idx_games_theme ON games(theme, played_at);
+CREATE INDEX IF NOT EXISTS idx_games_played_on ON games(played_on);
+CREATE INDEX IF NOT EXISTS idx_games_played_at ON games(played_at);
+CREATE INDEX IF NOT EXISTS idx_game_players_name ON game_players(name, game_id);
+"""
+
+EXPORT_COLUMNS = [
+    "id",
+    "played_at",
+    "source",
+    "theme",
+    "word",
+    "hint",
+    "num_players",
+    "num_impostors",
+    "start_index",
+    "countdown_seconds",
+    "seed",
+    "players",
+    "impostors",
+]
+
+# Columnas añadidas después de la primera versión: (nombre, tipo)
+MIGRATIONS = [("seed", "INTEGER")]
+
+_SEP = "\x1f"  # separador de nombres dentro de group_concat
+
+
+class HistoryStore:
+    """Escritura diferida por lotes y consultas/exportación en streaming."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000,
+    ) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max_queue)
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+        conn.close()
+
+        self._writer = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Añade a bases de datos antiguas las columnas que les falten."""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+        with conn:
+            for name, sql_type in MIGRATIONS:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE games ADD COLUMN {name} {sql_type}")
+
+    # ---------- Escritura ----------
+
+    def record_game(
+        self,
+        players: Sequence[str],
+        impostor_indices: Iterable[int],
+        theme: Optional[str],
+        word: Optional[str],
+        hint: Optional[str],
+        start_index: int,
+        countdown_seconds: Optional[int] = None,
+        source: str = "local",
+        game_id: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> str:
+        """Encola una partida. No bloquea: si la cola está llena se descarta."""
+        game_id = game_id or uuid.uuid4().hex
+        played_at = time.time()
+        impostors = set(impostor_indices)
+        game = (
+            game_id,
+            played_at,
+            datetime.fromtimestamp(played_at).strftime("%Y-%m-%d"),
+            source,
+            theme,
+            word,
+            hint,
+            len(players),
+            len(impostors),
+            start_index,
+            countdown_seconds,
+            seed,
+        )
+        seats = [(game_id, i, name, int(i in impostors)) for i, name in enumerate(players)]
+        try:
+            self._queue.put_nowait((game, seats))
+        except queue.Full:
+            self.dropped += 1
+        return game_id
+
+    def _run(self) -> None:
+        conn = self._connect()
+        stop = False
+        while not stop:
+            batch: List[tuple] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(conn, batch)
+            except sqlite3.Error:
+                logger.exception("No se pudo guardar un lote de %d partidas", len(batch))
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+        conn.close()
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, batch: List[tuple]) -> None:
+        if not batch:
+            return
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO games (id, played_at, played_on, source, theme, word, hint,"
+                " num_players, num_impostors, start_index, countdown_seconds, seed)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [game for game, _ in batch],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO game_players VALUES (?, ?, ?, ?)",
+                [seat for _, seats in batch for seat in seats],
+            )
+
+    def flush(self) -> None:
+        """Espera a que todo lo encolado esté en disco."""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    # ---------- Lectura ----------
+
+    def iter_games(
+        self,
+        player: Optional[str] = None,
+        theme: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        chunk_size: int = 500,
+        game_id: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Recorre las partidas en orden cronológico, por trozos, sin cargarlas todas."""
+        where, params = [], []
+        if game_id:
+            where.append("g.id = ?")
+            params.append(game_id)
+        if player:
+            where.append("g.id IN (SELECT game_id FROM game_players WHERE name = ?)")
+            params.append(player)
+        if theme:
+            where.append("g.theme = ?")
+            params.append(theme)
+        if since:
+            where.append("g.played_on >= ?")
+            params.append(since)
+        if until:
+            where.append("g.played_on <= ?")
+            params.append(until)
+
+        sql = f"""
+            SELECT g.id, g.played_at, g.source, g.theme, g.word, g.hint,
+                   g.num_players, g.num_impostors, g.start_index, g.countdown_seconds, g.seed,
+                   (SELECT group_concat(name, char(31)) FROM (
+                        SELECT name FROM game_players p WHERE p.game_id = g.id ORDER BY seat)),
+                   (SELECT group_concat(name, char(31)) FROM (
+                        SELECT name FROM game_players p
+                        WHERE p.game_id = g.id AND p.is_impostor ORDER BY seat))
+            FROM games g
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY g.played_at
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    game = dict(zip(EXPORT_COLUMNS, row))
+                    game["players"] = game["players"].split(_SEP) if game["players"] else []
+                    game["impostors"] = game["impostors"].split(_SEP) if game["impostors"] else []
+                    yield game
+        finally:
+            conn.close()
+
+    def get_game(self, game_id: str) -> Optional[dict]:
+        return next(self.iter_games(game_id=game_id), None)
+
+    def export(self, out: TextIO, fmt: str = "jsonl", **filters) -> int:
+        """Escribe las partidas en JSONL o CSV. Devuelve cuántas se han exportado."""
+        count = 0
+        if fmt == "csv":
+            writer = csv.writer(out)
+            writer.writerow(EXPORT_COLUMNS)
+            for game in self.iter_games(**filters):
+                game["players"] = "|".join(game["players"])
+                game["impostors"] = "|".join(game["impostors"])
+                writer.writerow([game[c] for c in EXPORT_COLUMNS])
+                count += 1
+        else:
+            for game in self.iter_games(**filters):
+                out.write(json.dumps(game, ensure_ascii=False))
+                out.write("\n")
+                count += 1
+        return count
+
+
+_store: Optional[HistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """Historial compartido del proceso, o None si no está activado."""
+    global _store
+    if _store is not None:
+        return _store
+    path = os.environ.get(HISTORY_DB_ENV)
+    if not path:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = HistoryStore(path)
+            atexit.register(_store.close)
+    return _store
+
+
+def record_game(**game) -> Optional[str]:
+    """Guarda una partida si el historial está activado (ver HistoryStore.record_game)."""
+    store = get_history_store()
+    if store is None:
+        return None
+    return store.record_game(**game)
+
+
+def _replay(store: HistoryStore, game_id: str) -> int:
+    """Compara el reparto guardado con el que sale de la semilla. 0 si coinciden."""
+    game = store.get_game(game_id)
+    if game is None:
+        print(f"No hay ninguna partida con id {game_id}", file=sys.stderr)
+        return 2
+    if game["seed"] is None:
+        print("La partida es anterior a las semillas: no se puede repetir", file=sys.stderr)
+        return 2
+
+    from engine import replay_roles
+
+    players = game["players"]
+    impostors, order = replay_roles(game["seed"], game["num_players"], game["num_impostors"])
+    replayed = [players[i] for i in impostors]
+    print(f"Partida {game_id} ({game['theme']}: {game['word']})")
+    print(f"  guardado:  impostores={game['impostors']} empieza={players[game['start_index']]}")
+    print(f"  repetido:  impostores={replayed} empieza={players[order[0]]}")
+    same = replayed == game["impostors"] and order[0] == game["start_index"]
+    print("  coinciden" if same else "  NO coinciden")
+    return 0 if same else 1
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Historial de partidas de ImpostorApp")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="exporta partidas en streaming")
+    export.add_argument("--db", default=os.environ.get(HISTORY_DB_ENV), required=False)
+    export.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    export.add_argument("--output", default="-", help="fichero de salida ('-' = stdout)")
+    export.add_argument("--player")
+    export.add_argument("--theme")
+    export.add_argument("--since", help="YYYY-MM-DD")
+    export.add_argument("--until", help="YYYY-MM-DD")
+    replay = sub.add_parser("replay", help="repite el reparto de roles de una partida")
+    replay.add_argument("game_id")
+    replay.add_argument("--db", default=os.environ.get(HISTORY_DB_ENV), required=False)
+    args = parser.parse_args(argv)
+
+    if not args.db:
+        parser.error(f"indica --db o la variable de entorno {HISTORY_DB_ENV}")
+
+    store = HistoryStore(args.db)
+    if args.command == "replay":
+        try:
+            sys.exit(_replay(store, args.game_id))
+        finally:
+            store.close()
+
+    filters = dict(player=args.player, theme=args.theme, since=args.since, until=args.until)
+    try:
+        if args.output == "-":
+            count = store.export(sys.stdout, args.format, **filters)
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                count = store.export(out, args.format, **filters)
+    finally:
+        store.close()
+    print(f"{count} partidas exportadas", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Textos de la interfaz en varios idiomas.
+
+Cada idioma es un módulo `i18n/<código>.py` con un dict `MESSAGES`
+(clave -> texto, con huecos `{nombre}` para `str.format`). Un catálogo
+se importa la primera vez que alguna sesión pide ese idioma y a partir de
+ahí lo comparten todas (queda en `sys.modules`, ya compilado a .pyc):
+una sala sólo en inglés nunca carga el español, y cambiar de idioma no
+vuelve a leer ni parsear nada, sólo cambia qué catálogo se consulta.
+
+Los diccionarios de palabras van aparte, por idioma, en
+`dictionaries/<código>/` (ver `dictionaries.loader`).
+"""
+
+import importlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+DEFAULT_LOCALE = "es"
+LOCALES = {
+    "es": "Español",
+    "en": "English",
+}
+LOCALE_PARAM = "lang"  # ?lang=en
+
+
+@lru_cache(maxsize=None)
+def get_catalog(locale: str) -> Mapping[str, str]:
+    """Catálogo de textos de un idioma (se importa una sola vez por proceso)."""
+    if locale not in LOCALES:
+        raise ValueError(f"Idioma no soportado: {locale!r}")
+    module = importlib.import_module(f"{__name__}.{locale}")
+    return MappingProxyType(module.MESSAGES)
+
+
+def normalize_locale(value: Optional[str]) -> Optional[str]:
+    """'en-GB', 'EN', 'en_US.UTF-8' -> 'en' (None si no lo soportamos)."""
+    if not value:
+        return None
+    code = value.replace("_", "-").split("-")[0].split(".")[0].lower()
+    return code if code in LOCALES else None
+
+
+def _detect_locale() -> str:
+    import streamlit as st
+
+    locale = normalize_locale(st.query_params.get(LOCALE_PARAM))
+    if locale is None:
+        # Idioma del navegador (Streamlit >= 1.46)
+        context = getattr(st, "context", None)
+        locale = normalize_locale(getattr(context, "locale", None))
+    return locale or DEFAULT_LOCALE
+
+
+def get_locale() -> str:
+    """Idioma de la sesión actual (se decide la primera vez que se pide)."""
+    import streamlit as st
+
+    locale = st.session_state.get("locale")
+    if locale is None:
+        locale = _detect_locale()
+        st.session_state.locale = locale
+    return locale
+
+
+def set_locale(locale: str) -> None:
+    import streamlit as st
+
+    if locale not in LOCALES:
+        raise ValueError(f"Idioma no soportado: {locale!r}")
+    st.session_state.locale = locale
+    st.query_params[LOCALE_PARAM] = locale
+
+
+def t(key: str, **kwargs) -> str:
+    """Texto `key` en el idioma de la sesión, con los huecos rellenos."""
+    text = get_catalog(get_locale()).get(key)
+    if text is None:
+        # Clave sin traducir: mejor en el idioma por defecto que en blanco
+        text = get_catalog(DEFAULT_LOCALE)[key]
+    return text.format(**kwargs) if kwargs else text
@@ -0,0 +1,216 @@
+"""Textos de la interfaz en inglés."""
+
+MESSAGES = {
+    # --- Comunes ---
+    "common.game_problem": "Something went wrong with the game. Going back to the main menu.",
+    "common.back_to_menu": "🔙 Back to the main menu 🔙",
+    "common.start_game": "🎮 Start game",
+    "common.start_timer": "▶️ Start timer ▶️",
+    "common.show_role": "Tap to see your role",
+    "common.time_up": "⏰ Time's up! ⏰",
+    "common.first_player": "The first player to start is: <b>{name}</b>.",
+    "common.someone": "Someone",
+    "common.num_impostors": "Number of impostors",
+    "common.hint_for_impostors": "Do impostors get a hint?",
+    "common.decoy_words": "Undercover mode: impostors get a similar word",
+    "common.decoy_words_help": (
+        "Instead of a hint, each impostor sees a different but similar word "
+        "from the same theme, without knowing they are the impostor."
+    ),
+    "common.themes": "Themes",
+    "common.name_placeholder": "Example: Ann",
+    "common.language": "Language",
+
+    # --- Validación de la configuración (engine.validate_game_config) ---
+    "error.min_players": "There must be at least 3 players.",
+    "error.min_impostors": "There must be at least one impostor.",
+    "error.too_many_impostors": "There cannot be more impostors than players.",
+    "error.no_themes": "Select at least one theme.",
+
+    # --- Configuración ---
+    "config.subtitle": "Game setup",
+    "config.intro": (
+        "Add the players, choose how many will be impostors, decide whether "
+        "they get a hint, pick the themes and set the timer."
+    ),
+    "config.room_button": "📱 Each player on their own phone (room)",
+    "config.impostors": "Impostors",
+    "config.need_two_players": "Add at least 2 players to set up the impostors.",
+    "config.civilians": "**Approximate civilians:** {count}",
+    "config.timer": "Game timer",
+    "config.duration": "**Duration:** {label}",
+    "config.minutes": "{mins} min",
+    "config.minutes_seconds": "{mins} min {secs:02d} s",
+    "config.timer_caption": (
+        "The timer starts once every role has been revealed "
+        "and you press the start button."
+    ),
+    "config.client_timer": "Countdown in the browser (recommended)",
+    "config.client_timer_help": "If disabled, the server redraws the timer every second.",
+    "config.no_repeat": "Don't repeat words until the themes run out",
+    "config.deck_left": "{remaining} of {total} words left in the deck.",
+    "config.weighting": "Draw weighting",
+    "config.weighting_theme": "Every theme equally",
+    "config.weighting_word": "Every word equally",
+    "config.no_repeat_caption": (
+        "Each word comes up only once until every word in the selected "
+        "themes has been used; then the deck is reshuffled."
+    ),
+    "config.weighting_word_caption": (
+        "A random word is picked among all the words of the selected "
+        "themes: themes with more words come up more often."
+    ),
+    "config.weighting_theme_caption": (
+        "A random theme is picked among the selected ones and then "
+        "a random word within it."
+    ),
+    "config.adaptive": "Adjust words to past games",
+    "config.adaptive_help": (
+        "Words where the same side always wins come up less often, "
+        "and so do words just played at any table on the server."
+    ),
+    "config.tournament_title": "Tournament",
+    "config.tournament": "Play a multi-round tournament",
+    "config.tournament_help": (
+        "The impostors, the first player and the word of every round are "
+        "decided up front: everyone is impostor about as often as everyone "
+        "else, and nobody twice in a row if there are enough players."
+    ),
+    "config.tournament_rounds": "Number of rounds",
+    "config.tournament_new": "A {rounds}-round tournament will be prepared when you start.",
+    "config.tournament_progress": "Round {round} of {total}. Each player will be impostor between {low} and {high} times.",
+    "config.tournament_reset": "🔁 Start another tournament",
+    "config.tournament_changed": (
+        "The tournament in progress (round {round} of {total}) was set up with other players, impostors or themes: "
+        "a new one will be prepared when you start."
+    ),
+
+    # --- Selector de temáticas ---
+    "themes.search": "Search themes",
+    "themes.search_placeholder": "Name, category or tag",
+    "themes.category": "Category",
+    "themes.tag": "Tag",
+    "themes.all": "All",
+    "themes.no_category": "Uncategorised",
+    "themes.select_visible": "Select the {count} shown",
+    "themes.deselect_visible": "Deselect the shown",
+    "themes.placeholder": "Choose one or more themes",
+    "themes.option": "{name} · {words} words · {coverage:.0%} with hints",
+    "themes.summary": "Showing {shown} of {total} themes; {selected} selected.",
+
+    # --- Jugadores ---
+    "players.title": "Players",
+    "players.column": "Name",
+    "players.repeated": "Already on the list (ignored): {names}",
+    "players.and_more": "{names} and {count} more",
+    "players.name": "Player name",
+    "players.add": "Add player",
+    "players.empty_name": "Type a name before adding.",
+    "players.already_listed": "That name is already on the list.",
+    "players.paste": "Paste a list of players",
+    "players.one_per_line": "One name per line",
+    "players.paste_placeholder": "Ann\nLouis\nMartha",
+    "players.add_all": "Add all",
+    "players.added": "{count} players added.",
+    "players.page": "Page",
+    "players.page_caption": (
+        "Players {first}–{last} of {total}. Edit, add or delete "
+        "rows and press “Save changes”."
+    ),
+    "players.save": "Save changes",
+    "players.none": "No players added yet.",
+    "players.list": "**Player list:**",
+    "players.clear": "Clear the list",
+    "players.count": "**Current number of players:** {count}",
+
+    # --- Revelación de roles ---
+    "reveal.roles_problem": "Something went wrong while dealing the roles. Restarting the game.",
+    "reveal.title": "🎭 ImpostorApp — Roles 🎭",
+    "reveal.turn": "Turn of: <b>{name}</b>",
+    "reveal.hand_over": (
+        "Hand the phone to this person. "
+        "Nobody else should look at the screen while they see their role 😉"
+    ),
+    "reveal.hide_and_next": "Hide and pass to the next player",
+
+    # --- Tarjeta de rol ---
+    "role.theme": "This game's theme: <b>{theme}</b>",
+    "role.impostor": "😈 You are the <b>IMPOSTOR</b>",
+    "role.hint": "A hint to get close to the word:",
+    "role.no_hint": (
+        "You have no hint. You'll have to improvise and "
+        "guess the word from what the others say."
+    ),
+    "role.civilian": "🧑‍🌾 You are a <b>CIVILIAN</b>",
+    "role.word": "Your word is:",
+
+    # --- Preparados ---
+    "ready.title": "🎭 ImpostorApp — Get ready 🎭",
+    "ready.all_know": "Every player knows their role.",
+    "ready.instructions": (
+        "When you are all ready to start the round, press the button below. "
+        "The timer will start and you can begin saying words."
+    ),
+    "ready.back": "🔙 Back to game setup 🔙",
+
+    # --- Temporizador ---
+    "play.title": "⏳ ImpostorApp — Timer ⏳",
+    "play.remaining": "🕒 Time left:",
+    "play.time_up_hint": "You can stop the round, vote or carry on as you like.",
+    "play.who_won": "Who won the round?",
+    "play.civilians_won": "🧑‍🌾 Civilians",
+    "play.impostors_won": "😈 Impostors",
+    "play.vote": "🗳️ Vote",
+
+    # --- Voting ---
+    "vote.title": "🗳️ ImpostorApp — Voting 🗳️",
+    "vote.turn": "Voting: <b>{name}</b>",
+    "vote.progress": "{cast} of {total} have voted.",
+    "vote.who": "Who do you think is the impostor?",
+    "vote.placeholder": "Pick a player",
+    "vote.confirm": "Vote",
+    "vote.your_vote": "Your vote: {name} (you can change it until voting closes).",
+    "vote.close": "🏁 Close voting",
+    "vote.most_voted": "Most voted: {names} ({votes} votes)",
+    "vote.civilians_won": "🧑‍🌾 Civilians win!",
+    "vote.impostors_won": "😈 Impostors win!",
+    "vote.reveal": "Impostors: <b>{impostors}</b>. The word was <b>{word}</b>.",
+    "vote.leaderboard": "**Leaderboard** ({rounds} rounds)",
+    "vote.no_scores": "No points yet.",
+    "vote.your_rank": "You are number {rank} of {total} with {score} points.",
+
+    # --- Salas ---
+    "room.refresh": "🔄 Refresh",
+    "room.entry_title": "📱 ImpostorApp — Room",
+    "room.entry_intro": (
+        "Each player joins from their own phone with the room code "
+        "and sees their role at the same time as the others."
+    ),
+    "room.your_name": "Your name",
+    "room.code": "Room code (to join)",
+    "room.create": "➕ Create room",
+    "room.join": "🚪 Join",
+    "room.members": "**Players in the room ({count}):** {names}",
+    "room.waiting_host": "Waiting for the host to start the game…",
+    "room.summary": "**Impostors:** {impostors} · **Themes:** {themes}",
+    "room.timer_seconds": "Timer duration (s)",
+    "room.already_started": "This round has already started. You'll join the next one.",
+    "room.hide": "🙈 Hide",
+    "room.host_starts_timer": "The host will start the timer when you are ready.",
+    "room.end_round": "🏁 End round",
+    "room.title": "🎭 Room {code} 🎭",
+    "room.share_code": "Share the code **{code}** so the others can join",
+    "room.you_are_host": " · you are the host",
+    "room.leave": "🚪 Leave the room",
+    "room.error.name_to_join": "Type your name to join the room.",
+    "room.error.name_taken": "That name is already in the room.",
+    "room.error.name_to_create": "Type your name to create the room.",
+    "room.error.not_found": "There is no room with that code.",
+    "room.error.not_in_lobby": "The round has already started: settings can only change between rounds.",
+
+    # --- Room server (server) ---
+    "server.error.bad_request": "Invalid message.",
+    "server.error.not_in_room": "You are not in a room.",
+    "server.error.not_host": "Only the host can do that.",
+    "server.error.no_role": "You have no role in this round.",
+}
@@ -0,0 +1,216 @@
+"""Textos de la interfaz en español (idioma por defecto)."""
+
+MESSAGES = {
+    # --- Comunes ---
+    "common.game_problem": "Ha ocurrido un problema con la partida. Volviendo al menú principal.",
+    "common.back_to_menu": "🔙 Volver al menú principal 🔙",
+    "common.start_game": "🎮 Empezar partida",
+    "common.start_timer": "▶️ Empezar temporizador ▶️",
+    "common.show_role": "Pulsa para saber qué te ha tocado",
+    "common.time_up": "⏰ ¡Tiempo agotado! ⏰",
+    "common.first_player": "El primer jugador en empezar será: <b>{name}</b>.",
+    "common.someone": "Alguien",
+    "common.num_impostors": "Número de impostores",
+    "common.hint_for_impostors": "¿Los impostores reciben pista?",
+    "common.decoy_words": "Modo infiltrado: los impostores reciben una palabra parecida",
+    "common.decoy_words_help": (
+        "En vez de pista, cada impostor ve una palabra distinta pero parecida "
+        "de la misma temática, sin saber que es el impostor."
+    ),
+    "common.themes": "Temáticas",
+    "common.name_placeholder": "Ejemplo: Ana",
+    "common.language": "Idioma",
+
+    # --- Validación de la configuración (engine.validate_game_config) ---
+    "error.min_players": "Tiene que haber al menos 3 jugadores.",
+    "error.min_impostors": "Tiene que haber al menos un impostor.",
+    "error.too_many_impostors": "El número de impostores no puede superar al número de jugadores.",
+    "error.no_themes": "Debes seleccionar al menos una temática.",
+
+    # --- Configuración ---
+    "config.subtitle": "Configuración de la partida",
+    "config.intro": (
+        "Añade los jugadores, elige cuántos serán impostores, decide si "
+        "reciben pista, selecciona las temáticas y ajusta el temporizador."
+    ),
+    "config.room_button": "📱 Jugar cada uno con su móvil (sala)",
+    "config.impostors": "Impostores",
+    "config.need_two_players": "Añade al menos 2 jugadores para poder configurar los impostores.",
+    "config.civilians": "**Civiles aproximados:** {count}",
+    "config.timer": "Temporizador de la partida",
+    "config.duration": "**Duración:** {label}",
+    "config.minutes": "{mins} min",
+    "config.minutes_seconds": "{mins} min {secs:02d} s",
+    "config.timer_caption": (
+        "Este temporizador empezará cuando se hayan revelado todos los roles "
+        "y pulséis el botón de empezar partida."
+    ),
+    "config.client_timer": "Cuenta atrás en el navegador (recomendado)",
+    "config.client_timer_help": "Si lo desactivas, el servidor redibuja el temporizador cada segundo.",
+    "config.no_repeat": "No repetir palabras hasta agotar las temáticas",
+    "config.deck_left": "Quedan {remaining} de {total} palabras en la baraja.",
+    "config.weighting": "Reparto del sorteo",
+    "config.weighting_theme": "Cada temática por igual",
+    "config.weighting_word": "Cada palabra por igual",
+    "config.no_repeat_caption": (
+        "Cada palabra saldrá una sola vez hasta que se agoten todas las de "
+        "las temáticas seleccionadas; entonces se vuelve a barajar."
+    ),
+    "config.weighting_word_caption": (
+        "Se elegirá una palabra aleatoria entre todas las de las temáticas "
+        "seleccionadas: las temáticas con más palabras salen más a menudo."
+    ),
+    "config.weighting_theme_caption": (
+        "Se elegirá una temática aleatoria entre las seleccionadas y, "
+        "dentro de ella, una palabra también aleatoria."
+    ),
+    "config.adaptive": "Ajustar las palabras según las partidas jugadas",
+    "config.adaptive_help": (
+        "Las palabras con las que siempre gana el mismo bando salen menos, "
+        "y las que acaban de jugarse en cualquier mesa del servidor también."
+    ),
+    "config.tournament_title": "Torneo",
+    "config.tournament": "Jugar un torneo de varias rondas",
+    "config.tournament_help": (
+        "Los impostores, quién empieza y la palabra de cada ronda se deciden "
+        "al principio: todos son impostor casi las mismas veces y nadie lo es "
+        "dos rondas seguidas si hay jugadores suficientes."
+    ),
+    "config.tournament_rounds": "Número de rondas",
+    "config.tournament_new": "Al empezar se preparará un torneo de {rounds} rondas.",
+    "config.tournament_progress": "Ronda {round} de {total}. Cada jugador será impostor entre {low} y {high} veces.",
+    "config.tournament_reset": "🔁 Empezar otro torneo",
+    "config.tournament_changed": (
+        "El torneo en curso (ronda {round} de {total}) era con otros jugadores, impostores o temáticas: "
+        "al empezar se preparará uno nuevo."
+    ),
+
+    # --- Selector de temáticas ---
+    "themes.search": "Buscar temática",
+    "themes.search_placeholder": "Nombre, categoría o etiqueta",
+    "themes.category": "Categoría",
+    "themes.tag": "Etiqueta",
+    "themes.all": "Todas",
+    "themes.no_category": "Sin categoría",
+    "themes.select_visible": "Marcar las {count} mostradas",
+    "themes.deselect_visible": "Desmarcar las mostradas",
+    "themes.placeholder": "Elige una o más temáticas",
+    "themes.option": "{name} · {words} palabras · {coverage:.0%} con pista",
+    "themes.summary": "Se muestran {shown} de {total} temáticas; {selected} seleccionadas.",
+
+    # --- Jugadores ---
+    "players.title": "Jugadores",
+    "players.column": "Nombre",
+    "players.repeated": "Ya estaban en la lista (se han ignorado): {names}",
+    "players.and_more": "{names} y {count} más",
+    "players.name": "Nombre del jugador",
+    "players.add": "Añadir jugador",
+    "players.empty_name": "Escribe un nombre antes de añadir.",
+    "players.already_listed": "Ese nombre ya está en la lista.",
+    "players.paste": "Pegar una lista de jugadores",
+    "players.one_per_line": "Un nombre por línea",
+    "players.paste_placeholder": "Ana\nLuis\nMarta",
+    "players.add_all": "Añadir todos",
+    "players.added": "Se han añadido {count} jugadores.",
+    "players.page": "Página",
+    "players.page_caption": (
+        "Jugadores {first}–{last} de {total}. Edita, añade o borra "
+        "filas y pulsa «Guardar cambios»."
+    ),
+    "players.save": "Guardar cambios",
+    "players.none": "Todavía no hay jugadores añadidos.",
+    "players.list": "**Lista de jugadores:**",
+    "players.clear": "Vaciar la lista",
+    "players.count": "**Número actual de jugadores:** {count}",
+
+    # --- Revelación de roles ---
+    "reveal.roles_problem": "Ha ocurrido un problema con la asignación de roles. Reiniciando partida.",
+    "reveal.title": "🎭 ImpostorApp — Asignación de roles 🎭",
+    "reveal.turn": "Turno de: <b>{name}</b>",
+    "reveal.hand_over": (
+        "Entrega el móvil a esta persona. "
+        "Nadie más debería mirar la pantalla mientras ve su rol 😉"
+    ),
+    "reveal.hide_and_next": "Ocultar y pasar al siguiente",
+
+    # --- Tarjeta de rol ---
+    "role.theme": "Temática de esta partida: <b>{theme}</b>",
+    "role.impostor": "😈 Eres <b>IMPOSTOR</b>",
+    "role.hint": "Pista para aproximarte a la palabra:",
+    "role.no_hint": (
+        "No tienes pista. Tendrás que improvisar y "
+        "adivinar la palabra en base a lo que digan los demás."
+    ),
+    "role.civilian": "🧑‍🌾 Eres <b>CIVIL</b>",
+    "role.word": "Tu palabra es:",
+
+    # --- Preparados ---
+    "ready.title": "🎭 ImpostorApp — Preparados 🎭",
+    "ready.all_know": "Todos los jugadores ya conocen su rol.",
+    "ready.instructions": (
+        "Cuando estéis todos listos para empezar la ronda, pulsa el botón de abajo. "
+        "El temporizador comenzará y podréis empezar a decir palabras."
+    ),
+    "ready.back": "🔙 Volver al menú de configuración 🔙",
+
+    # --- Temporizador ---
+    "play.title": "⏳ ImpostorApp — Temporizador ⏳",
+    "play.remaining": "🕒 Tiempo restante:",
+    "play.time_up_hint": "Podéis parar el turno, votar o seguir como queráis.",
+    "play.who_won": "¿Quién ha ganado la ronda?",
+    "play.civilians_won": "🧑‍🌾 Civiles",
+    "play.impostors_won": "😈 Impostores",
+    "play.vote": "🗳️ Votar",
+
+    # --- Votación ---
+    "vote.title": "🗳️ ImpostorApp — Votación 🗳️",
+    "vote.turn": "Vota: <b>{name}</b>",
+    "vote.progress": "Han votado {cast} de {total}.",
+    "vote.who": "¿Quién crees que es impostor?",
+    "vote.placeholder": "Elige a un jugador",
+    "vote.confirm": "Votar",
+    "vote.your_vote": "Tu voto: {name} (puedes cambiarlo hasta que se cierre).",
+    "vote.close": "🏁 Cerrar votación",
+    "vote.most_voted": "Más votado: {names} ({votes} votos)",
+    "vote.civilians_won": "🧑‍🌾 ¡Ganan los civiles!",
+    "vote.impostors_won": "😈 ¡Ganan los impostores!",
+    "vote.reveal": "Impostores: <b>{impostors}</b>. La palabra era <b>{word}</b>.",
+    "vote.leaderboard": "**Clasificación** ({rounds} rondas)",
+    "vote.no_scores": "Todavía no hay puntos.",
+    "vote.your_rank": "Vas en el puesto {rank} de {total} con {score} puntos.",
+
+    # --- Salas ---
+    "room.refresh": "🔄 Actualizar",
+    "room.entry_title": "📱 ImpostorApp — Sala",
+    "room.entry_intro": (
+        "Cada jugador entra desde su propio móvil con el código de la sala "
+        "y ve su rol a la vez que los demás."
+    ),
+    "room.your_name": "Tu nombre",
+    "room.code": "Código de sala (para unirte)",
+    "room.create": "➕ Crear sala",
+    "room.join": "🚪 Unirme",
+    "room.members": "**Jugadores en la sala ({count}):** {names}",
+    "room.waiting_host": "Esperando a que el anfitrión empiece la partida…",
+    "room.summary": "**Impostores:** {impostors} · **Temáticas:** {themes}",
+    "room.timer_seconds": "Duración del temporizador (s)",
+    "room.already_started": "Esta ronda ya ha empezado. Entrarás en la siguiente.",
+    "room.hide": "🙈 Ocultar",
+    "room.host_starts_timer": "El anfitrión arrancará el temporizador cuando estéis listos.",
+    "room.end_round": "🏁 Terminar ronda",
+    "room.title": "🎭 Sala {code} 🎭",
+    "room.share_code": "Comparte el código **{code}** para que los demás se unan",
+    "room.you_are_host": " · eres el anfitrión",
+    "room.leave": "🚪 Salir de la sala",
+    "room.error.name_to_join": "Escribe tu nombre para entrar en la sala.",
+    "room.error.name_taken": "Ese nombre ya está en la sala.",
+    "room.error.name_to_create": "Escribe tu nombre para crear la sala.",
+    "room.error.not_found": "No existe ninguna sala con ese código.",
+    "room.error.not_in_lobby": "La ronda ya ha empezado: la configuración sólo se cambia entre rondas.",
+
+    # --- Servidor de salas (server) ---
+    "server.error.bad_request": "Mensaje no válido.",
+    "server.error.not_in_room": "No estás en ninguna sala.",
+    "server.error.not_host": "Sólo el anfitrión puede hacer eso.",
+    "server.error.no_role": "No tienes rol en esta ronda.",
+}
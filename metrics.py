@@ -0,0 +1,258 @@
+"""
+Métricas por fase de cada rerun, en formato de texto de Prometheus.
+
+`test.py` envuelve el despacho de fases con `track_rerun(phase)`, que
+anota la duración del rerun, cuántos elementos de Streamlit ha mandado y
+en qué fase está cada sesión. El coste es un par de `perf_counter`, un
+lock y un `bisect` por rerun, así que puede quedarse activo en producción.
+
+Para leerlas:
+
+- IMPOSTOR_METRICS_PORT=9108  → http://127.0.0.1:9108/metrics
+- IMPOSTOR_METRICS_FILE=ruta  → se reescribe el fichero cada 10 s
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+METRICS_PORT_ENV = "IMPOSTOR_METRICS_PORT"
+METRICS_FILE_ENV = "IMPOSTOR_METRICS_FILE"
+FILE_INTERVAL_SECONDS = 10.0
+
+# Una sesión en la pantalla del temporizador puede pasar hasta 10 minutos sin
+# rerun (la cuenta atrás va en el navegador), así que la ventana es amplia.
+ACTIVE_WINDOW_SECONDS = 15 * 60
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+ELEMENT_BUCKETS = (5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # el último es +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> List[str]:
+        out = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            out.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        out.append(f"{name}_sum{{{labels}}} {self.total}")
+        out.append(f"{name}_count{{{labels}}} {self.count}")
+        return out
+
+
+class PhaseMetrics:
+    """Contadores, histogramas y sesiones activas por fase."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: Dict[str, _Histogram] = {}
+        self._elements: Dict[str, _Histogram] = {}
+        self._errors: Dict[str, int] = {}
+        self._sessions: Dict[str, Tuple[str, float]] = {}  # session_id -> (fase, visto)
+        self._started = time.time()
+
+    def observe(
+        self,
+        phase: str,
+        seconds: float,
+        elements: Optional[int],
+        session_id: Optional[str],
+        failed: bool = False,
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            latency = self._latency.get(phase)
+            if latency is None:
+                latency = self._latency[phase] = _Histogram(LATENCY_BUCKETS)
+                self._elements[phase] = _Histogram(ELEMENT_BUCKETS)
+            latency.observe(seconds)
+            if elements is not None:
+                self._elements[phase].observe(elements)
+            if failed:
+                self._errors[phase] = self._errors.get(phase, 0) + 1
+            if session_id is not None:
+                self._sessions[session_id] = (phase, now)
+
+    def active_sessions(self) -> Dict[str, int]:
+        limit = time.time() - ACTIVE_WINDOW_SECONDS
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for session_id, (phase, seen) in list(self._sessions.items()):
+                if seen < limit:
+                    del self._sessions[session_id]
+                else:
+                    counts[phase] = counts.get(phase, 0) + 1
+        return counts
+
+    def render_prometheus(self) -> str:
+        active = self.active_sessions()
+        lines = [
+            "# HELP impostor_rerun_seconds Duración de cada rerun del script por fase.",
+            "# TYPE impostor_rerun_seconds histogram",
+        ]
+        with self._lock:
+            for phase, hist in sorted(self._latency.items()):
+                lines += hist.lines("impostor_rerun_seconds", f'phase="{phase}"')
+            lines += [
+                "# HELP impostor_rerun_elements Elementos de Streamlit enviados por rerun.",
+                "# TYPE impostor_rerun_elements histogram",
+            ]
+            for phase, hist in sorted(self._elements.items()):
+                if hist.count:
+                    lines += hist.lines("impostor_rerun_elements", f'phase="{phase}"')
+            lines += [
+                "# HELP impostor_reruns_total Reruns por fase.",
+                "# TYPE impostor_reruns_total counter",
+            ]
+            for phase, hist in sorted(self._latency.items()):
+                lines.append(f'impostor_reruns_total{{phase="{phase}"}} {hist.count}')
+            lines += [
+                "# HELP impostor_rerun_errors_total Reruns que terminaron con una excepción.",
+                "# TYPE impostor_rerun_errors_total counter",
+            ]
+            for phase, count in sorted(self._errors.items()):
+                lines.append(f'impostor_rerun_errors_total{{phase="{phase}"}} {count}')
+        lines += [
+            "# HELP impostor_active_sessions Sesiones vistas recientemente por fase.",
+            "# TYPE impostor_active_sessions gauge",
+        ]
+        for phase, count in sorted(active.items()):
+            lines.append(f'impostor_active_sessions{{phase="{phase}"}} {count}')
+        lines += [
+            "# HELP impostor_process_start_time_seconds Inicio del proceso.",
+            "# TYPE impostor_process_start_time_seconds gauge",
+            f"impostor_process_start_time_seconds {self._started}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+METRICS = PhaseMetrics()
+
+
+def _script_run_ctx():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx()
+
+
+@contextmanager
+def track_rerun(phase: str):
+    """
+    Mide un rerun completo de la fase dada.
+
+    Cuenta los elementos interceptando los mensajes que el script manda a
+    su sesión (`ctx._enqueue`). Si la versión de Streamlit no lo permite,
+    sólo se miden la duración y la fase.
+    """
+    ctx = _script_run_ctx()
+    session_id = getattr(ctx, "session_id", None)
+    counter = [0]
+    original = getattr(ctx, "_enqueue", None) if ctx is not None else None
+
+    if original is not None:
+        def counting_enqueue(msg, _original=original):
+            if msg.HasField("delta"):
+                counter[0] += 1
+            _original(msg)
+
+        try:
+            ctx._enqueue = counting_enqueue
+        except Exception:
+            original = None
+
+    failed = False
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        # st.rerun() sale con una excepción de control que no hereda de
+        # Exception, así que no cuenta como error
+        failed = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if original is not None:
+            ctx._enqueue = original
+        METRICS.observe(
+            phase,
+            elapsed,
+            counter[0] if original is not None else None,
+            session_id,
+            failed,
+        )
+
+
+def _serve_http(port: int) -> None:
+    # http.server sólo se importa si de verdad se va a servir
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = METRICS.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+
+
+def _write_file_forever(path: str) -> None:
+    while True:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(METRICS.render_prometheus())
+        os.replace(tmp, path)
+        time.sleep(FILE_INTERVAL_SECONDS)
+
+
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def start_exporters() -> None:
+    """Arranca (una sola vez por proceso) el servidor HTTP y/o el fichero de métricas."""
+    global _exporters_started
+    if _exporters_started:
+        return
+    with _exporters_lock:
+        if _exporters_started:
+            return
+        _exporters_started = True
+
+        port = os.environ.get(METRICS_PORT_ENV)
+        if port:
+            _serve_http(int(port))
+
+        path = os.environ.get(METRICS_FILE_ENV)
+        if path:
+            threading.Thread(
+                target=_write_file_forever, args=(path,), name="metrics-file", daemon=True
+            ).start()
@@ -0,0 +1,128 @@
+"""
+Estructuras compactas para los roles de una partida.
+
+Con 8 jugadores da igual, pero en salas enormes y en simulaciones de
+miles de partidas conviene que mirar el rol de un jugador y avanzar de
+turno sean O(1) y que la partida ocupe poco:
+
+- `ImpostorSet`: bitset de impostores (1 bit por jugador).
+- `RevealOrder`: orden de revelación como rotación (inicio, n), sin lista.
+"""
+
+from typing import Iterable, Iterator, Union
+
+
+class ImpostorSet:
+    """Conjunto de índices de impostores guardado como bitset."""
+
+    __slots__ = ("num_players", "_bits", "_count")
+
+    def __init__(self, num_players: int, indices: Iterable[int] = ()) -> None:
+        self.num_players = num_players
+        self._bits = bytearray((num_players + 7) // 8)
+        self._count = 0
+        for i in indices:
+            self.add(i)
+
+    def add(self, i: int) -> None:
+        if not 0 <= i < self.num_players:
+            raise IndexError(f"jugador {i} fuera de rango (0..{self.num_players - 1})")
+        mask = 1 << (i & 7)
+        if not self._bits[i >> 3] & mask:
+            self._bits[i >> 3] |= mask
+            self._count += 1
+
+    def __contains__(self, i) -> bool:
+        if not isinstance(i, int) or not 0 <= i < self.num_players:
+            return False
+        return bool(self._bits[i >> 3] & (1 << (i & 7)))
+
+    def __iter__(self) -> Iterator[int]:
+        for byte_index, byte in enumerate(self._bits):
+            while byte:
+                low = byte & -byte
+                yield (byte_index << 3) + low.bit_length() - 1
+                byte ^= low
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ImpostorSet):
+            return self.num_players == other.num_players and self._bits == other._bits
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ImpostorSet({self.num_players}, {list(self)})"
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._bits.__sizeof__()
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, num_players: int, data: bytes) -> "ImpostorSet":
+        if len(data) != (num_players + 7) // 8:
+            raise ValueError("El bitset no corresponde a ese número de jugadores")
+        impostors = cls(num_players)
+        impostors._bits[:] = data
+        impostors._count = sum(bin(byte).count("1") for byte in data)
+        return impostors
+
+    def __getstate__(self):
+        return self.num_players, bytes(self._bits), self._count
+
+    def __setstate__(self, state) -> None:
+        self.num_players, bits, self._count = state
+        self._bits = bytearray(bits)
+
+
+class RevealOrder:
+    """
+    Orden en el que se revelan los roles: start, start+1, ..., dando la
+    vuelta. Se comporta como una secuencia de sólo lectura de n índices.
+    """
+
+    __slots__ = ("start", "num_players")
+
+    def __init__(self, start: int, num_players: int) -> None:
+        if num_players and not 0 <= start < num_players:
+            raise IndexError(f"inicio {start} fuera de rango (0..{num_players - 1})")
+        self.start = start
+        self.num_players = num_players
+
+    def __len__(self) -> int:
+        return self.num_players
+
+    def __getitem__(self, pos: Union[int, slice]):
+        if isinstance(pos, slice):
+            return [self[i] for i in range(*pos.indices(self.num_players))]
+        if pos < 0:
+            pos += self.num_players
+        if not 0 <= pos < self.num_players:
+            raise IndexError("posición fuera del orden de revelación")
+        index = self.start + pos
+        return index - self.num_players if index >= self.num_players else index
+
+    def __iter__(self) -> Iterator[int]:
+        yield from range(self.start, self.num_players)
+        yield from range(self.start)
+
+    def position_of(self, index: int) -> int:
+        """Turno (0..n-1) en el que le toca revelar al jugador `index`."""
+        return (index - self.start) % self.num_players
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RevealOrder):
+            return (self.start, self.num_players) == (other.start, other.num_players)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RevealOrder(start={self.start}, num_players={self.num_players})"
+
+    def __getstate__(self):
+        return self.start, self.num_players
+
+    def __setstate__(self, state) -> None:
+        self.start, self.num_players = state
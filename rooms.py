@@ -0,0 +1,344 @@
+"""
+Salas compartidas entre varios dispositivos.
+
+Cada jugador entra en la sala desde su móvil con un código y todos leen
+el mismo objeto `Room`, que vive en un registro del proceso compartido por
+todas las sesiones. Cada sala tiene su propio lock y un contador de
+versión que sube con cada cambio: las sesiones sólo redibujan cuando ven
+una versión nueva.
+
+No depende de Streamlit: el servidor asyncio (`server`) usa las mismas
+salas.
+"""
+
+import random
+import secrets
+import string
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from dictionaries.adaptive import record_outcome
+from dictionaries.deck import WordDeck, sync_deck
+from dictionaries.index import WEIGHTING_BY_THEME, get_word_index
+from engine import ConfigError, EngineError, GameConfig, deal
+from history import record_game
+from i18n import DEFAULT_LOCALE
+from roles import ImpostorSet
+from voting import Leaderboard, VoteResult, VoteTally
+
+# Fases de una sala: "lobby" -> "reveal" -> "play" -> ("vote" ->) "lobby" ...
+ROOM_LOBBY = "lobby"
+ROOM_REVEAL = "reveal"
+ROOM_PLAY = "play"
+ROOM_VOTE = "vote"
+
+CODE_ALPHABET = "".join(c for c in string.ascii_uppercase if c not in "IO")
+CODE_LENGTH = 4
+ROOM_TTL_SECONDS = 6 * 60 * 60  # salas sin actividad durante 6 h se borran
+
+
+class RoomError(EngineError):
+    """
+    Error de uso de una sala (código inexistente, nombre repetido...).
+
+    La sala la comparten sesiones con idiomas distintos, así que el error
+    lleva la clave del texto en `i18n` y cada sesión lo traduce al suyo.
+    """
+
+
+class Room:
+    """Estado compartido de una sala. Modificar siempre con `room.lock`."""
+
+    __slots__ = (
+        "code",
+        "lock",
+        "version",
+        "host_token",
+        "members",
+        "phase",
+        "round",
+        "touched_at",
+        "locale",
+        # Configuración (la elige el anfitrión)
+        "num_impostors",
+        "hint_for_impostors",
+        "decoy_words",
+        "selected_themes",
+        "word_weighting",
+        "countdown_seconds",
+        "deck",
+        # Partida en curso
+        "players",
+        "seats",
+        "impostor_indices",
+        "start_index",
+        "civil_word",
+        "impostor_hint",
+        "decoy_word",
+        "theme_name",
+        "countdown_started_at",
+        # Votación y puntos
+        "tally",
+        "last_result",
+        "leaderboard",
+    )
+
+    def __init__(
+        self, code: str, host_token: str, host_name: str, locale: str = DEFAULT_LOCALE
+    ) -> None:
+        self.code = code
+        self.lock = threading.Lock()
+        self.version = 0
+        self.host_token = host_token
+        self.members: Dict[str, str] = {host_token: host_name}  # token -> nombre
+        self.phase = ROOM_LOBBY
+        self.round = 0  # sube con cada partida repartida
+        self.touched_at = time.time()
+        self.locale = locale  # idioma de las palabras (el del anfitrión al crearla)
+
+        self.num_impostors = 1
+        self.hint_for_impostors = True
+        self.decoy_words = False  # modo infiltrado (ver dictionaries.similarity)
+        self.selected_themes: Tuple[str, ...] = ()
+        self.word_weighting = WEIGHTING_BY_THEME
+        self.countdown_seconds = 180
+        self.deck: Optional[WordDeck] = None
+
+        self.players: Tuple[str, ...] = ()
+        self.seats: Dict[str, int] = {}  # nombre -> posición en la partida
+        self.impostor_indices = ImpostorSet(0)
+        self.start_index = 0
+        self.civil_word = ""
+        self.impostor_hint: Optional[str] = None
+        self.decoy_word: Optional[str] = None
+        self.theme_name: Optional[str] = None
+        self.countdown_started_at: Optional[float] = None
+
+        self.tally = VoteTally(0)
+        self.last_result: Optional[VoteResult] = None
+        self.leaderboard = Leaderboard()  # se acumula durante toda la vida de la sala
+
+    def _changed(self) -> None:
+        """Marca un cambio: llamar con el lock cogido."""
+        self.version += 1
+        self.touched_at = time.time()
+
+    def is_host(self, token: str) -> bool:
+        return token == self.host_token
+
+    def member_names(self) -> List[str]:
+        return list(self.members.values())
+
+    def seat_of(self, token: str) -> Optional[int]:
+        """Posición del jugador en la partida en curso (None si no juega)."""
+        return self.seats.get(self.members.get(token))
+
+    def join(self, token: str, name: str) -> None:
+        name = (name or "").strip()
+        if not name:
+            raise RoomError("room.error.name_to_join")
+        with self.lock:
+            if self.members.get(token) == name:
+                return
+            if name in self.members.values():
+                raise RoomError("room.error.name_taken")
+            self.members[token] = name
+            self._changed()
+
+    def leave(self, token: str) -> None:
+        with self.lock:
+            if self.members.pop(token, None) is None:
+                return
+            if token == self.host_token and self.members:
+                # El anfitrión pasa al siguiente que entró
+                self.host_token = next(iter(self.members))
+            self._changed()
+
+    def configure(self, **options) -> Tuple[bool, int]:
+        """
+        Actualiza la configuración de la sala (sólo en el lobby). Devuelve
+        si ha cambiado algo y la versión que tenía la sala justo antes.
+        """
+        with self.lock:
+            if self.phase != ROOM_LOBBY:
+                # Un rerun atrasado del lobby no puede cambiar la ronda en curso
+                raise RoomError("room.error.not_in_lobby")
+            version = self.version
+            changed = False
+            for key, value in options.items():
+                if getattr(self, key) != value:
+                    setattr(self, key, value)
+                    changed = True
+            if changed:
+                self._changed()
+            return changed, version
+
+    def start_game(self) -> None:
+        """Reparte roles entre los miembros actuales y pasa a la revelación."""
+        with self.lock:
+            players = tuple(self.members.values())
+            config = GameConfig(
+                players=players,
+                num_impostors=self.num_impostors,
+                selected_themes=self.selected_themes,
+                hint_for_impostors=self.hint_for_impostors,
+                word_weighting=self.word_weighting,
+                decoy_words=self.decoy_words,
+                locale=self.locale,
+            )
+            self.deck = sync_deck(self.deck, get_word_index(self.locale), self.selected_themes)
+            try:
+                dealt = deal(config, self.deck)
+            except ConfigError as e:
+                raise RoomError(e.key) from e
+
+            self.players = players
+            self.seats = {name: seat for seat, name in enumerate(players)}
+            self.impostor_indices = dealt.impostors
+            self.start_index = dealt.reveal_order[0]
+            self.civil_word = dealt.civil_word
+            self.impostor_hint = dealt.impostor_hint
+            self.decoy_word = dealt.decoy_word
+            self.theme_name = dealt.theme_name
+            self.countdown_started_at = None
+            self.tally = VoteTally(len(players))
+            self.last_result = None
+            self.phase = ROOM_REVEAL
+            self.round += 1
+            self._changed()
+
+            record_game(
+                players=players,
+                impostor_indices=dealt.impostors,
+                theme=dealt.theme_name,
+                word=dealt.civil_word,
+                hint=dealt.impostor_hint,
+                start_index=self.start_index,
+                countdown_seconds=self.countdown_seconds,
+                source="room",
+                seed=dealt.seed,
+            )
+
+    def start_timer(self) -> None:
+        with self.lock:
+            if self.phase != ROOM_REVEAL:
+                return
+            self.countdown_started_at = time.time()
+            self.phase = ROOM_PLAY
+            self._changed()
+
+    def start_vote(self) -> None:
+        with self.lock:
+            if self.phase != ROOM_PLAY:
+                return
+            self.phase = ROOM_VOTE
+            self._changed()
+
+    def vote(self, token: str, target: int) -> None:
+        """
+        Apunta (o cambia) el voto de un jugador. No sube la versión: con
+        cientos de votantes cada voto haría redibujar todos los móviles.
+        El progreso se consulta aparte (`tally.votes_cast`) y la sala sólo
+        cambia de versión al cerrar la votación.
+        """
+        with self.lock:
+            if self.phase != ROOM_VOTE or self.seat_of(token) is None:
+                return
+            self.tally.cast(token, target)
+            self.touched_at = time.time()
+            if self.tally.votes_cast >= len(self.players):
+                self._close_vote()
+
+    def close_vote(self) -> None:
+        with self.lock:
+            if self.phase == ROOM_VOTE:
+                self._close_vote()
+
+    def _close_vote(self) -> None:
+        """Reparte los puntos de la ronda y vuelve al lobby: llamar con el lock cogido."""
+        voter_seats = {token: self.seat_of(token) for token in self.tally.ballots}
+        result = self.tally.result(self.impostor_indices, voter_seats)
+        self.leaderboard.apply(self.players, result)
+        record_outcome(self.theme_name, self.civil_word, result.impostors_won, self.locale)
+        self.last_result = result
+        self.phase = ROOM_LOBBY
+        self.countdown_started_at = None
+        self._changed()
+
+    def end_round(self) -> None:
+        with self.lock:
+            if self.phase == ROOM_LOBBY:
+                return
+            self.phase = ROOM_LOBBY
+            self.countdown_started_at = None
+            self._changed()
+
+
+class RoomRegistry:
+    """Registro de salas del proceso, seguro entre hilos."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rooms: Dict[str, Room] = {}
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def _new_code(self) -> str:
+        while True:
+            code = "".join(random.choices(CODE_ALPHABET, k=CODE_LENGTH))
+            if code not in self._rooms:
+                return code
+
+    def _purge_idle(self) -> None:
+        limit = time.time() - ROOM_TTL_SECONDS
+        for code in [c for c, room in self._rooms.items() if room.touched_at < limit]:
+            del self._rooms[code]
+
+    def create(self, token: str, host_name: str, locale: str = DEFAULT_LOCALE) -> Room:
+        host_name = (host_name or "").strip()
+        if not host_name:
+            raise RoomError("room.error.name_to_create")
+        with self._lock:
+            self._purge_idle()
+            room = Room(self._new_code(), token, host_name, locale)
+            self._rooms[room.code] = room
+            return room
+
+    def get(self, code: str) -> Optional[Room]:
+        return self._rooms.get((code or "").strip().upper())
+
+    def join(self, code: str, token: str, name: str) -> Room:
+        room = self.get(code)
+        if room is None:
+            raise RoomError("room.error.not_found")
+        room.join(token, name)
+        return room
+
+    def leave(self, code: str, token: str) -> None:
+        room = self.get(code)
+        if room is None:
+            return
+        room.leave(token)
+        if not room.members:
+            with self._lock:
+                self._rooms.pop(room.code, None)
+
+
+_registry: Optional[RoomRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_room_registry() -> RoomRegistry:
+    """Registro único por proceso, compartido por todas las sesiones."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RoomRegistry()
+    return _registry
+
+
+def new_member_token() -> str:
+    return secrets.token_urlsafe(16)
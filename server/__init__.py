@@ -0,0 +1,4 @@
+"""
+Servidor de salas opcional con asyncio y WebSocket (sólo biblioteca
+estándar), alternativo a la interfaz de Streamlit. Ver `server.app`.
+"""
@@ -0,0 +1,425 @@
+"""
+Servidor de salas con asyncio: la misma partida que `views.room_view`,
+sin reruns de Streamlit.
+
+Un proceso, un bucle de eventos y una corrutina por conexión que sólo
+espera el siguiente mensaje: una conexión ociosa no cuesta CPU y ocupa
+unos pocos KB, así que caben miles por proceso. Las salas son las de
+`rooms` (mismo registro, mismas reglas y diccionarios). Cada vez que una
+sala cambia de versión se manda a sus conexiones sólo lo que ha cambiado
+desde lo último que recibieron; la diferencia se calcula y se codifica
+una vez por grupo de conexiones que estaban en la misma versión.
+
+Protocolo (JSON sobre WebSocket en /ws):
+
+    -> {"op": "create", "name": "Ana", "locale": "es"}
+    -> {"op": "join", "code": "ABCD", "name": "Luis"}
+    -> {"op": "resume", "code": "ABCD", "token": "..."}     (reconectar)
+    -> {"op": "configure", "num_impostors": 2, "selected_themes": [...], ...}
+    -> {"op": "start"} | {"op": "role"} | {"op": "timer"} | {"op": "vote", "target": 3}
+    -> {"op": "close_vote"} | {"op": "end"} | {"op": "leave"}
+    <- {"type": "joined", "code": ..., "token": ...}
+    <- {"type": "state", "version": 7, "diff": {...}}   (members: {"+": [...], "-": [...]})
+    <- {"type": "role", ...} | {"type": "error", "key": ..., "message": ...}
+
+Uso:
+
+    python -m server --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from dictionaries.index import WEIGHTING_BY_THEME, WEIGHTING_BY_WORD, get_word_index
+from engine import EngineError
+from i18n import DEFAULT_LOCALE, LOCALES, get_catalog, normalize_locale
+from rooms import (
+    ROOM_LOBBY,
+    Room,
+    RoomError,
+    get_room_registry,
+    new_member_token,
+)
+
+from .websocket import (
+    OP_CLOSE,
+    OP_TEXT,
+    WebSocketError,
+    encode_frame,
+    handshake_response,
+    read_http_head,
+    read_message,
+)
+
+logger = logging.getLogger(__name__)
+
+STREAM_LIMIT = 16 * 1024            # búfer de lectura por conexión
+MAX_WRITE_BUFFER = 256 * 1024       # un cliente que no lee más que esto se desconecta
+LEADERBOARD_SIZE = 10
+
+# Opciones que el anfitrión puede cambiar con "configure", y cómo se leen
+CONFIG_FIELDS = {
+    "num_impostors": int,
+    "hint_for_impostors": bool,
+    "decoy_words": bool,
+    "countdown_seconds": lambda value: max(60, min(int(value), 600)),
+    "word_weighting": lambda value: WEIGHTING_BY_WORD if value == WEIGHTING_BY_WORD else WEIGHTING_BY_THEME,
+}
+
+
+def room_snapshot(room: Room) -> Dict[str, Any]:
+    """Lo que ven todos los miembros de una sala (nada secreto)."""
+    players = room.players
+    result = room.last_result
+    return {
+        "code": room.code,
+        "phase": room.phase,
+        "round": room.round,
+        "host": room.members.get(room.host_token),
+        "members": tuple(room.members.values()),
+        "num_impostors": room.num_impostors,
+        "hint_for_impostors": room.hint_for_impostors,
+        "decoy_words": room.decoy_words,
+        "selected_themes": list(room.selected_themes),
+        "word_weighting": room.word_weighting,
+        "countdown_seconds": room.countdown_seconds,
+        "countdown_started_at": room.countdown_started_at,
+        "players": list(players),
+        "first_player": players[room.start_index] if players else None,
+        "last_result": None
+        if result is None
+        else {
+            "accused": [players[i] for i in result.accused],
+            "top_votes": result.top_votes,
+            "impostors_won": result.impostors_won,
+        },
+        "leaderboard": room.leaderboard.top(LEADERBOARD_SIZE),
+    }
+
+
+def snapshot_diff(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Claves que cambian de `old` a `new`; los miembros van como altas y bajas."""
+    if old is None:
+        diff = dict(new)
+        diff["members"] = {"+": list(new["members"]), "-": []}
+        return diff
+    diff = {key: value for key, value in new.items() if key != "members" and old.get(key) != value}
+    if old["members"] != new["members"]:
+        before, after = set(old["members"]), set(new["members"])
+        diff["members"] = {
+            "+": [name for name in new["members"] if name not in before],
+            "-": [name for name in old["members"] if name not in after],
+        }
+    return diff
+
+
+class Connection:
+    __slots__ = ("writer", "token", "code", "locale", "snapshot")
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.token = new_member_token()
+        self.code: Optional[str] = None
+        self.locale = DEFAULT_LOCALE
+        self.snapshot: Optional[Dict[str, Any]] = None  # lo último que se le mandó
+
+    def send(self, frame: bytes) -> None:
+        transport = self.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            transport.abort()
+            return
+        self.writer.write(frame)
+
+    def send_json(self, message: Dict[str, Any]) -> None:
+        self.send(encode_frame(OP_TEXT, json.dumps(message, ensure_ascii=False).encode("utf-8")))
+
+    def send_error(self, key: str) -> None:
+        message = get_catalog(self.locale).get(key) or get_catalog(DEFAULT_LOCALE).get(key, key)
+        self.send_json({"type": "error", "key": key, "message": message})
+
+
+class RoomServer:
+    def __init__(self) -> None:
+        self.registry = get_room_registry()
+        self.connections: Dict[str, Set[Connection]] = {}  # código de sala -> conexiones
+        self.num_connections = 0
+        self.started_at = time.time()
+        # Snapshot de cada sala por versión: se calcula una vez por cambio
+        self._snapshots: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+    # ---------- Difusión ----------
+
+    def _snapshot(self, room: Room) -> Tuple[int, Dict[str, Any]]:
+        cached = self._snapshots.get(room.code)
+        if cached is None or cached[0] != room.version:
+            with room.lock:
+                cached = room.version, room_snapshot(room)
+            self._snapshots[room.code] = cached
+        return cached
+
+    def broadcast(self, room: Room) -> None:
+        """Manda a cada conexión de la sala lo que ha cambiado desde su último estado."""
+        version, snapshot = self._snapshot(room)
+        frames: Dict[int, bytes] = {}
+        for conn in self.connections.get(room.code, ()):
+            if conn.snapshot is snapshot:
+                continue
+            key = id(conn.snapshot)
+            frame = frames.get(key)
+            if frame is None:
+                message = {
+                    "type": "state",
+                    "version": version,
+                    "diff": snapshot_diff(conn.snapshot, snapshot),
+                }
+                frame = encode_frame(OP_TEXT, json.dumps(message, ensure_ascii=False).encode("utf-8"))
+                frames[key] = frame
+            conn.snapshot = snapshot
+            conn.send(frame)
+
+    def _attach(self, conn: Connection, room: Room, old_token: Optional[str] = None) -> None:
+        """
+        Conecta `conn` a `room`. Si venía de otra sala, sale de ella como con
+        "leave": si no, su token seguiría allí como miembro (o anfitrión).
+        """
+        old_code, old_token = conn.code, old_token or conn.token
+        self._detach(conn)
+        conn.code = room.code
+        conn.snapshot = None
+        self.connections.setdefault(room.code, set()).add(conn)
+        conn.send_json({"type": "joined", "code": room.code, "token": conn.token})
+        if old_code is not None and (old_code, old_token) != (room.code, conn.token):
+            self.registry.leave(old_code, old_token)
+            old_room = self.registry.get(old_code)
+            if old_room is not None:
+                self.broadcast(old_room)
+
+    def _detach(self, conn: Connection) -> None:
+        if conn.code is None:
+            return
+        members = self.connections.get(conn.code)
+        if members is not None:
+            members.discard(conn)
+            if not members:
+                del self.connections[conn.code]
+                self._snapshots.pop(conn.code, None)
+        conn.code = None
+
+    # ---------- Operaciones ----------
+
+    def _room_of(self, conn: Connection) -> Room:
+        room = self.registry.get(conn.code or "")
+        if room is None or conn.token not in room.members:
+            raise RoomError("server.error.not_in_room")
+        return room
+
+    def _host_room(self, conn: Connection) -> Room:
+        room = self._room_of(conn)
+        if not room.is_host(conn.token):
+            raise RoomError("server.error.not_host")
+        return room
+
+    def _role(self, conn: Connection, room: Room) -> Dict[str, Any]:
+        """Rol privado de un jugador, como lo enseña `components.role_card`."""
+        seat = room.seat_of(conn.token)
+        if seat is None or room.phase == ROOM_LOBBY:
+            raise RoomError("server.error.no_role")
+        impostor = seat in room.impostor_indices
+        role: Dict[str, Any] = {"type": "role", "round": room.round, "theme": room.theme_name}
+        if impostor and room.decoy_word:
+            # En el modo infiltrado el impostor no sabe que lo es
+            role.update(impostor=False, word=room.decoy_word)
+        elif impostor:
+            role.update(impostor=True, hint=room.impostor_hint)
+        else:
+            role.update(impostor=False, word=room.civil_word)
+        return role
+
+    async def handle(self, conn: Connection, message: Dict[str, Any]) -> None:
+        op = message.get("op")
+        registry = self.registry
+
+        if op == "create":
+            conn.locale = normalize_locale(str(message.get("locale") or "")) or DEFAULT_LOCALE
+            room = registry.create(conn.token, str(message.get("name") or ""), conn.locale)
+            self._attach(conn, room)
+        elif op == "join":
+            room = registry.join(str(message.get("code") or ""), conn.token, str(message.get("name") or ""))
+            conn.locale = normalize_locale(str(message.get("locale") or "")) or room.locale
+            self._attach(conn, room)
+        elif op == "resume":
+            room = registry.get(str(message.get("code") or ""))
+            token = str(message.get("token") or "")
+            if room is None or token not in room.members:
+                raise RoomError("room.error.not_found")
+            old_token, conn.token = conn.token, token
+            self._attach(conn, room, old_token)
+        elif op == "configure":
+            room = self._host_room(conn)
+            options = {}
+            for key, kind in CONFIG_FIELDS.items():
+                if key in message:
+                    options[key] = kind(message[key])
+            if "selected_themes" in message:
+                known = set(get_word_index(room.locale).theme_names)
+                options["selected_themes"] = tuple(
+                    name for name in message["selected_themes"] if name in known
+                )
+            room.configure(**options)
+        elif op == "start":
+            room = self._host_room(conn)
+            # Repartir puede cargar diccionarios o calcular vecinas: fuera del bucle
+            await asyncio.get_running_loop().run_in_executor(None, room.start_game)
+        elif op == "role":
+            conn.send_json(self._role(conn, self._room_of(conn)))
+            return
+        elif op == "timer":
+            self._host_room(conn).start_timer()
+        elif op == "start_vote":
+            self._host_room(conn).start_vote()
+        elif op == "vote":
+            room = self._room_of(conn)
+            target = int(message.get("target", -1))
+            if not 0 <= target < len(room.players):
+                raise RoomError("server.error.bad_request")
+            room.vote(conn.token, target)
+        elif op == "close_vote":
+            self._host_room(conn).close_vote()
+        elif op == "end":
+            self._host_room(conn).end_round()
+        elif op == "leave":
+            room = self._room_of(conn)
+            self._detach(conn)
+            registry.leave(room.code, conn.token)
+            conn.send_json({"type": "left"})
+            if registry.get(room.code) is not None:
+                self.broadcast(room)
+            return
+        else:
+            raise RoomError("server.error.bad_request")
+
+        self.broadcast(self._room_of(conn))
+
+    # ---------- Conexiones ----------
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request, headers = await read_http_head(reader)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+
+        path = request.split(" ")[1] if request.count(" ") >= 2 else "/"
+        key = headers.get("sec-websocket-key")
+        if path == "/ws" and key and headers.get("upgrade", "").lower() == "websocket":
+            writer.write(handshake_response(key))
+            await self._websocket(reader, writer)
+        else:
+            self._http(writer, path)
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    def _http(self, writer: asyncio.StreamWriter, path: str) -> None:
+        if path == "/health":
+            status = "200 OK"
+            body = json.dumps(
+                {
+                    "rooms": len(self.registry),
+                    "connections": self.num_connections,
+                    "uptime": round(time.time() - self.started_at, 1),
+                }
+            ).encode("utf-8")
+        else:
+            status, body = "404 Not Found", b"{}"
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+            + body
+        )
+
+    async def _websocket(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = Connection(writer)
+        self.num_connections += 1
+        try:
+            while True:
+                text = await read_message(reader, writer)
+                if text is None:
+                    break  # read_message ya ha contestado al cierre
+                try:
+                    message = json.loads(text)
+                    if not isinstance(message, dict):
+                        raise ValueError(text)
+                    await self.handle(conn, message)
+                except EngineError as e:
+                    conn.send_error(e.key)
+                except (ValueError, TypeError):
+                    conn.send_error("server.error.bad_request")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except (WebSocketError, UnicodeDecodeError):
+            # 1002: error de protocolo
+            writer.write(encode_frame(OP_CLOSE, (1002).to_bytes(2, "big")))
+        finally:
+            # Desconectarse no es salir de la sala: se puede volver con "resume"
+            self._detach(conn)
+            self.num_connections -= 1
+
+
+def raise_fd_limit() -> int:
+    """Sube el límite de descriptores abiertos al máximo permitido (Unix)."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            soft = hard
+        except (ValueError, OSError):
+            pass
+    return soft
+
+
+async def serve(host: str, port: int, ready: Optional[asyncio.Event] = None) -> None:
+    server = RoomServer()
+    listener = await asyncio.start_server(
+        server.serve_connection, host, port, limit=STREAM_LIMIT, backlog=4096
+    )
+    logger.info("Servidor de salas en %s", ", ".join(str(s.getsockname()) for s in listener.sockets))
+    if ready is not None:
+        ready.set()
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Servidor de salas (asyncio, WebSocket)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    limit = raise_fd_limit()
+    # Los diccionarios se cargan antes de aceptar conexiones
+    for locale in LOCALES:
+        get_word_index(locale)
+    logger.info("Límite de descriptores: %s", limit)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Cliente mínimo del servidor de salas: para el simulador de carga, pruebas
+o cualquier frontend en Python. Mantiene el estado de la sala aplicando
+las diferencias que manda el servidor.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from .websocket import OP_CLOSE, OP_TEXT, client_handshake, encode_frame, read_message
+
+
+def apply_diff(state: Dict[str, Any], diff: Dict[str, Any]) -> None:
+    """Aplica un {"type": "state"} del servidor sobre el estado local."""
+    for key, value in diff.items():
+        if key == "members":
+            gone = set(value["-"])
+            state["members"] = [m for m in state.get("members", []) if m not in gone] + value["+"]
+        else:
+            state[key] = value
+
+
+class RoomClient:
+    __slots__ = ("reader", "writer", "state", "token", "code", "received", "received_bytes")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.state: Dict[str, Any] = {}
+        self.token: Optional[str] = None
+        self.code: Optional[str] = None
+        self.received = 0
+        self.received_bytes = 0
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "RoomClient":
+        reader, writer = await asyncio.open_connection(host, port, limit=64 * 1024)
+        await client_handshake(reader, writer, f"{host}:{port}")
+        return cls(reader, writer)
+
+    async def send(self, op: str, **fields) -> None:
+        payload = json.dumps({"op": op, **fields}, ensure_ascii=False).encode("utf-8")
+        self.writer.write(encode_frame(OP_TEXT, payload, mask=True))
+        await self.writer.drain()
+
+    async def recv(self) -> Optional[Dict[str, Any]]:
+        """Siguiente mensaje (ya aplicado al estado si es de estado), o None si se cierra."""
+        text = await read_message(self.reader, self.writer, mask=True)
+        if text is None:
+            return None
+        self.received += 1
+        self.received_bytes += len(text)
+        message = json.loads(text)
+        kind = message.get("type")
+        if kind == "state":
+            self.state["version"] = message["version"]
+            apply_diff(self.state, message["diff"])
+        elif kind == "joined":
+            self.token, self.code = message["token"], message["code"]
+        return message
+
+    async def expect(self, kind: str) -> Dict[str, Any]:
+        """Lee mensajes hasta uno del tipo dado (los errores se lanzan)."""
+        while True:
+            message = await self.recv()
+            if message is None:
+                raise ConnectionError("el servidor ha cerrado la conexión")
+            if message.get("type") == kind:
+                return message
+            if message.get("type") == "error":
+                raise RuntimeError(message["key"])
+
+    async def wait_for(self, key: str, value: Any) -> None:
+        """Lee mensajes hasta que el estado de la sala tenga state[key] == value."""
+        while self.state.get(key) != value:
+            if await self.recv() is None:
+                raise ConnectionError("el servidor ha cerrado la conexión")
+
+    async def close(self) -> None:
+        try:
+            self.writer.write(encode_frame(OP_CLOSE, b"", mask=True))
+            await self.writer.drain()
+            self.writer.close()
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
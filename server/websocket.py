@@ -0,0 +1,144 @@
+"""
+WebSocket mínimo (RFC 6455) sobre los streams de asyncio, sin dependencias.
+
+Sólo lo que necesita el servidor de salas: el saludo HTTP, mensajes de
+texto (también fragmentados), ping/pong y cierre. El mismo código sirve
+para el lado cliente (los clientes enmascaran lo que envían).
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_MESSAGE = 64 * 1024  # nadie necesita más para un mensaje de sala
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+class WebSocketError(Exception):
+    """Trama mal formada, demasiado grande o cierre inesperado."""
+
+
+def accept_key(key: str) -> str:
+    digest = hashlib.sha1((key + GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+async def read_http_head(reader: asyncio.StreamReader) -> Tuple[str, Dict[str, str]]:
+    """Primera línea y cabeceras (en minúsculas) de una petición o respuesta HTTP."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+def handshake_response(key: str) -> bytes:
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+    ).encode("ascii")
+
+
+async def client_handshake(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, path: str = "/ws"
+) -> None:
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    writer.write(
+        (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        ).encode("ascii")
+    )
+    await writer.drain()
+    status, headers = await read_http_head(reader)
+    if " 101 " not in status or headers.get("sec-websocket-accept") != accept_key(key):
+        raise WebSocketError(f"saludo rechazado: {status}")
+
+
+def _mask(payload: bytes, key: bytes) -> bytes:
+    # XOR con la clave repetida, de una vez con enteros grandes
+    n = len(payload)
+    if not n:
+        return payload
+    repeated = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(n, "big")
+
+
+def encode_frame(opcode: int, payload: bytes = b"", mask: bool = False) -> bytes:
+    """Trama completa (FIN=1). Los clientes deben enviar con mask=True."""
+    n = len(payload)
+    first = 0x80 | opcode
+    mask_bit = 0x80 if mask else 0
+    if n < 126:
+        header = struct.pack("!BB", first, mask_bit | n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", first, mask_bit | 126, n)
+    else:
+        header = struct.pack("!BBQ", first, mask_bit | 127, n)
+    if not mask:
+        return header + payload
+    key = os.urandom(4)
+    return header + key + _mask(payload, key)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Tuple[bool, int, bytes]:
+    first, second = await reader.readexactly(2)
+    fin, opcode = bool(first & 0x80), first & 0x0F
+    n = second & 0x7F
+    if n == 126:
+        (n,) = struct.unpack("!H", await reader.readexactly(2))
+    elif n == 127:
+        (n,) = struct.unpack("!Q", await reader.readexactly(8))
+    if n > MAX_MESSAGE:
+        raise WebSocketError(f"trama de {n} bytes")
+    key = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(n)
+    return fin, opcode, _mask(payload, key) if key else payload
+
+
+async def read_message(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, mask: bool = False
+) -> Optional[str]:
+    """
+    Siguiente mensaje de texto, o None si el otro lado cierra. Responde él
+    mismo a los ping y junta los fragmentos.
+    """
+    parts = []
+    size = 0
+    while True:
+        fin, opcode, payload = await _read_frame(reader)
+        if opcode == OP_PING:
+            writer.write(encode_frame(OP_PONG, payload, mask))
+            continue
+        if opcode == OP_PONG:
+            continue
+        if opcode == OP_CLOSE:
+            writer.write(encode_frame(OP_CLOSE, payload[:2], mask))
+            return None
+        if opcode not in (OP_TEXT, OP_BINARY, OP_CONTINUATION):
+            raise WebSocketError(f"opcode {opcode:#x}")
+        size += len(payload)
+        if size > MAX_MESSAGE:
+            raise WebSocketError(f"mensaje de más de {MAX_MESSAGE} bytes")
+        parts.append(payload)
+        if fin:
+            return b"".join(parts).decode("utf-8")
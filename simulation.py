@@ -0,0 +1,264 @@
+"""
+Simulador Monte Carlo de la equidad del sorteo.
+
+Reproduce con NumPy, por lotes, los mismos pasos que `start_game`
+(repartir impostores, elegir jugador de inicio y sacar temática y
+palabra con `ThemeSampler`) millones de veces, y compara las frecuencias
+con las esperadas con un test chi-cuadrado:
+
+    python simulation.py --games 2000000 --players 8 --impostors 2
+    python simulation.py --weighting word --themes "🦁 Animales" "🍔 Comida"
+
+También se puede usar desde código (p. ej. en tests) con `simulate()`.
+La baraja sin repetición no se simula: por construcción saca cada
+palabra exactamente una vez por vuelta.
+"""
+
+import argparse
+import math
+import sys
+import time
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from dictionaries.index import WEIGHTING_BY_THEME, WEIGHTING_BY_WORD, get_theme_sampler, get_word_index
+from i18n import DEFAULT_LOCALE, LOCALES
+
+DEFAULT_BATCH_SIZE = 250_000
+
+
+class ChiSquare(NamedTuple):
+    statistic: float
+    dof: int
+    p_value: float
+
+
+class SimulationReport(NamedTuple):
+    num_games: int
+    num_players: int
+    num_impostors: int
+    weighting: str
+    seconds: float
+    theme_names: List[str]
+    theme_counts: Any  # np.ndarray, partidas por temática
+    theme_expected: Any  # np.ndarray, probabilidad esperada por temática
+    word_names: List[str]  # "temática / palabra"
+    word_counts: Any  # np.ndarray, partidas por palabra
+    word_expected: Any  # np.ndarray, probabilidad esperada por palabra
+    seat_counts: Any  # np.ndarray, veces que cada asiento fue impostor
+    start_counts: Any  # np.ndarray, veces que cada asiento empezó
+    theme_chi2: ChiSquare
+    word_chi2: ChiSquare
+    word_chi2_uniform: ChiSquare  # frente a "todas las palabras igual de probables"
+    seat_chi2: ChiSquare
+    start_chi2: ChiSquare
+
+
+def chi_square(counts, expected_probs) -> ChiSquare:
+    """
+    Test chi-cuadrado de bondad de ajuste.
+
+    El p-valor usa la aproximación de Wilson-Hilferty (sin SciPy), que va
+    sobrada para los grados de libertad con los que trabajamos.
+    """
+    import numpy as np
+
+    counts = np.asarray(counts, dtype=np.float64)
+    expected = np.asarray(expected_probs, dtype=np.float64) * counts.sum()
+    mask = expected > 0
+    statistic = float((((counts - expected) ** 2)[mask] / expected[mask]).sum())
+    dof = int(mask.sum()) - 1
+    if dof <= 0:
+        return ChiSquare(statistic, dof, 1.0)
+    z = ((statistic / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return ChiSquare(statistic, dof, 0.5 * math.erfc(z / math.sqrt(2)))
+
+
+def _draw_words(rng, sampler, weighting: str, size: int):
+    """Versión vectorizada de ThemeSampler.draw: ids globales de palabra."""
+    import numpy as np
+
+    starts = np.frombuffer(sampler.starts, dtype=np.uint32).astype(np.int64)
+    sizes = np.frombuffer(sampler.sizes, dtype=np.uint32).astype(np.int64)
+    slots = rng.integers(len(sizes), size=size)
+    if weighting == WEIGHTING_BY_WORD:
+        prob, alias = sampler.alias_tables()
+        prob = np.frombuffer(prob, dtype=np.float64)
+        alias = np.frombuffer(alias, dtype=np.uint32)
+        swap = rng.random(size) >= prob[slots]
+        slots[swap] = alias[slots[swap]]
+    offsets = (rng.random(size) * sizes[slots]).astype(np.int64)
+    return starts[slots] + offsets
+
+
+def _draw_impostor_seats(rng, num_players: int, num_impostors: int, size: int):
+    """k asientos distintos por partida: los k menores de n claves aleatorias."""
+    import numpy as np
+
+    if num_impostors == num_players:
+        return np.broadcast_to(np.arange(num_players), (size, num_players))
+    keys = rng.random((size, num_players))
+    return np.argpartition(keys, num_impostors - 1, axis=1)[:, :num_impostors]
+
+
+def simulate(
+    num_games: int,
+    num_players: int = 8,
+    num_impostors: int = 1,
+    selected_themes: Optional[Sequence[str]] = None,
+    weighting: str = WEIGHTING_BY_THEME,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    locale: str = DEFAULT_LOCALE,
+) -> SimulationReport:
+    """Simula `num_games` partidas y devuelve frecuencias y tests chi-cuadrado."""
+    import numpy as np
+
+    index = get_word_index(locale)
+    if selected_themes is None:
+        selected_themes = index.theme_names
+    sampler = get_theme_sampler(selected_themes, locale)
+    if not sampler:
+        raise ValueError("Las temáticas seleccionadas no tienen palabras")
+    if not 1 <= num_impostors <= num_players:
+        raise ValueError("El número de impostores tiene que estar entre 1 y el de jugadores")
+
+    rng = np.random.default_rng(seed)
+    starts = np.frombuffer(sampler.starts, dtype=np.uint32).astype(np.int64)
+    sizes = np.frombuffer(sampler.sizes, dtype=np.uint32).astype(np.int64)
+    total_words = int(sizes.sum())
+
+    # Las palabras de las temáticas elegidas, numeradas 0..total_words-1
+    local_of = np.full(len(index), -1, dtype=np.int64)
+    word_ids = np.concatenate([np.arange(s, s + n) for s, n in zip(starts, sizes)])
+    local_of[word_ids] = np.arange(total_words)
+    theme_of_local = np.repeat(np.arange(len(sizes)), sizes)
+
+    word_counts = np.zeros(total_words, dtype=np.int64)
+    seat_counts = np.zeros(num_players, dtype=np.int64)
+    start_counts = np.zeros(num_players, dtype=np.int64)
+
+    began = time.perf_counter()
+    done = 0
+    while done < num_games:
+        size = min(batch_size, num_games - done)
+        seats = _draw_impostor_seats(rng, num_players, num_impostors, size)
+        seat_counts += np.bincount(seats.ravel(), minlength=num_players)
+        start_counts += np.bincount(rng.integers(num_players, size=size), minlength=num_players)
+        words = local_of[_draw_words(rng, sampler, weighting, size)]
+        word_counts += np.bincount(words, minlength=total_words)
+        done += size
+    seconds = time.perf_counter() - began
+
+    theme_counts = np.bincount(theme_of_local, weights=word_counts, minlength=len(sizes))
+    if weighting == WEIGHTING_BY_WORD:
+        theme_expected = sizes / total_words
+    else:
+        theme_expected = np.full(len(sizes), 1 / len(sizes))
+    word_expected = theme_expected[theme_of_local] / sizes[theme_of_local]
+    uniform_words = np.full(total_words, 1 / total_words)
+    uniform_seats = np.full(num_players, 1 / num_players)
+
+    theme_names = [index.theme_names[t] for t in sampler.theme_ids]
+    word_names = [
+        f"{index.theme_names[index.word_theme[w]]} / {index.words[w]}" for w in word_ids.tolist()
+    ]
+    return SimulationReport(
+        num_games=num_games,
+        num_players=num_players,
+        num_impostors=num_impostors,
+        weighting=weighting,
+        seconds=seconds,
+        theme_names=theme_names,
+        theme_counts=theme_counts,
+        theme_expected=theme_expected,
+        word_names=word_names,
+        word_counts=word_counts,
+        word_expected=word_expected,
+        seat_counts=seat_counts,
+        start_counts=start_counts,
+        theme_chi2=chi_square(theme_counts, theme_expected),
+        word_chi2=chi_square(word_counts, word_expected),
+        word_chi2_uniform=chi_square(word_counts, uniform_words),
+        seat_chi2=chi_square(seat_counts, uniform_seats),
+        start_chi2=chi_square(start_counts, uniform_seats),
+    )
+
+
+def _chi2_line(label: str, chi2: ChiSquare) -> str:
+    return f"  {label:<32} chi2={chi2.statistic:12.1f}  gl={chi2.dof:6d}  p={chi2.p_value:.4f}"
+
+
+def format_report(report: SimulationReport, top: int = 5) -> str:
+    """Resumen legible del informe."""
+    import numpy as np
+
+    n = report.num_games
+    lines = [
+        f"{n:,} partidas simuladas en {report.seconds:.2f} s "
+        f"({n / max(report.seconds, 1e-9):,.0f} partidas/s), "
+        f"{report.num_players} jugadores, {report.num_impostors} impostor(es), "
+        f"reparto por {'palabra' if report.weighting == WEIGHTING_BY_WORD else 'temática'}",
+        "",
+        "Tests chi-cuadrado (p pequeño = no cuadra con lo esperado):",
+        _chi2_line("temáticas vs esperado", report.theme_chi2),
+        _chi2_line("palabras vs esperado", report.word_chi2),
+        _chi2_line("palabras vs todas iguales", report.word_chi2_uniform),
+        _chi2_line("asientos impostores vs uniforme", report.seat_chi2),
+        _chi2_line("jugador inicial vs uniforme", report.start_chi2),
+        "",
+        "Temáticas (frecuencia observada / esperada):",
+    ]
+    for name, count, expected in zip(report.theme_names, report.theme_counts, report.theme_expected):
+        lines.append(f"  {count / n:8.4%}  {expected:8.4%}  {name}")
+
+    probs = report.word_counts / n
+    ratio = probs * len(probs)  # 1.0 = lo que tocaría si todas fueran igual de probables
+    order = np.argsort(ratio)
+    lines += ["", "Palabras más y menos frecuentes (veces la media):"]
+    for i in list(order[::-1][:top]) + list(order[:top]):
+        lines.append(f"  {ratio[i]:6.2f}x  {probs[i]:8.5%}  {report.word_names[i]}")
+
+    expected_seat = n * report.num_impostors / report.num_players
+    lines += ["", "Asientos (impostor / inicio, relativo a lo esperado):"]
+    for seat, (imp, first) in enumerate(zip(report.seat_counts, report.start_counts)):
+        lines.append(
+            f"  {seat + 1:4d}  {imp / expected_seat:6.3f}  {first / (n / report.num_players):6.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Simulador de equidad del sorteo de ImpostorApp")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=8)
+    parser.add_argument("--impostors", type=int, default=1)
+    parser.add_argument("--weighting", choices=(WEIGHTING_BY_THEME, WEIGHTING_BY_WORD), default=WEIGHTING_BY_THEME)
+    parser.add_argument("--themes", nargs="*", help="temáticas (por defecto, todas)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--locale", choices=sorted(LOCALES), default=DEFAULT_LOCALE)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--top", type=int, default=5, help="palabras a mostrar por cada extremo")
+    args = parser.parse_args(argv)
+
+    try:
+        report = simulate(
+            args.games,
+            num_players=args.players,
+            num_impostors=args.impostors,
+            selected_themes=args.themes or None,
+            weighting=args.weighting,
+            seed=args.seed,
+            batch_size=args.batch_size,
+            locale=args.locale,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    print(format_report(report, top=args.top))
+
+    # Código de salida útil en CI: 1 si algo no cuadra con lo que debería
+    checks = (report.theme_chi2, report.word_chi2, report.seat_chi2, report.start_chi2)
+    sys.exit(1 if any(c.p_value < 0.001 for c in checks) else 0)
+
+
+if __name__ == "__main__":
+    main()
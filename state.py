@@ -1,5 +1,9 @@
 import streamlit as st
 
+from checkpoints import discard_checkpoint
+from game_state import GameState
+from voting import Leaderboard
+
 
 def safe_rerun() -> None:
     """Intento seguro de forzar un rerun, compatible con versiones antiguas."""
@@ -13,36 +17,66 @@ def safe_rerun() -> None:
             pass
 
 
+def get_fragment_decorator():
+    """Devuelve st.fragment (o st.experimental_fragment), o None si no existe."""
+    return getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
 def init_session_state() -> None:
     """Inicializa todas las claves necesarias en session_state (si no existen)."""
     defaults = {
-        "phase": "config",         # "config" -> "reveal" -> "ready" -> "play"
+        "game": GameState(),       # partida en curso: fase, roles, palabra... (ver game_state.py)
         # Empezamos con 5 jugadores por defecto, se pueden borrar
         "players": [f"Jugador {i}" for i in range(1, 11)],  # Jugador 1 .. Jugador 8
+        "player_keys": None,       # nombres normalizados (ver components.players_section)
+        "players_rev": 0,          # sube con cada cambio de la lista de jugadores
         "num_impostors": 1,        # número de impostores
-        "impostor_indices": [],    # índices de jugadores impostores
-        "reveal_order": [],        # orden en el que se revelan los roles
-        "reveal_pos": 0,           # posición actual en reveal_order
-        "is_revealed": False,      # si el jugador actual está viendo su rol
-        "civil_word": "",
-        "impostor_hint": None,
-        "theme_name": None,
         "hint_for_impostors": True,
+        "decoy_words": False,      # modo infiltrado: otra palabra parecida en vez de pista
         "selected_themes": [],     # temáticas elegidas para la partida
+        "themes_rev": 0,           # sube con cada acción en bloque del selector de temáticas
+        "word_weighting": "theme", # "theme" (temática y luego palabra) o "word" (uniforme)
+        "no_repeat_words": True,   # robar de una baraja sin repetir palabras
+        "adaptive_words": False,   # pesos según resultados (ver dictionaries.adaptive)
+        "word_deck": None,         # baraja de la sesión (dictionaries.deck.WordDeck)
+        "tournament_mode": False,  # jugar una serie de rondas con calendario (ver tournament.py)
+        "tournament_rounds": 10,   # rondas del torneo
+        "tournament": None,        # torneo en curso (tournament.Tournament)
+        "vote_tally": None,        # votación en curso (voting.VoteTally)
+        "vote_result": None,       # resultado de la última votación cerrada
+        "leaderboard": Leaderboard(),  # puntos acumulados de la sesión
+        "locale": None,            # idioma de la sesión; None = detectarlo (ver i18n.get_locale)
 
         # Temporizador
         "countdown_seconds": 180,      # 3 minutos por defecto
-        "countdown_started_at": None,  # se rellena al entrar en la pantalla final
+        "timer_mode": "client",        # "client" (cuenta atrás en el navegador) o "server"
+
+        # Salas multi-dispositivo (ver rooms.py)
+        "room_code": None,         # código de la sala en la que estamos
+        "room_token": None,        # identifica a esta sesión dentro de la sala
+        "room_seen_version": -1,   # última versión de la sala que hemos dibujado
+        "room_revealed_round": -1, # ronda de la sala cuyo rol estamos mostrando
+
+        # Checkpoints en disco (ver checkpoints.py)
+        "checkpoint_token": None,  # token de ?partida= de la partida en curso
+        "checkpoint_saved": None,  # último estado guardado (GameState.to_bytes)
     }
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
 
 
+def get_game() -> GameState:
+    """Estado de la partida de esta sesión."""
+    return st.session_state.game
+
+
 def reset_to_menu() -> None:
     """
     Reseteo “duro”: se usa sólo en errores gordos o fase rara.
     No se usa para el botón normal de volver al menú.
     """
+    # Que no se vuelva a recuperar del checkpoint la partida que ha fallado
+    discard_checkpoint()
     st.session_state.clear()
     init_session_state()
@@ -1,10 +1,27 @@
+import importlib
+
 import streamlit as st
 
-from state import init_session_state, reset_to_menu
-from views.config_view import render_config_screen
-from views.reveal_view import render_reveal_screen
-from views.ready_view import render_ready_screen
-from views.play_view import render_play_screen
+from checkpoints import resume_from_query, sync_checkpoint
+from game_state import PHASE_CONFIG, PHASE_ROOM
+from metrics import start_exporters, track_rerun
+from state import get_game, init_session_state, reset_to_menu
+
+# Cada vista se importa la primera vez que alguien llega a su fase, así un
+# proceso nuevo sólo paga la pantalla de configuración para el primer render.
+SCREENS = {
+    "config": ("views.config_view", "render_config_screen"),
+    "reveal": ("views.reveal_view", "render_reveal_screen"),
+    "ready": ("views.ready_view", "render_ready_screen"),
+    "play": ("views.play_view", "render_play_screen"),
+    "vote": ("views.vote_view", "render_vote_screen"),
+    "room": ("views.room_view", "render_room_screen"),
+}
+
+
+def render_screen(phase: str) -> None:
+    module_name, func_name = SCREENS[phase]
+    getattr(importlib.import_module(module_name), func_name)()
 
 
 st.set_page_config(
@@ -23,13 +40,6 @@ st.markdown(
         transform: translateX(-50%);
         width: auto !important;
     }
-
-    /* Centrar el contenedor del gráfico de Plotly (el donut) */
-    .stPlotlyChart {
-        display: block;
-        margin-left: auto !important;
-        margin-right: auto !important;
-    }
     </style>
     """,
     unsafe_allow_html=True,
@@ -39,16 +49,20 @@ st.markdown(
 
 init_session_state()
 
-phase = st.session_state.phase
-
-if phase == "config":
-    render_config_screen()
-elif phase == "reveal":
-    render_reveal_screen()
-elif phase == "ready":
-    render_ready_screen()
-elif phase == "play":
-    render_play_screen()
-else:
-    reset_to_menu()
-    render_config_screen()
+# Partida guardada en disco: ?partida=TOKEN (ver checkpoints.py)
+resume_from_query()
+
+# Enlace directo a una sala: ?sala=CODIGO
+if st.query_params.get("sala") and get_game().phase == PHASE_CONFIG:
+    get_game().go(PHASE_ROOM)
+
+sync_checkpoint()
+phase = get_game().phase
+start_exporters()
+
+with track_rerun(phase):
+    if phase in SCREENS:
+        render_screen(phase)
+    else:
+        reset_to_menu()
+        render_screen("config")
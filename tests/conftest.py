@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Los módulos de la app se importan desde la raíz del repo, como en `streamlit run`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# La caché de similitud de los tests no se mezcla con la del repo
+os.environ.setdefault("IMPOSTOR_SIMILARITY_DIR", tempfile.mkdtemp(prefix="impostor-tests-"))
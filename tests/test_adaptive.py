@@ -0,0 +1,92 @@
+import random
+from collections import Counter
+
+import pytest
+
+from dictionaries.adaptive import MIN_BALANCE, RECENT_GAMES, RECENT_PENALTY, AdaptiveWeights
+from dictionaries.index import WEIGHTING_BY_THEME, WEIGHTING_BY_WORD, WordIndex
+
+DRAWS = 20_000
+
+
+def _index(**themes):
+    return WordIndex({name: [{"word": w, "hint": None} for w in words] for name, words in themes.items()})
+
+
+def test_new_words_weigh_the_same():
+    weights = AdaptiveWeights(_index(A=["a1", "a2"], B=["b1"]))
+    assert [weights.weight_of(i) for i in range(3)] == [1.0, 1.0, 1.0]
+    assert weights.theme_weight(0) == pytest.approx(2.0)
+    assert weights.theme_weight(1) == pytest.approx(1.0)
+
+
+def test_one_sided_words_lose_weight():
+    weights = AdaptiveWeights(_index(A=["fácil", "justa"]))
+    for _ in range(20):
+        weights.record_outcome(0, impostor_won=False)
+    for impostor_won in (True, False) * 10:
+        weights.record_outcome(1, impostor_won)
+    assert MIN_BALANCE < weights.weight_of(0) < 0.5
+    assert weights.weight_of(1) > 0.95
+    assert weights.theme_weight(0) == pytest.approx(weights.weight_of(0) + weights.weight_of(1))
+
+
+def test_recent_words_recover_their_weight():
+    weights = AdaptiveWeights(_index(A=[f"a{i}" for i in range(40)]))
+    weights.note_played(0)
+    assert weights.weight_of(0) == pytest.approx(1.0 - RECENT_PENALTY)
+    for word_id in range(1, RECENT_GAMES + 1):
+        weights.note_played(word_id)
+    # Pasadas RECENT_GAMES partidas deja de ser reciente
+    assert weights.weight_of(0) == pytest.approx(1.0)
+    assert weights.weight_of(RECENT_GAMES) < weights.weight_of(1) < 1.0
+    assert weights.theme_weight(0) == pytest.approx(sum(weights.weight_of(i) for i in range(40)))
+
+
+def test_theme_totals_follow_every_update():
+    index = _index(A=[f"a{i}" for i in range(10)], B=[f"b{i}" for i in range(5)])
+    weights = AdaptiveWeights(index)
+    rng = random.Random(2)
+    for _ in range(500):
+        word_id = rng.randrange(len(index))
+        if rng.random() < 0.5:
+            weights.note_played(word_id)
+        else:
+            weights.record_outcome(word_id, rng.random() < 0.3)
+    for theme_id, (start, size) in enumerate(zip(index.theme_start, index.theme_size)):
+        expected = sum(weights.weight_of(i) for i in range(start, start + size))
+        assert weights.theme_weight(theme_id) == pytest.approx(expected)
+
+
+def test_draws_follow_the_weights():
+    weights = AdaptiveWeights(_index(A=["a1", "a2"], B=["b1", "b2", "b3"]))
+    for _ in range(30):
+        weights.record_outcome(0, impostor_won=True)
+    rng = random.Random(0)
+    draws = Counter(weights.draw([0], WEIGHTING_BY_THEME, rng) for _ in range(DRAWS))
+    assert set(draws) == {0, 1}
+    expected = weights.weight_of(0) / weights.theme_weight(0)
+    assert draws[0] / DRAWS == pytest.approx(expected, abs=0.02)
+
+
+def test_weighting_decides_how_themes_are_picked():
+    weights = AdaptiveWeights(_index(A=["a1"], B=["b1", "b2", "b3"], C=[]))
+    rng = random.Random(1)
+    by_theme = Counter(weights.draw([0, 1, 2], WEIGHTING_BY_THEME, rng) for _ in range(DRAWS))
+    by_word = Counter(weights.draw([0, 1, 2], WEIGHTING_BY_WORD, rng) for _ in range(DRAWS))
+    # Por temática A sale la mitad de las veces; por palabra, una de cada cuatro
+    assert by_theme[0] / DRAWS == pytest.approx(0.5, abs=0.02)
+    assert by_word[0] / DRAWS == pytest.approx(0.25, abs=0.02)
+    assert set(by_theme) == set(by_word) == {0, 1, 2, 3}
+    assert weights.draw([2], WEIGHTING_BY_WORD, rng) is None
+    assert weights.draw([], WEIGHTING_BY_THEME, rng) is None
+
+
+def test_stats_survive_a_dictionary_reload():
+    old = AdaptiveWeights(_index(A=["a1", "a2"]))
+    old.record_outcome(1, impostor_won=False)
+    old.note_played(1)
+    new = AdaptiveWeights(_index(A=["nueva", "a1", "a2"]), old)
+    assert new.weight_of(2) == pytest.approx(old.weight_of(1))
+    assert new.weight_of(1) == new.weight_of(0) == 1.0
+    assert new.theme_weight(0) == pytest.approx(2.0 + old.weight_of(1))
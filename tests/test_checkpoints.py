@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import checkpoints
+from checkpoints import CHECKPOINT_DIR_ENV, RESUME_PARAM, CheckpointStore
+from game_state import PHASE_CONFIG, PHASE_REVEAL, GameState
+from roles import ImpostorSet, RevealOrder
+
+APP_FILE = str(Path(__file__).resolve().parent.parent / "test.py")
+TOKEN = "partida-de-prueba-0001"
+PLAYERS = ["Ana", "Luis", "Eva"]
+
+
+def _payload(players=PLAYERS):
+    game = GameState()
+    game.start(ImpostorSet(3, [1]), RevealOrder(2, 3), "Animales", "Perro", "Ladra", seed=9)
+    return {
+        "version": checkpoints._FORMAT_VERSION,
+        "saved_at": 0.0,
+        "game": game.to_dict(),
+        "players": players,
+        "countdown_seconds": 90,
+        "timer_mode": "server",
+    }
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # El almacén del proceso se crea con el directorio de la prueba
+    monkeypatch.setenv(CHECKPOINT_DIR_ENV, str(tmp_path))
+    checkpoints.get_checkpoint_store.clear()
+    yield CheckpointStore(str(tmp_path))
+    checkpoints.get_checkpoint_store.clear()
+
+
+def _app(token):
+    at = AppTest.from_file(APP_FILE)
+    at.query_params[RESUME_PARAM] = token
+    at.run()
+    assert not at.exception
+    return at
+
+
+def test_save_load_delete(store):
+    assert store.load(TOKEN) is None
+    store.save(TOKEN, _payload())
+    assert store.load(TOKEN) == _payload()
+    store.delete(TOKEN)
+    assert store.load(TOKEN) is None
+    store.delete(TOKEN)
+
+
+def test_tokens_from_the_url_are_checked(store):
+    with pytest.raises(ValueError):
+        store.save("../../etc/passwd", _payload())
+    assert store.load("../../etc/passwd") is None
+    assert store.load("corto") is None
+
+
+def test_other_format_versions_are_ignored(store):
+    store.save(TOKEN, dict(_payload(), version=checkpoints._FORMAT_VERSION + 1))
+    assert store.load(TOKEN) is None
+
+
+def test_a_new_session_resumes_from_the_url(store):
+    store.save(TOKEN, _payload())
+    at = _app(TOKEN)
+    game = at.session_state["game"]
+    assert game.phase == PHASE_REVEAL
+    assert game.civil_word == "Perro" and game.current_player() == 2
+    assert at.session_state["players"] == PLAYERS
+    assert at.session_state["countdown_seconds"] == 90
+
+    # Al volver al menú el checkpoint deja de existir
+    game.back_to_config()
+    at.run()
+    assert store.load(TOKEN) is None
+    assert RESUME_PARAM not in at.query_params
+
+
+def test_unknown_tokens_fall_back_to_the_menu(store):
+    at = _app(TOKEN)
+    assert at.session_state["game"].phase == PHASE_CONFIG
+    assert RESUME_PARAM not in at.query_params
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"players": ["Ana"]},
+        {"game": {"phase": "reveal"}},
+        {"countdown_seconds": "mucho"},
+        {"timer_mode": None, "players": None},
+    ],
+)
+def test_invalid_checkpoints_are_dropped(store, changes):
+    store.save(TOKEN, dict(_payload(), **changes))
+    at = _app(TOKEN)
+    assert at.session_state["game"].phase == PHASE_CONFIG
+    assert at.session_state["players"] != PLAYERS
+    assert RESUME_PARAM not in at.query_params
+    assert not (store.directory / f"{TOKEN}.json").exists()
+
+
+def test_unreadable_checkpoints_are_dropped(store):
+    path = store.directory / f"{TOKEN}.json"
+    path.write_text("[1, 2, 3]")
+    at = _app(TOKEN)
+    assert at.session_state["game"].phase == PHASE_CONFIG
+    assert not path.exists()
@@ -0,0 +1,53 @@
+import random
+
+from dictionaries.deck import WordDeck
+from dictionaries.index import WordIndex
+
+
+def _index(**themes):
+    return WordIndex({name: [{"word": w, "hint": None} for w in words] for name, words in themes.items()})
+
+
+def test_each_word_once_per_cycle():
+    index = _index(A=["a1", "a2", "a3"], B=["b1", "b2"])
+    deck = WordDeck(index, ["A", "B"])
+    rng = random.Random(1)
+    for _ in range(3):
+        cycle = [deck.draw(rng) for _ in range(len(deck))]
+        assert sorted(cycle) == list(range(len(index)))
+    assert deck.remaining == 0
+
+
+def test_empty_deck_draws_nothing():
+    deck = WordDeck(_index(A=[]), ["A", "missing"])
+    assert len(deck) == 0
+    assert deck.draw() is None
+
+
+def test_sync_keeps_what_was_played():
+    index = _index(A=["a1", "a2", "a3"], B=["b1", "b2"], C=["c1"])
+    deck = WordDeck(index, ["A", "B"])
+    rng = random.Random(2)
+    played = {deck.draw(rng) for _ in range(3)}
+
+    deck.sync(["A", "C"])
+    theme_a = set(range(3))
+    assert len(deck) == 4
+    # Lo jugado de A sigue jugado; lo de B ha desaparecido
+    assert deck.remaining == 4 - len(played & theme_a)
+    rest = {deck.draw(rng) for _ in range(deck.remaining)}
+    assert rest == (theme_a | {5}) - played
+
+
+def test_rebase_after_reload_remembers_played_words():
+    old = _index(A=["a1", "a2", "a3"])
+    deck = WordDeck(old, ["A"])
+    rng = random.Random(3)
+    first = old.words[deck.draw(rng)]
+
+    new = _index(A=["nueva", "a1", "a2", "a3"])
+    deck = deck.rebase(new)
+    deck.sync(["A"])
+    assert deck.index is new
+    assert deck.remaining == 3
+    assert first not in {new.words[deck.draw(rng)] for _ in range(3)}
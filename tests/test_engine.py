@@ -0,0 +1,92 @@
+import pytest
+
+from dictionaries.deck import WordDeck
+from dictionaries.index import get_word_index
+from engine import ConfigError, GameConfig, check_config, deal, replay_roles, start_round
+from game_state import PHASE_REVEAL, GameState
+from tournament import build_tournament
+
+INDEX = get_word_index()
+PLAYERS = ("Ana", "Luis", "Eva", "Marta", "Pablo")
+
+
+def _config(**options):
+    options.setdefault("selected_themes", INDEX.theme_names)
+    return GameConfig(players=PLAYERS, num_impostors=2, **options)
+
+
+@pytest.mark.parametrize(
+    "options, key",
+    [
+        ({"players": ("A", "B")}, "error.min_players"),
+        ({"num_impostors": 0}, "error.min_impostors"),
+        ({"num_impostors": 6}, "error.too_many_impostors"),
+        ({"selected_themes": ()}, "error.no_themes"),
+    ],
+)
+def test_invalid_configs(options, key):
+    config = _config()._replace(**options)
+    with pytest.raises(ConfigError) as info:
+        check_config(config)
+    assert info.value.key == key
+    with pytest.raises(ConfigError):
+        deal(config)
+
+
+def test_deal_is_reproducible_from_its_seed():
+    config = _config()
+    first = deal(config, seed=1234)
+    assert first.seed == 1234
+    assert deal(config, seed=1234) == first
+    assert replay_roles(1234, len(PLAYERS), 2) == (first.impostors, first.reveal_order)
+    assert len(first.impostors) == 2
+
+
+def test_word_comes_from_the_selected_themes():
+    theme = INDEX.theme_names[0]
+    for seed in range(50):
+        dealt = deal(_config(selected_themes=(theme,)), seed=seed)
+        assert dealt.theme_name == theme
+        assert INDEX.word_id(theme, dealt.civil_word) is not None
+
+
+def test_deck_does_not_repeat_words():
+    theme = INDEX.theme_names[0]
+    deck = WordDeck(INDEX, [theme])
+    config = _config(selected_themes=(theme,))
+    words = [deal(config, deck, seed=seed).civil_word for seed in range(len(deck))]
+    assert len(set(words)) == len(words)
+
+
+def test_no_hint_for_impostors():
+    assert deal(_config(hint_for_impostors=False), seed=1).impostor_hint is None
+    assert deal(_config(selected_themes=(INDEX.theme_names[0],)), seed=1).impostor_hint
+
+
+def test_decoy_word_for_impostors():
+    pytest.importorskip("numpy")
+    for seed in range(20):
+        dealt = deal(_config(decoy_words=True), seed=seed)
+        # El infiltrado recibe otra palabra de la misma temática, y ninguna pista
+        assert dealt.decoy_word and dealt.decoy_word != dealt.civil_word
+        assert INDEX.word_id(dealt.theme_name, dealt.decoy_word) is not None
+        assert dealt.impostor_hint is None
+
+
+def test_tournament_round_is_dealt_as_scheduled():
+    pytest.importorskip("numpy")
+    tournament = build_tournament(PLAYERS, 2, 3, INDEX.theme_names, seed=5)
+    round_ = tournament.peek()
+    dealt = deal(_config(decoy_words=True), round_=round_)
+    assert dealt.seed is None
+    assert dealt.impostors == round_.impostors
+    assert dealt.civil_word == round_.word
+    assert dealt.decoy_word != round_.word
+
+
+def test_start_round_moves_the_game_to_reveal():
+    game = GameState()
+    dealt = start_round(game, _config(), seed=7)
+    assert game.phase == PHASE_REVEAL
+    assert game.civil_word == dealt.civil_word
+    assert game.seed == 7
@@ -0,0 +1,52 @@
+import pytest
+
+from game_state import PHASE_CONFIG, PHASE_PLAY, PHASE_READY, PHASE_REVEAL, GameState, PhaseError
+from roles import ImpostorSet, RevealOrder
+
+
+def _started(**options):
+    game = GameState()
+    game.start(ImpostorSet(4, [1, 3]), RevealOrder(2, 4), "Animales", "Perro", "Ladra", seed=42, **options)
+    return game
+
+
+def test_a_game_walks_through_its_phases():
+    game = _started()
+    assert game.phase == PHASE_REVEAL
+    assert game.current_player() == 2
+    for _ in range(4):
+        game.show_role()
+        game.next_player()
+    assert game.phase == PHASE_READY and game.current_player() is None
+    game.start_timer(1000.0)
+    assert game.phase == PHASE_PLAY and game.countdown_started_at == 1000.0
+    game.back_to_config()
+    assert game.phase == PHASE_CONFIG and game.num_players == 0
+
+
+def test_invalid_transitions_are_refused():
+    game = GameState()
+    with pytest.raises(PhaseError):
+        game.start_timer(0.0)
+    with pytest.raises(PhaseError):
+        game.go(PHASE_READY)
+    assert game.phase == PHASE_CONFIG
+
+
+def test_round_trips():
+    game = _started()
+    game.show_role()
+    game.game_id = "partida-1"
+    assert GameState.from_bytes(game.to_bytes()) == game
+    assert GameState.from_json(game.to_json()) == game
+    assert GameState.from_bytes(GameState().to_bytes()) == GameState()
+    undercover = _started(decoy_word="Lobo")
+    assert GameState.from_bytes(undercover.to_bytes()) == undercover
+
+
+@pytest.mark.parametrize("version", [1, 99])
+def test_other_binary_versions_are_refused(version):
+    data = bytearray(_started().to_bytes())
+    data[0] = version
+    with pytest.raises(ValueError):
+        GameState.from_bytes(bytes(data))
@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+import sqlite3
+from datetime import date
+
+import pytest
+
+from engine import replay_roles
+from history import EXPORT_COLUMNS, HistoryStore, _replay
+
+PLAYERS = ["Ana", "Luis", "Eva", "Marta"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "historial.db"), batch_size=2, flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def _record(store, theme="Animales", word="Perro", players=PLAYERS, impostors=(1,), **extra):
+    return store.record_game(players, impostors, theme, word, "Ladra", 2, **extra)
+
+
+def test_games_reach_the_database_after_flush(store):
+    ids = [_record(store, word=word) for word in ("Perro", "Gato", "Vaca", "Oveja", "Cerdo")]
+    store.flush()
+    games = list(store.iter_games(chunk_size=2))
+    # En orden cronológico, con los jugadores en su asiento
+    assert [game["id"] for game in games] == ids
+    assert games[0]["players"] == PLAYERS
+    assert games[0]["impostors"] == ["Luis"]
+    assert games[0]["num_players"] == 4 and games[0]["num_impostors"] == 1
+    assert store.dropped == 0
+
+
+def test_the_same_game_is_stored_once(store):
+    _record(store, game_id="partida-1")
+    _record(store, game_id="partida-1")
+    store.flush()
+    assert [game["id"] for game in store.iter_games()] == ["partida-1"]
+
+
+def test_close_writes_what_is_queued(tmp_path):
+    path = str(tmp_path / "historial.db")
+    store = HistoryStore(path, flush_interval=10)
+    _record(store)
+    store.close()
+    reopened = HistoryStore(path)
+    try:
+        assert len(list(reopened.iter_games())) == 1
+    finally:
+        reopened.close()
+
+
+def test_filters(store):
+    _record(store, theme="Animales", players=["Ana", "Luis", "Eva"])
+    _record(store, theme="Comida", players=["Marta", "Luis", "Pablo"])
+    _record(store, theme="Comida", players=["Ana", "Eva", "Pablo"])
+    store.flush()
+    today = date.today().isoformat()
+    assert len(list(store.iter_games(player="Ana"))) == 2
+    assert len(list(store.iter_games(theme="Comida"))) == 2
+    assert len(list(store.iter_games(player="Luis", theme="Comida"))) == 1
+    assert len(list(store.iter_games(since=today, until=today))) == 3
+    assert list(store.iter_games(since="2999-01-01")) == []
+
+
+def test_export_jsonl_and_csv(store):
+    _record(store, word="Perro")
+    _record(store, word="Gato", impostors=(0, 3))
+    store.flush()
+
+    out = io.StringIO()
+    assert store.export(out, "jsonl") == 2
+    games = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [game["word"] for game in games] == ["Perro", "Gato"]
+    assert games[1]["impostors"] == ["Ana", "Marta"]
+
+    out = io.StringIO()
+    assert store.export(out, "csv", theme="Animales") == 2
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == EXPORT_COLUMNS
+    assert rows[2][EXPORT_COLUMNS.index("impostors")] == "Ana|Marta"
+
+
+def test_replay_checks_the_recorded_deal(store):
+    impostors, order = replay_roles(77, len(PLAYERS), 1)
+    honest = store.record_game(PLAYERS, impostors, "Animales", "Perro", None, order[0], seed=77)
+    others = [i for i in range(len(PLAYERS)) if i not in impostors]
+    tampered = store.record_game(PLAYERS, others[:1], "Animales", "Perro", None, order[0], seed=77)
+    unseeded = store.record_game(PLAYERS, impostors, "Animales", "Perro", None, order[0])
+    store.flush()
+
+    assert store.get_game(honest)["seed"] == 77
+    assert _replay(store, honest) == 0
+    assert _replay(store, tampered) == 1
+    assert _replay(store, unseeded) == 2
+    assert _replay(store, "no-existe") == 2
+
+
+def test_old_databases_gain_the_new_columns(tmp_path):
+    path = str(tmp_path / "antigua.db")
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            """CREATE TABLE games (
+                id TEXT PRIMARY KEY, played_at REAL NOT NULL, played_on TEXT NOT NULL,
+                source TEXT NOT NULL, theme TEXT, word TEXT, hint TEXT,
+                num_players INTEGER NOT NULL, num_impostors INTEGER NOT NULL,
+                start_index INTEGER NOT NULL, countdown_seconds INTEGER)"""
+        )
+        conn.execute(
+            "INSERT INTO games VALUES ('vieja', 1.0, '2026-01-01', 'local', 'Animales', 'Perro', NULL, 3, 1, 0, NULL)"
+        )
+    conn.close()
+
+    store = HistoryStore(path)
+    try:
+        assert store.get_game("vieja")["seed"] is None
+        new = _record(store, seed=5)
+        store.flush()
+        assert store.get_game(new)["seed"] == 5
+    finally:
+        store.close()
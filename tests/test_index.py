@@ -0,0 +1,23 @@
+from dictionaries import index as index_module
+from dictionaries.index import get_theme_sampler, get_word_index
+
+
+def test_samplers_are_shared_by_theme_set():
+    themes = get_word_index().theme_names[:3]
+    assert get_theme_sampler(themes) is get_theme_sampler(list(reversed(themes)))
+
+
+def test_reloading_the_index_drops_the_old_samplers(monkeypatch):
+    old = get_word_index()
+    themes = old.theme_names[:2]
+    sampler = get_theme_sampler(themes)
+
+    dictionary = index_module.get_dictionary()
+    reloaded = dictionary._replace(version=dictionary.version + 1000)
+    monkeypatch.setattr(index_module, "get_dictionary", lambda locale=None: reloaded)
+
+    fresh = get_theme_sampler(themes)
+    assert fresh is not sampler
+    assert fresh.index is get_word_index() and fresh.index is not old
+    # Nada en la caché apunta ya al índice viejo
+    assert index_module._sampler_for.cache_info().currsize == 1
@@ -0,0 +1,42 @@
+import pickle
+
+import pytest
+
+from roles import ImpostorSet, RevealOrder
+
+
+def test_impostor_set_membership_and_order():
+    impostors = ImpostorSet(10, [7, 2, 7])
+    assert len(impostors) == 2
+    assert list(impostors) == [2, 7]
+    assert 7 in impostors and 3 not in impostors
+    assert 42 not in impostors
+
+
+def test_impostor_set_rejects_out_of_range():
+    with pytest.raises(IndexError):
+        ImpostorSet(3, [3])
+
+
+def test_impostor_set_round_trips():
+    impostors = ImpostorSet(130, [0, 64, 129])
+    data = impostors.to_bytes()
+    assert ImpostorSet.from_bytes(130, data) == impostors
+    assert pickle.loads(pickle.dumps(impostors)) == impostors
+
+
+def test_reveal_order_is_a_rotation():
+    order = RevealOrder(3, 5)
+    assert list(order) == [3, 4, 0, 1, 2]
+    assert [order[i] for i in range(5)] == list(order)
+    assert order[-1] == 2
+    assert order[1:3] == [4, 0]
+    assert [order.position_of(i) for i in list(order)] == [0, 1, 2, 3, 4]
+
+
+def test_reveal_order_bounds():
+    with pytest.raises(IndexError):
+        RevealOrder(5, 5)
+    with pytest.raises(IndexError):
+        RevealOrder(0, 5)[5]
+    assert pickle.loads(pickle.dumps(RevealOrder(2, 4))) == RevealOrder(2, 4)
@@ -0,0 +1,99 @@
+import pytest
+
+from dictionaries.index import get_word_index
+from rooms import ROOM_LOBBY, ROOM_PLAY, ROOM_REVEAL, RoomError, RoomRegistry
+
+THEMES = get_word_index().theme_names[:2]
+
+
+@pytest.fixture
+def registry():
+    return RoomRegistry()
+
+
+def _room(registry, *names):
+    room = registry.create("t0", names[0])
+    for i, name in enumerate(names[1:], 1):
+        registry.join(room.code, f"t{i}", name)
+    return room
+
+
+def test_create_and_join(registry):
+    room = _room(registry, "Ana", "Luis")
+    assert registry.get(room.code.lower()) is room
+    assert room.is_host("t0") and not room.is_host("t1")
+    assert room.member_names() == ["Ana", "Luis"]
+    version = room.version
+    # Volver a entrar con el mismo nombre no cambia nada
+    registry.join(room.code, "t1", " Luis ")
+    assert room.version == version
+
+
+def test_join_errors(registry):
+    room = _room(registry, "Ana")
+    with pytest.raises(RoomError):
+        registry.join("0000", "t1", "Luis")
+    with pytest.raises(RoomError):
+        registry.join(room.code, "t1", "  ")
+    with pytest.raises(RoomError):
+        registry.join(room.code, "t1", "Ana")
+    with pytest.raises(RoomError):
+        registry.create("t2", "")
+    assert room.member_names() == ["Ana"]
+
+
+def test_host_passes_on_and_empty_rooms_close(registry):
+    room = _room(registry, "Ana", "Luis", "Eva")
+    registry.leave(room.code, "t0")
+    assert room.is_host("t1")
+    assert room.member_names() == ["Luis", "Eva"]
+    registry.leave(room.code, "t1")
+    registry.leave(room.code, "t2")
+    assert registry.get(room.code) is None
+    assert len(registry) == 0
+
+
+def test_configure_only_bumps_the_version_on_changes(registry):
+    room = _room(registry, "Ana")
+    version = room.version
+    assert room.configure(num_impostors=room.num_impostors) == (False, version)
+    assert room.version == version
+    assert room.configure(num_impostors=2, selected_themes=THEMES) == (True, version)
+    assert room.version == version + 1
+    assert room.num_impostors == 2 and room.selected_themes == THEMES
+
+
+def test_a_round_goes_from_lobby_to_play_and_back(registry):
+    room = _room(registry, "Ana", "Luis")
+    room.configure(selected_themes=THEMES)
+    with pytest.raises(RoomError):
+        room.start_game()
+    assert room.phase == ROOM_LOBBY
+
+    registry.join(room.code, "t2", "Eva")
+    room.start_game()
+    assert room.phase == ROOM_REVEAL and room.round == 1
+    assert room.players == ("Ana", "Luis", "Eva")
+    assert [room.seat_of(token) for token in ("t0", "t1", "t2")] == [0, 1, 2]
+    assert len(room.impostor_indices) == 1
+    assert room.theme_name in THEMES and room.civil_word
+
+    # Quien entra a mitad de ronda juega en la siguiente
+    registry.join(room.code, "t3", "Marta")
+    assert room.seat_of("t3") is None
+
+    room.start_timer()
+    assert room.phase == ROOM_PLAY and room.countdown_started_at is not None
+    room.end_round()
+    assert room.phase == ROOM_LOBBY and room.countdown_started_at is None
+
+
+def test_configure_is_refused_once_the_round_has_started(registry):
+    room = _room(registry, "Ana", "Luis", "Eva")
+    room.configure(selected_themes=THEMES)
+    room.start_game()
+    version = room.version
+    with pytest.raises(RoomError) as info:
+        room.configure(num_impostors=2)
+    assert info.value.key == "room.error.not_in_lobby"
+    assert room.num_impostors == 1 and room.version == version
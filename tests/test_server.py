@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+import pytest
+
+from dictionaries.index import get_word_index
+from rooms import RoomRegistry
+from server.app import RoomServer, room_snapshot, snapshot_diff
+from server.client import RoomClient, apply_diff
+from server.websocket import OP_CONTINUATION, OP_TEXT, WebSocketError, accept_key, encode_frame, read_message
+
+THEMES = get_word_index().theme_names[:2]
+
+
+def _wire(value):
+    # Lo que llega al cliente: las tuplas pasan a listas por el camino
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+def test_diffs_rebuild_the_room_state():
+    registry = RoomRegistry()
+    room = registry.create("t0", "Ana")
+    first = room_snapshot(room)
+    state = {}
+    apply_diff(state, _wire(snapshot_diff(None, first)))
+    assert state == _wire(first)
+    assert snapshot_diff(first, first) == {}
+
+    for i, name in enumerate(("Luis", "Eva", "Marta"), 1):
+        registry.join(room.code, f"t{i}", name)
+    room.configure(num_impostors=2, selected_themes=THEMES)
+    second = room_snapshot(room)
+    diff = snapshot_diff(first, second)
+    assert diff["members"] == {"+": ["Luis", "Eva", "Marta"], "-": []}
+    assert set(diff) == {"members", "num_impostors", "selected_themes"}
+
+    registry.leave(room.code, "t0")
+    room.start_game()
+    third = room_snapshot(room)
+    diff = snapshot_diff(second, third)
+    assert diff["members"] == {"+": [], "-": ["Ana"]}
+    assert diff["host"] == "Luis"
+
+    apply_diff(state, _wire(snapshot_diff(first, second)))
+    apply_diff(state, _wire(diff))
+    assert state == _wire(third)
+
+
+def test_accept_key_matches_the_rfc_example():
+    assert accept_key("dGhlIHNhbXBsZSBub25jZQ==") == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo="
+
+
+async def _read(*frames):
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"".join(frames))
+    reader.feed_eof()
+    return await read_message(reader, None)
+
+
+@pytest.mark.parametrize("size", [0, 5, 125, 126, 4000, 60_000])
+@pytest.mark.parametrize("mask", [False, True])
+def test_frames_round_trip(size, mask):
+    text = ("ñ" + "a" * size)[:size] if size else ""
+    assert asyncio.run(_read(encode_frame(OP_TEXT, text.encode("utf-8"), mask))) == text
+
+
+def test_fragments_are_joined():
+    first = bytearray(encode_frame(OP_TEXT, "hola, ".encode("utf-8"), mask=True))
+    first[0] &= 0x7F  # FIN=0: vienen más fragmentos
+    last = encode_frame(OP_CONTINUATION, "sala".encode("utf-8"), mask=True)
+    assert asyncio.run(_read(bytes(first), last)) == "hola, sala"
+
+
+def test_oversized_frames_are_refused():
+    with pytest.raises(WebSocketError):
+        asyncio.run(_read(encode_frame(OP_TEXT, b"x" * 70_000)))
+
+
+async def _switch_rooms():
+    server = RoomServer()
+    listener = await asyncio.start_server(server.serve_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        ana = await RoomClient.connect("127.0.0.1", port)
+        luis = await RoomClient.connect("127.0.0.1", port)
+        await ana.send("create", name="Ana")
+        await ana.expect("joined")
+        first = ana.code
+        await luis.send("join", code=first, name="Luis")
+        await luis.expect("joined")
+
+        # Crear otra sala es salir de la primera: Luis pasa a ser el anfitrión
+        await ana.send("create", name="Ana")
+        await ana.expect("joined")
+        second = ana.code
+        await luis.wait_for("host", "Luis")
+        assert server.registry.get(first).member_names() == ["Luis"]
+
+        # Y volver a la primera cierra la segunda, que se queda vacía
+        await ana.send("join", code=first, name="Ana")
+        await ana.expect("joined")
+        await luis.wait_for("members", ["Luis", "Ana"])
+        assert server.registry.get(second) is None
+        assert server.registry.get(first).is_host(luis.token)
+
+        await ana.close()
+        await luis.close()
+
+
+def test_switching_rooms_leaves_the_old_one():
+    asyncio.run(asyncio.wait_for(_switch_rooms(), timeout=10))
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dictionaries.index import WordIndex  # noqa: E402
+from dictionaries.similarity import SIMILARITY_DIR_ENV, build_similarity_index, theme_neighbours  # noqa: E402
+
+ANIMALS = ["Camello", "Caballo", "Camella", "Perro", "Gato", "Oveja"]
+FOOD = ["Paella", "Tortilla", "Gazpacho", "Croqueta"]
+
+
+def _index(**themes):
+    return WordIndex({name: [{"word": w, "hint": None} for w in words] for name, words in themes.items()})
+
+
+def test_neighbours_skip_the_word_itself_and_its_duplicates():
+    words = ["Camello", "camello", "Camella", "Caballo", "Sol"]
+    near = theme_neighbours(words, [None] * len(words), k=4)
+    assert near.shape == (5, 4)
+    assert near[0][0] == 2
+    assert 0 not in near[0] and 1 not in near[0]
+    assert list(near[0]).count(-1) == 1
+    assert (theme_neighbours(["Sol"], [None], k=4) == -1).all()
+
+
+def test_decoys_stay_in_their_theme(tmp_path, monkeypatch):
+    monkeypatch.setenv(SIMILARITY_DIR_ENV, str(tmp_path))
+    index = _index(Animales=ANIMALS, Comida=FOOD)
+    similarity = build_similarity_index(index, "es")
+    rng = random.Random(0)
+    for word_id in range(len(index)):
+        decoy = similarity.pick_decoy(word_id, rng)
+        assert decoy != word_id
+        assert index.theme_of(decoy) == index.theme_of(word_id)
+    assert similarity.similar(0)[0] == 2
+
+
+def test_cache_rebuilds_only_the_themes_that_change(tmp_path, monkeypatch):
+    monkeypatch.setenv(SIMILARITY_DIR_ENV, str(tmp_path))
+    first = build_similarity_index(_index(Animales=ANIMALS, Comida=FOOD), "es")
+    assert first.rebuilt_themes == 2
+
+    again = build_similarity_index(_index(Animales=ANIMALS, Comida=FOOD), "es")
+    assert again.rebuilt_themes == 0
+    assert (again.neighbours == first.neighbours).all()
+
+    changed = build_similarity_index(_index(Animales=ANIMALS, Comida=FOOD + ["Churros"]), "es")
+    assert changed.rebuilt_themes == 1
+    # Sin guardar no se toca la caché
+    build_similarity_index(_index(Animales=ANIMALS + ["Vaca"]), "es", save=False)
+    assert build_similarity_index(_index(Animales=ANIMALS, Comida=FOOD + ["Churros"]), "es").rebuilt_themes == 0
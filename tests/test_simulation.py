@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from dictionaries.index import WEIGHTING_BY_THEME, WEIGHTING_BY_WORD  # noqa: E402
+from simulation import simulate  # noqa: E402
+
+
+@pytest.mark.parametrize("weighting", [WEIGHTING_BY_THEME, WEIGHTING_BY_WORD])
+def test_seeded_simulation_is_fair(weighting):
+    report = simulate(200_000, num_players=8, num_impostors=2, weighting=weighting, seed=0)
+    assert report.seat_counts.sum() == 2 * 200_000
+    assert report.start_counts.sum() == report.word_counts.sum() == 200_000
+    # Con semilla fija el resultado no cambia: no es un test que falle al azar
+    for chi2 in (report.theme_chi2, report.word_chi2, report.seat_chi2, report.start_chi2):
+        assert chi2.p_value > 0.001
+
+
+def test_same_seed_same_counts():
+    a = simulate(10_000, seed=3)
+    b = simulate(10_000, seed=3)
+    assert (a.word_counts == b.word_counts).all()
+    assert (a.seat_counts == b.seat_counts).all()
+
+
+def test_rejects_impossible_games():
+    with pytest.raises(ValueError):
+        simulate(10, num_players=3, num_impostors=4)
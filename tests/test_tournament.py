@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from dictionaries.index import get_word_index
+from tournament import build_tournament, schedule_impostors, schedule_starts
+
+THEMES = get_word_index().theme_names
+
+
+@pytest.mark.parametrize("players, impostors, rounds", [(3, 1, 10), (8, 2, 15), (25, 4, 30), (7, 3, 7)])
+def test_schedule_is_balanced(players, impostors, rounds):
+    schedule = schedule_impostors(players, impostors, rounds, random.Random(players * rounds))
+    assert all(len(set(chosen)) == impostors for chosen in schedule)
+
+    counts = [0] * players
+    for chosen in schedule:
+        for p in chosen:
+            counts[p] += 1
+    assert max(counts) - min(counts) <= 1
+
+    if players >= 2 * impostors:
+        for prev, cur in zip(schedule, schedule[1:]):
+            assert not set(prev) & set(cur)
+
+
+def test_starts_rotate_through_everyone():
+    starts = schedule_starts(5, 10, random.Random(0))
+    assert sorted(starts) == sorted(list(range(5)) * 2)
+
+
+def test_same_seed_same_tournament():
+    players = [f"J{i}" for i in range(6)]
+    a = build_tournament(players, 2, 8, THEMES, seed=11)
+    b = build_tournament(players, 2, 8, THEMES, seed=11)
+    assert a.rounds == b.rounds
+    words = [round_.word for round_ in a.rounds]
+    assert len(set(words)) == len(words)
+
+
+def test_peek_does_not_spend_the_round():
+    tournament = build_tournament(["A", "B", "C"], 1, 2, THEMES, seed=1)
+    first = tournament.peek()
+    assert tournament.peek() is first and tournament.position == 0
+    assert tournament.next_round() is first
+    assert tournament.next_round() is tournament.rounds[1]
+    assert tournament.finished
+    assert tournament.peek() is None and tournament.next_round() is None
+
+
+def test_matches_checks_the_configuration():
+    players = ["A", "B", "C"]
+    tournament = build_tournament(players, 1, 3, THEMES[:2], seed=1)
+    assert tournament.matches(players, 1, "es", list(reversed(THEMES[:2])))
+    assert not tournament.matches(players + ["D"], 1, "es", THEMES[:2])
+    assert not tournament.matches(players, 2, "es", THEMES[:2])
+    assert not tournament.matches(players, 1, "en", THEMES[:2])
+    assert not tournament.matches(players, 1, "es", THEMES[:1])
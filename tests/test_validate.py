@@ -0,0 +1,60 @@
+from dictionaries.validate import ERROR, WARNING, Entry, normalize, validate
+
+
+def _kinds(issues):
+    return {(issue.level, issue.kind, issue.word) for issue in issues}
+
+
+def test_entry_checks():
+    issues = validate(
+        [
+            Entry("a.json", "Animales", "  ", None),
+            Entry("a.json", "Animales", "Perro", "perro"),
+            Entry("a.json", "Animales", "Gato", None),
+            Entry("a.json", "Animales", "Oso  pardo", "Un oso grande"),
+        ]
+    )
+    kinds = _kinds(issues)
+    assert (ERROR, "palabra vacía", "  ") in kinds
+    assert (ERROR, "pista = palabra", "Perro") in kinds
+    assert (WARNING, "sin pista", "Gato") in kinds
+    assert (WARNING, "espacios", "Oso  pardo") in kinds
+
+
+def test_duplicates_and_near_duplicates():
+    issues = validate(
+        [
+            Entry("a.json", "Animales", "Camello", "Desierto"),
+            Entry("a.json", "Animales", "camello", "Jorobas"),
+            Entry("b.json", "Viajes", "Camello", "Caravana"),
+            Entry("a.json", "Animales", "Elefante", "Trompa"),
+            Entry("a.json", "Animales", "Elefantes", "Manada"),
+        ]
+    )
+    kinds = _kinds(issues)
+    assert (ERROR, "repetida en la temática", "camello") in kinds
+    assert (WARNING, "repetida en otra temática", "Camello") in kinds
+    assert any(kind == "casi repetida" for _, kind, _ in kinds)
+
+
+def test_clean_dictionary_has_no_issues():
+    assert validate([Entry("a.json", "Comida", "Paella", "Arroz"), Entry("a.json", "Comida", "Tortilla", "Huevo")]) == []
+
+
+def test_normalize():
+    themes = normalize(
+        [
+            Entry("a.json", " Comida ", " Paella  valenciana ", "Arroz"),
+            Entry("a.json", "Comida", "paella valenciana", "Otra"),
+            Entry("a.json", "Comida", "Pan", "pan"),
+            Entry("a.json", "Comida", "Sal", "¿?"),
+            Entry("a.json", "Comida", "", "nada"),
+        ]
+    )
+    assert themes == {
+        "Comida": [
+            {"word": "Paella valenciana", "hint": "Arroz"},
+            {"word": "Pan", "hint": None},
+            {"word": "Sal", "hint": None},
+        ]
+    }
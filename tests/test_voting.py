@@ -0,0 +1,81 @@
+import random
+from collections import Counter
+
+import pytest
+
+from roles import ImpostorSet
+from voting import CIVILIAN_WIN, GOOD_VOTE, IMPOSTOR_WIN, Leaderboard, VoteTally
+
+
+def test_cast_change_and_retract():
+    tally = VoteTally(4)
+    tally.cast("ana", 1)
+    tally.cast("luis", 1)
+    tally.cast("eva", 2)
+    assert tally.top == 2 and tally.leaders() == (1,)
+
+    tally.cast("luis", 2)
+    assert tally.votes_for(1) == 1 and tally.votes_for(2) == 2
+    assert tally.leaders() == (2,)
+
+    tally.retract("eva")
+    assert tally.top == 1 and tally.leaders() == (1, 2)
+    assert tally.votes_cast == 2
+
+    with pytest.raises(IndexError):
+        tally.cast("ana", 4)
+
+
+def test_matches_a_recount_after_random_votes():
+    rng = random.Random(0)
+    tally = VoteTally(30)
+    ballots = {}
+    for _ in range(2000):
+        voter = rng.randrange(40)
+        if rng.random() < 0.2:
+            tally.retract(voter)
+            ballots.pop(voter, None)
+        else:
+            target = rng.randrange(30)
+            tally.cast(voter, target)
+            ballots[voter] = target
+        counts = Counter(ballots.values())
+        top = max(counts.values(), default=0)
+        assert tally.top == top
+    assert tally.leaders() == tuple(sorted(p for p, c in counts.items() if c == top))
+
+
+def test_civilians_win_when_the_impostor_is_voted_out():
+    tally = VoteTally(4)
+    for voter, target in ((0, 3), (1, 3), (2, 0), (3, 0), (0, 3)):
+        tally.cast(voter, target)
+    tally.cast(2, 3)
+    result = tally.result(ImpostorSet(4, [3]))
+    assert result.accused == (3,) and not result.impostors_won
+    assert result.points == {
+        0: CIVILIAN_WIN + GOOD_VOTE,
+        1: CIVILIAN_WIN + GOOD_VOTE,
+        2: CIVILIAN_WIN + GOOD_VOTE,
+    }
+
+
+def test_impostors_win_on_a_tie():
+    tally = VoteTally(4)
+    tally.cast("a", 0)
+    tally.cast("b", 1)
+    result = tally.result(ImpostorSet(4, [1]), voter_seats={"a": 2, "b": 3})
+    assert result.impostors_won
+    assert result.points == {1: IMPOSTOR_WIN}
+
+
+def test_leaderboard_order_and_rank():
+    board = Leaderboard()
+    board.add("Ana", 3)
+    board.add("Luis", 5)
+    board.add("Eva", 3)
+    board.add("Ana", 4)
+    assert board.top(2) == [("Ana", 7), ("Luis", 5)]
+    assert board.rank("Ana") == 1
+    assert board.rank("Eva") == 3
+    assert board.rank("nadie") is None
+    assert len(board) == 3
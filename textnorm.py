@@ -0,0 +1,25 @@
+"""
+Normalización de textos para comparar nombres y palabras.
+
+"Álvaro", "alvaro" y " ÁLVARO " deben contar como el mismo nombre: se
+quitan tildes y diéresis, se pasa a minúsculas (casefold) y se colapsan
+los espacios. La ñ se conserva, porque "año" y "ano" no son lo mismo.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Marcas diacríticas combinantes, salvo la tilde de la ñ (en español la ñ
+# es otra letra, no una n con tilde)
+_MARKS_RE = re.compile("(?<![nN])\u0303|[\u0300-\u0302\u0304-\u036f]")
+
+
+@lru_cache(maxsize=4096)
+def fold_text(text: str) -> str:
+    """Clave de comparación de un texto: sin tildes, sin mayúsculas, sin espacios extra."""
+    text = " ".join(text.split())
+    if text.isascii():
+        return text.casefold()
+    stripped = _MARKS_RE.sub("", unicodedata.normalize("NFKD", text))
+    return unicodedata.normalize("NFC", stripped).casefold()
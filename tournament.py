@@ -0,0 +1,213 @@
+"""
+Torneos: varias rondas con el calendario decidido de antemano.
+
+Si cada ronda sortea los impostores por su cuenta, en una noche de 15
+rondas a alguno le toca ser impostor cinco veces y a otro ninguna. Un
+torneo reparte antes de empezar los impostores, el jugador que empieza y
+la palabra de todas las rondas:
+
+- Cada ronda salen impostores los jugadores que menos veces lo han sido;
+  a igualdad, los que hace más rondas que no lo son, y después al azar.
+  Así las veces de cada jugador difieren como mucho en 1 y nadie repite
+  en rondas seguidas mientras haya al menos el doble de jugadores que de
+  impostores.
+- El jugador que empieza rota igual: el que menos veces ha empezado.
+- Las palabras salen de una baraja propia, sin repetir hasta agotarla.
+
+Construir el calendario es O(R · n log n) (100 jugadores y 50 rondas en
+unos pocos milisegundos) y pasar de ronda es O(1). Para medirlo:
+
+    python -m tournament --players 100 --impostors 3 --rounds 50
+"""
+
+import argparse
+import random
+import time
+from typing import FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from dictionaries.deck import WordDeck
+from dictionaries.index import get_word_index
+from i18n import DEFAULT_LOCALE
+from roles import ImpostorSet, RevealOrder
+
+MAX_ROUNDS = 100
+
+
+class Round(NamedTuple):
+    impostors: ImpostorSet
+    start: int
+    theme_name: str
+    word: str
+    hint: Optional[str]
+    word_id: Optional[int] = None  # en el índice con el que se hizo el calendario
+
+    @property
+    def reveal_order(self) -> RevealOrder:
+        return RevealOrder(self.start, self.impostors.num_players)
+
+
+def _rotation(num_players: int, per_round: int, num_rounds: int, rng) -> List[List[int]]:
+    """
+    Para cada ronda, los `per_round` jugadores con menos apariciones (y,
+    a igualdad, los que hace más que no aparecen). Con el desempate al
+    azar fijado por ronda, el resultado sólo depende de `rng`.
+    """
+    counts = [0] * num_players
+    last = [-1] * num_players
+    rounds = []
+    for r in range(num_rounds):
+        noise = [rng.random() for _ in range(num_players)]
+        chosen = sorted(range(num_players), key=lambda p: (counts[p], last[p], noise[p]))[:per_round]
+        for p in chosen:
+            counts[p] += 1
+            last[p] = r
+        rounds.append(chosen)
+    return rounds
+
+
+def schedule_impostors(
+    num_players: int, num_impostors: int, num_rounds: int, rng=random
+) -> List[List[int]]:
+    """Impostores de cada ronda, repartidos lo más a partes iguales posible."""
+    return _rotation(num_players, num_impostors, num_rounds, rng)
+
+
+def schedule_starts(num_players: int, num_rounds: int, rng=random) -> List[int]:
+    """Jugador que empieza en cada ronda, rotando entre todos."""
+    return [chosen[0] for chosen in _rotation(num_players, 1, num_rounds, rng)]
+
+
+class Tournament:
+    """Calendario completo de un torneo y la ronda por la que va."""
+
+    __slots__ = ("players", "num_impostors", "selected_themes", "locale", "seed", "rounds", "position")
+
+    def __init__(
+        self,
+        players: Sequence[str],
+        num_impostors: int,
+        rounds: List[Round],
+        locale: str = DEFAULT_LOCALE,
+        seed: Optional[int] = None,
+        selected_themes: Sequence[str] = (),
+    ) -> None:
+        self.players: Tuple[str, ...] = tuple(players)
+        self.num_impostors = num_impostors
+        self.selected_themes: FrozenSet[str] = frozenset(selected_themes)
+        self.locale = locale
+        self.seed = seed
+        self.rounds = rounds
+        self.position = 0  # rondas ya jugadas
+
+    def __len__(self) -> int:
+        return len(self.rounds)
+
+    @property
+    def finished(self) -> bool:
+        return self.position >= len(self.rounds)
+
+    @property
+    def remaining(self) -> int:
+        return len(self.rounds) - self.position
+
+    def peek(self) -> Optional[Round]:
+        """Siguiente ronda del calendario sin gastarla (None si ya se han jugado todas)."""
+        if self.finished:
+            return None
+        return self.rounds[self.position]
+
+    def next_round(self) -> Optional[Round]:
+        """Siguiente ronda del calendario (None si ya se han jugado todas)."""
+        current = self.peek()
+        if current is not None:
+            self.position += 1
+        return current
+
+    def matches(
+        self, players: Sequence[str], num_impostors: int, locale: str, selected_themes: Sequence[str]
+    ) -> bool:
+        """¿Sigue valiendo el calendario para esta configuración?"""
+        return (
+            tuple(players) == self.players
+            and num_impostors == self.num_impostors
+            and locale == self.locale
+            and frozenset(selected_themes) == self.selected_themes
+        )
+
+    def impostor_counts(self) -> List[int]:
+        """Veces que es impostor cada jugador en todo el torneo."""
+        counts = [0] * len(self.players)
+        for round_ in self.rounds:
+            for p in round_.impostors:
+                counts[p] += 1
+        return counts
+
+
+def build_tournament(
+    players: Sequence[str],
+    num_impostors: int,
+    num_rounds: int,
+    selected_themes: Sequence[str],
+    locale: str = DEFAULT_LOCALE,
+    seed: Optional[int] = None,
+) -> Tournament:
+    """Reparte de una vez impostores, jugador inicial y palabra de todas las rondas."""
+    rng = random.Random(seed)
+    n = len(players)
+    impostors = schedule_impostors(n, num_impostors, num_rounds, rng)
+    starts = schedule_starts(n, num_rounds, rng)
+
+    index = get_word_index(locale)
+    deck = WordDeck(index, selected_themes)
+    rounds = []
+    for chosen, start in zip(impostors, starts):
+        word_id = deck.draw(rng)
+        if word_id is None:
+            # Temáticas sin palabras: como en pick_random_word_from_themes
+            theme_name = selected_themes[0] if selected_themes else "Sin temática"
+            word, hint = "PALABRA_DE_EJEMPLO", "PISTA_DE_EJEMPLO"
+        else:
+            theme_name = index.theme_names[index.theme_of(word_id)]
+            word, hint = index.words[word_id], index.hints[word_id]
+        rounds.append(Round(ImpostorSet(n, chosen), start, theme_name, word, hint, word_id))
+    return Tournament(players, num_impostors, rounds, locale, seed, selected_themes)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Construye un calendario de torneo y comprueba el reparto")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--impostors", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--locale", default=DEFAULT_LOCALE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    players = [f"Jugador {i}" for i in range(1, args.players + 1)]
+    # La carga del diccionario no cuenta en el tiempo
+    themes = get_word_index(args.locale).theme_names
+
+    start = time.perf_counter()
+    tournament = build_tournament(players, args.impostors, args.rounds, themes, args.locale, args.seed)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    while tournament.next_round() is not None:
+        pass
+    advance_us = (time.perf_counter() - start) * 1e6 / max(1, len(tournament))
+
+    counts = tournament.impostor_counts()
+    repeats = sum(
+        1
+        for prev, cur in zip(tournament.rounds, tournament.rounds[1:])
+        for p in cur.impostors
+        if p in prev.impostors
+    )
+    print(
+        f"{args.players} jugadores, {args.impostors} impostores, {args.rounds} rondas: "
+        f"construido en {build_ms:.1f} ms, {advance_us:.2f} µs por ronda"
+    )
+    print(f"veces impostor: mín {min(counts)}, máx {max(counts)}; repeticiones seguidas: {repeats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,188 @@
+from typing import Optional
+
 import streamlit as st
 
-from game_logic import get_theme_names, start_game
+from dictionaries.themes import ThemeCatalog, get_theme_catalog
+from engine import new_game_seed
+from game_logic import start_game, sync_word_deck
 from components.players_section import render_players_section
-from state import safe_rerun
+from game_state import PHASE_ROOM
+from i18n import LOCALES, get_locale, set_locale, t
+from state import get_game, safe_rerun
+from tournament import MAX_ROUNDS, Tournament, build_tournament
 
 
 def _format_seconds_label(seconds: int) -> str:
     mins = seconds // 60
     secs = seconds % 60
     if secs == 0:
-        return f"{mins} min"
-    return f"{mins} min {secs:02d} s"
+        return t("config.minutes", mins=mins)
+    return t("config.minutes_seconds", mins=mins, secs=secs)
+
+
+def _render_language_picker() -> None:
+    locale = get_locale()
+    chosen = st.selectbox(
+        t("common.language"),
+        options=list(LOCALES),
+        index=list(LOCALES).index(locale),
+        format_func=LOCALES.get,
+    )
+    if chosen != locale:
+        # Sólo cambia qué catálogo e índice se leen (ver i18n)
+        set_locale(chosen)
+        safe_rerun()
+
+
+def _theme_label(catalog: ThemeCatalog, name: str) -> str:
+    info = catalog.by_name[name]
+    return t("themes.option", name=name, words=info.words, coverage=info.hint_coverage)
+
+
+def _category_summary(catalog: ThemeCatalog, selected: set) -> str:
+    counts = {}
+    for info in catalog.themes:
+        category = info.category or t("themes.no_category")
+        total, chosen = counts.get(category, (0, 0))
+        counts[category] = (total + 1, chosen + (info.name in selected))
+    return " · ".join(f"{name} {chosen}/{total}" for name, (total, chosen) in counts.items())
+
+
+def _render_theme_picker() -> list[str]:
+    """
+    Selector de temáticas con búsqueda, filtros y acciones en bloque.
+
+    Siempre dibuja los mismos widgets (búsqueda, dos filtros, dos botones
+    y un multiselect), haya 10 temáticas o 1000; los datos de cada
+    temática salen del catálogo cacheado (ver dictionaries.themes).
+    """
+    locale = get_locale()
+    catalog = get_theme_catalog(locale)
+    selected = catalog.known(st.session_state.selected_themes or [])
+
+    col_search, col_category, col_tag = st.columns([2, 1, 1])
+    with col_search:
+        query = st.text_input(
+            t("themes.search"),
+            placeholder=t("themes.search_placeholder"),
+            key="theme_search",
+        )
+    with col_category:
+        category = st.selectbox(
+            t("themes.category"),
+            options=[None, *catalog.categories],
+            format_func=lambda c: t("themes.all") if c is None else c,
+            key=f"theme_category_{locale}_{catalog.version}",
+        )
+    with col_tag:
+        tag = st.selectbox(
+            t("themes.tag"),
+            options=[None, *catalog.tags],
+            format_func=lambda c: t("themes.all") if c is None else c,
+            key=f"theme_tag_{locale}_{catalog.version}",
+        )
+
+    visible = catalog.filter(query, category, tag)
+
+    # Acciones en bloque sobre lo que se ve (p. ej. todas las de una etiqueta)
+    col_all, col_none = st.columns(2)
+    with col_all:
+        select_all = st.button(t("themes.select_visible", count=len(visible)), disabled=not visible)
+    with col_none:
+        deselect_all = st.button(t("themes.deselect_visible"), disabled=not visible)
+    if select_all or deselect_all:
+        chosen = set(selected)
+        if select_all:
+            chosen.update(visible)
+        else:
+            chosen.difference_update(visible)
+        selected = [info.name for info in catalog.themes if info.name in chosen]
+        # Multiselect nuevo: el anterior conservaría su valor
+        st.session_state.themes_rev += 1
+
+    # Opciones: las filtradas y, para no perderlas, las ya elegidas
+    shown = set(visible).union(selected)
+    selected = st.multiselect(
+        t("common.themes"),
+        options=[info.name for info in catalog.themes if info.name in shown],
+        default=selected,
+        format_func=lambda name: _theme_label(catalog, name),
+        placeholder=t("themes.placeholder"),
+        key=f"theme_picker_{locale}_{st.session_state.themes_rev}",
+    )
+    st.caption(
+        t("themes.summary", shown=len(visible), total=len(catalog), selected=len(selected))
+        + "  \n"
+        + _category_summary(catalog, set(selected))
+    )
+    return selected
+
+
+def _active_tournament(selected_themes: list[str]) -> Optional[Tournament]:
+    """El torneo de la sesión, si sigue valiendo para los jugadores, impostores y temáticas actuales."""
+    tournament = st.session_state.tournament
+    if tournament is None or tournament.finished:
+        return None
+    if not tournament.matches(
+        st.session_state.players, st.session_state.num_impostors, get_locale(), selected_themes
+    ):
+        return None
+    return tournament
+
+
+def _render_tournament_section(selected_themes: list[str]) -> bool:
+    tournament_mode = st.checkbox(
+        t("config.tournament"),
+        value=st.session_state.tournament_mode,
+        help=t("config.tournament_help"),
+    )
+    st.session_state.tournament_mode = tournament_mode
+    if not tournament_mode:
+        return False
+
+    tournament = _active_tournament(selected_themes)
+    if tournament is None:
+        stale = st.session_state.tournament
+        if stale is not None and not stale.finished:
+            # Se ha cambiado la configuración a mitad de torneo
+            st.warning(t("config.tournament_changed", round=stale.position + 1, total=len(stale)))
+        rounds = st.number_input(
+            t("config.tournament_rounds"),
+            min_value=2,
+            max_value=MAX_ROUNDS,
+            value=st.session_state.tournament_rounds,
+        )
+        st.session_state.tournament_rounds = int(rounds)
+        st.caption(t("config.tournament_new", rounds=int(rounds)))
+        return True
+
+    counts = tournament.impostor_counts()
+    st.caption(
+        t(
+            "config.tournament_progress",
+            round=tournament.position + 1,
+            total=len(tournament),
+            low=min(counts),
+            high=max(counts),
+        )
+    )
+    if st.button(t("config.tournament_reset")):
+        st.session_state.tournament = None
+        safe_rerun()
+    return True
 
 
 def render_config_screen() -> None:
     st.title("🎭 ImpostorApp")
-    st.subheader("Configuración de la partida")
+    _render_language_picker()
+    st.subheader(t("config.subtitle"))
 
-    st.markdown(
-        "Añade los jugadores, elige cuántos serán impostores, decide si "
-        "reciben pista, selecciona las temáticas y ajusta el temporizador."
-    )
+    st.markdown(t("config.intro"))
+
+    if st.button(t("config.room_button")):
+        get_game().go(PHASE_ROOM)
+        safe_rerun()
+        return
 
     # --- Jugadores ---
     render_players_section()
@@ -28,11 +190,11 @@ def render_config_screen() -> None:
     num_players = len(st.session_state.players)
 
     st.divider()
-    st.subheader("Impostores")
+    st.subheader(t("config.impostors"))
 
     # Si hay menos de 2 jugadores, no mostramos slider
     if num_players < 2:
-        st.info("Añade al menos 2 jugadores para poder configurar los impostores.")
+        st.info(t("config.need_two_players"))
         st.session_state.num_impostors = 1
     else:
         max_impostors = max(1, num_players)
@@ -46,7 +208,7 @@ def render_config_screen() -> None:
         current_value = max(1, min(current_value, max_impostors))
 
         num_impostors = st.slider(
-            "Número de impostores",
+            t("common.num_impostors"),
             min_value=1,
             max_value=max_impostors,
             value=current_value,
@@ -54,16 +216,24 @@ def render_config_screen() -> None:
         st.session_state.num_impostors = num_impostors
 
     num_civiles = max(0, num_players - st.session_state.num_impostors)
-    st.markdown(f"**Civiles aproximados:** {num_civiles}")
+    st.markdown(t("config.civilians", count=num_civiles))
+
+    decoy_words = st.checkbox(
+        t("common.decoy_words"),
+        value=st.session_state.decoy_words,
+        help=t("common.decoy_words_help"),
+    )
+    st.session_state.decoy_words = decoy_words
 
     hint_for_impostors = st.checkbox(
-        "¿Los impostores reciben pista?",
+        t("common.hint_for_impostors"),
         value=st.session_state.hint_for_impostors,
+        disabled=decoy_words,
     )
     st.session_state.hint_for_impostors = hint_for_impostors
 
     st.divider()
-    st.subheader("Temporizador de la partida")
+    st.subheader(t("config.timer"))
 
     # Botones +/- 30s entre 60 y 600
     current_seconds = st.session_state.countdown_seconds
@@ -81,73 +251,116 @@ def render_config_screen() -> None:
 
     st.session_state.countdown_seconds = current_seconds
     with col_label:
-        st.markdown(
-            f"**Duración:** {_format_seconds_label(current_seconds)}"
-        )
+        st.markdown(t("config.duration", label=_format_seconds_label(current_seconds)))
 
-    st.caption(
-        "Este temporizador empezará cuando se hayan revelado todos los roles "
-        "y pulséis el botón de empezar partida."
+    st.caption(t("config.timer_caption"))
+
+    client_timer = st.checkbox(
+        t("config.client_timer"),
+        value=st.session_state.timer_mode == "client",
+        help=t("config.client_timer_help"),
     )
+    st.session_state.timer_mode = "client" if client_timer else "server"
 
     st.divider()
-    st.subheader("Temáticas")
-
-    theme_names = get_theme_names()
-
-    # Checkboxes por temática
-    selected_themes: list[str] = []
-    for theme in theme_names:
-        # True si estaba seleccionada anteriormente
-        was_selected = theme in (st.session_state.selected_themes or [])
-        checked = st.checkbox(
-            theme,
-            value=was_selected,
-            key=f"theme_checkbox_{theme}",
-        )
-        if checked:
-            selected_themes.append(theme)
+    st.subheader(t("common.themes"))
+
+    selected_themes = _render_theme_picker()
 
     # Guardamos SIEMPRE la configuración actual
     st.session_state.selected_themes = selected_themes
 
-    st.caption(
-        "Se elegirá una temática aleatoria entre las seleccionadas y, "
-        "dentro de ella, una palabra también aleatoria."
+    no_repeat_words = st.checkbox(
+        t("config.no_repeat"),
+        value=st.session_state.no_repeat_words,
     )
+    st.session_state.no_repeat_words = no_repeat_words
+    if no_repeat_words:
+        deck = sync_word_deck(selected_themes)
+        if selected_themes:
+            st.caption(t("config.deck_left", remaining=deck.remaining, total=len(deck)))
+
+    weighting_labels = {
+        "theme": t("config.weighting_theme"),
+        "word": t("config.weighting_word"),
+    }
+    word_weighting = st.radio(
+        t("config.weighting"),
+        options=list(weighting_labels),
+        format_func=weighting_labels.get,
+        index=0 if st.session_state.word_weighting != "word" else 1,
+        horizontal=True,
+        disabled=no_repeat_words,
+    )
+    st.session_state.word_weighting = word_weighting
+
+    adaptive_words = st.checkbox(
+        t("config.adaptive"),
+        value=st.session_state.adaptive_words,
+        help=t("config.adaptive_help"),
+        disabled=no_repeat_words,
+    )
+    st.session_state.adaptive_words = adaptive_words
+
+    if no_repeat_words:
+        st.caption(t("config.no_repeat_caption"))
+    elif word_weighting == "word":
+        st.caption(t("config.weighting_word_caption"))
+    else:
+        st.caption(t("config.weighting_theme_caption"))
+
+    st.divider()
+    st.subheader(t("config.tournament_title"))
+
+    tournament_mode = _render_tournament_section(selected_themes)
 
     st.divider()
 
-    start_clicked = st.button("🎮 Empezar partida")
+    start_clicked = st.button(t("common.start_game"))
 
     if start_clicked:
         errors = False
 
         if num_players < 3:
-            st.error("Tiene que haber al menos 3 jugadores.")
+            st.error(t("error.min_players"))
             errors = True
 
         if st.session_state.num_impostors < 1:
-            st.error("Tiene que haber al menos un impostor.")
+            st.error(t("error.min_impostors"))
             errors = True
 
         if st.session_state.num_impostors > num_players:
-            st.error("El número de impostores no puede superar al número de jugadores.")
+            st.error(t("error.too_many_impostors"))
             errors = True
 
         if not selected_themes:
-            st.error("Debes seleccionar al menos una temática.")
+            st.error(t("error.no_themes"))
             errors = True
 
         if not errors:
-            # Por si venimos de otra partida:
-            st.session_state.countdown_started_at = None
+            tournament = None
+            if tournament_mode:
+                # El calendario se hace entero al empezar la primera ronda
+                tournament = _active_tournament(selected_themes) or build_tournament(
+                    st.session_state.players,
+                    st.session_state.num_impostors,
+                    st.session_state.tournament_rounds,
+                    selected_themes,
+                    get_locale(),
+                    new_game_seed(),
+                )
+                st.session_state.tournament = tournament
 
             # Configuramos la partida (esto pone phase="reveal")
             start_game(
                 num_impostors=st.session_state.num_impostors,
                 hint_for_impostors=hint_for_impostors,
                 selected_themes=selected_themes,
+                word_weighting=word_weighting,
+                no_repeat_words=no_repeat_words,
+                adaptive_words=adaptive_words,
+                decoy_words=decoy_words,
+                tournament=tournament,
             )
 
             # Forzamos rerun inmediato → se ve directamente la pantalla de roles
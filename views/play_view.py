@@ -1,9 +1,17 @@
 import time
 
-import plotly.graph_objects as go
 import streamlit as st
 
-from state import reset_to_menu, safe_rerun
+from components.countdown import (
+    render_countdown,
+    schedule_rerun_at_expiry,
+    supports_client_countdown,
+)
+from components.donut import render_donut
+from dictionaries.adaptive import record_outcome
+from game_state import PHASE_VOTE
+from i18n import get_locale, t
+from state import get_game, reset_to_menu, safe_rerun
 
 
 def _center_column():
@@ -11,19 +19,42 @@ def _center_column():
     return col2
 
 
+def _remaining_seconds(total: int) -> int:
+    started_at = get_game().countdown_started_at
+    if started_at is None:
+        return total
+    elapsed = max(0, int(time.time() - started_at))
+    return max(0, total - elapsed)
+
+
+def _render_server_timer(total: int, remaining: int) -> None:
+    """Temporizador clásico: el servidor redibuja texto y donut en cada rerun."""
+    mins = remaining // 60
+    secs = remaining % 60
+
+    st.markdown(
+        f"<h2 style='text-align:center;'>{t('play.remaining')} "
+        f"<b>{mins:02d}:{secs:02d} 🕒</b></h2>",
+        unsafe_allow_html=True,
+    )
+
+    # ---------- Reloj circular (SVG cacheado) ----------
+    render_donut(total, remaining)
+
+
 def render_play_screen() -> None:
     players = st.session_state.players
-    order = st.session_state.reveal_order
+    game = get_game()
 
-    if not players or not order:
-        st.warning("Ha ocurrido un problema con la partida. Volviendo al menú principal.")
+    if not players or not game.num_players:
+        st.warning(t("common.game_problem"))
         reset_to_menu()
         return
 
     c = _center_column()
     with c:
         st.markdown(
-            "<h1 style='text-align:center;'>⏳ ImpostorApp — Temporizador ⏳</h1>",
+            f"<h1 style='text-align:center;'>{t('play.title')}</h1>",
             unsafe_allow_html=True,
         )
 
@@ -33,78 +64,67 @@ def render_play_screen() -> None:
         total = st.session_state.get("countdown_seconds", 180)
         total = max(60, min(total, 600))  # seguridad
 
-        if st.session_state.countdown_started_at is None:
-            st.session_state.countdown_started_at = time.time()
+        if game.countdown_started_at is None:
+            game.countdown_started_at = time.time()
 
-        elapsed = max(0, int(time.time() - st.session_state.countdown_started_at))
-        remaining = max(0, total - elapsed)
-
-        mins = remaining // 60
-        secs = remaining % 60
-
-        st.markdown(
-            f"<h2 style='text-align:center;'>🕒 Tiempo restante: "
-            f"<b>{mins:02d}:{secs:02d} 🕒</b></h2>",
-            unsafe_allow_html=True,
+        remaining = _remaining_seconds(total)
+        client_timer = (
+            st.session_state.get("timer_mode", "client") == "client"
+            and supports_client_countdown()
         )
 
-        # ---------- Reloj circular Plotly ----------
-        used = total - remaining
-        used = max(0, min(used, total))
-
-        fig = go.Figure(
-            data=[
-                go.Pie(
-                    values=[used, remaining],
-                    hole=0.6,
-                    sort=False,
-                    direction="clockwise",
-                    marker=dict(
-                        # violeta para la parte consumida, gris oscuro para el resto
-                        colors=["#9b5de5", "#444444"],
-                        line=dict(color="#000000", width=1),
-                    ),
-                    textinfo="none",
-                )
-            ]
-        )
-
-        fig.update_layout(
-            showlegend=False,
-            margin=dict(l=0, r=0, t=0, b=0),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            width=260,
-            height=260,
-        )
-
-        st.plotly_chart(fig, use_container_width=False)
+        if client_timer:
+            # El navegador lleva la cuenta; el servidor sólo vuelve al acabar
+            render_countdown(remaining, total, label=t("play.remaining"))
+            schedule_rerun_at_expiry(remaining, lambda: _remaining_seconds(total))
+        else:
+            _render_server_timer(total, remaining)
 
         if remaining == 0:
             st.markdown(
-                "<p style='text-align:center; color:#ff5555;'><b>⏰ ¡Tiempo agotado! ⏰</b></p>",
+                f"<p style='text-align:center; color:#ff5555;'><b>{t('common.time_up')}</b></p>",
                 unsafe_allow_html=True,
             )
             st.markdown(
-                "<p style='text-align:center;'>Podéis parar el turno, votar "
-                "o seguir como queráis.</p>",
+                f"<p style='text-align:center;'>{t('play.time_up_hint')}</p>",
                 unsafe_allow_html=True,
             )
 
+        # Votación: decide quién gana y suma puntos a la clasificación
+        v1, v2, v3 = st.columns([1, 2, 1])
+        with v2:
+            if st.button(t("play.vote"), key="vote_button"):
+                game.go(PHASE_VOTE)
+                safe_rerun()
+                return
+
+        # Sin votar, basta con decir quién ha ganado: ajusta el peso de la
+        # palabra (ver dictionaries.adaptive)
+        st.markdown(
+            f"<p style='text-align:center;'>{t('play.who_won')}</p>",
+            unsafe_allow_html=True,
+        )
+        w1, w2 = st.columns(2)
+        with w1:
+            civilians_won = st.button(t("play.civilians_won"), key="civilians_won_button")
+        with w2:
+            impostors_won = st.button(t("play.impostors_won"), key="impostors_won_button")
+        if civilians_won or impostors_won:
+            record_outcome(game.theme_name, game.civil_word, impostors_won, get_locale())
+            game.back_to_config()
+            safe_rerun()
+            return
+
         b1, b2, b3 = st.columns([1, 2, 1])
         with b2:
-            back_clicked = st.button("🔙 Volver al menú principal 🔙", key="back_to_menu_button")
+            back_clicked = st.button(t("common.back_to_menu"), key="back_to_menu_button")
             if back_clicked:
-                st.session_state.phase = "config"
-                st.session_state.reveal_order = []
-                st.session_state.reveal_pos = 0
-                st.session_state.is_revealed = False
-                st.session_state.countdown_started_at = None
+                game.back_to_config()
                 safe_rerun()
                 return
             st.markdown("---")
 
-    # Si todavía queda tiempo, refrescamos automáticamente cada segundo
-    if remaining > 0:
+    # Temporizador clásico: si todavía queda tiempo, refrescamos cada segundo
+    if not client_timer and remaining > 0:
         time.sleep(1)
         safe_rerun()
@@ -1,6 +1,8 @@
 import streamlit as st
 
-from state import reset_to_menu, safe_rerun
+from components.role_card import render_role_card
+from i18n import t
+from state import get_game, reset_to_menu, safe_rerun
 
 
 def _center_column():
@@ -10,25 +12,17 @@ def _center_column():
 
 def render_reveal_screen() -> None:
     players = st.session_state.players
-    order = st.session_state.reveal_order
-    pos = st.session_state.reveal_pos
+    game = get_game()
 
     # Estado inconsistente → volvemos al menú
-    if not players or not order:
-        st.warning("Ha ocurrido un problema con la partida. Volviendo al menú principal.")
+    if not players or not game.num_players:
+        st.warning(t("common.game_problem"))
         reset_to_menu()
         return
 
-    # Si hemos terminado de revelar, pasamos a pantalla intermedia "ready"
-    if pos >= len(players):
-        st.session_state.phase = "ready"
-        st.session_state.is_revealed = False
-        safe_rerun()
-        return
-
-    current_index = order[pos]
-    if current_index < 0 or current_index >= len(players):
-        st.warning("Ha ocurrido un problema con la asignación de roles. Reiniciando partida.")
+    current_index = game.current_player()
+    if current_index is None or current_index >= len(players):
+        st.warning(t("reveal.roles_problem"))
         reset_to_menu()
         return
 
@@ -37,81 +31,46 @@ def render_reveal_screen() -> None:
     c = _center_column()
     with c:
         st.markdown(
-            "<h1 style='text-align:center;'>🎭 ImpostorApp — Asignación de roles 🎭</h1>",
+            f"<h1 style='text-align:center;'>{t('reveal.title')}</h1>",
             unsafe_allow_html=True,
         )
 
         st.markdown("---")
 
         st.markdown(
-            f"<h3 style='text-align:center;'>Turno de: <b>{current_name}</b></h3>",
+            f"<h3 style='text-align:center;'>{t('reveal.turn', name=current_name)}</h3>",
             unsafe_allow_html=True,
         )
 
         st.markdown(
-            "<p style='text-align:center;'>Entrega el móvil a esta persona. "
-            "Nadie más debería mirar la pantalla mientras ve su rol 😉</p>",
+            f"<p style='text-align:center;'>{t('reveal.hand_over')}</p>",
             unsafe_allow_html=True,
         )
 
-        if not st.session_state.is_revealed:
+        if not game.is_revealed:
             b1, b2, b3 = st.columns([1, 2, 1])
             with b2:
-                if st.button("Pulsa para saber qué te ha tocado", key="show_role_button"):
-                    st.session_state.is_revealed = True
+                if st.button(t("common.show_role"), key="show_role_button"):
+                    game.show_role()
                     safe_rerun()
             st.markdown("---")
             return
 
 
 
-        is_impostor = current_index in st.session_state.impostor_indices
-
-        st.markdown(
-            f"<p style='text-align:center;'>Temática de esta partida: "
-            f"<b>{st.session_state.theme_name}</b></p>",
-            unsafe_allow_html=True,
+        render_role_card(
+            current_index in game.impostors,
+            game.theme_name,
+            game.civil_word,
+            game.impostor_hint,
+            game.decoy_word,
         )
 
-        if is_impostor:
-            st.markdown(
-                "<h3 style='text-align:center;'>😈 Eres <b>IMPOSTOR</b></h3>",
-                unsafe_allow_html=True,
-            )
-            if st.session_state.impostor_hint:
-                st.markdown(
-                    "<p style='text-align:center;'>Pista para aproximarte a la palabra:</p>",
-                    unsafe_allow_html=True,
-                )
-                st.markdown(
-                    f"<p style='text-align:center;'><b>👉 {st.session_state.impostor_hint}</b></p>",
-                    unsafe_allow_html=True,
-                )
-            else:
-                st.markdown(
-                    "<p style='text-align:center;'>No tienes pista. Tendrás que improvisar y "
-                    "adivinar la palabra en base a lo que digan los demás.</p>",
-                    unsafe_allow_html=True,
-                )
-        else:
-            st.markdown(
-                "<h3 style='text-align:center;'>🧑‍🌾 Eres <b>CIVIL</b></h3>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                "<p style='text-align:center;'>Tu palabra es:</p>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                f"<p style='text-align:center;'><b>👉 {st.session_state.civil_word}</b></p>",
-                unsafe_allow_html=True,
-            )
-
         st.markdown("---")
 
         b1, b2, b3 = st.columns([1, 2, 1])
         with b2:
-            if st.button("Ocultar y pasar al siguiente", key="hide_and_next_button"):
-                st.session_state.is_revealed = False
-                st.session_state.reveal_pos += 1
+            if st.button(t("reveal.hide_and_next"), key="hide_and_next_button"):
+                # Tras el último jugador pasa a la pantalla intermedia "ready"
+                game.next_player()
                 safe_rerun()
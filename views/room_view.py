@@ -0,0 +1,336 @@
+import html
+import time
+
+import streamlit as st
+
+from components.countdown import render_countdown, schedule_rerun_at_expiry
+from components.leaderboard import render_leaderboard
+from components.role_card import render_role_card
+from game_logic import get_theme_names
+from rooms import (
+    ROOM_LOBBY,
+    ROOM_PLAY,
+    ROOM_REVEAL,
+    ROOM_VOTE,
+    Room,
+    RoomError,
+    get_room_registry,
+    new_member_token,
+)
+from i18n import get_locale, t
+from state import get_fragment_decorator, get_game, safe_rerun
+
+# Cada cuánto mira cada dispositivo si la sala ha cambiado (sólo compara un entero)
+ROOM_POLL_SECONDS = 2
+
+
+def _center_column():
+    col1, col2, col3 = st.columns([1, 2, 1])
+    return col2
+
+
+def _token() -> str:
+    if not st.session_state.room_token:
+        st.session_state.room_token = new_member_token()
+    return st.session_state.room_token
+
+
+def _leave_to_menu() -> None:
+    get_room_registry().leave(st.session_state.room_code, _token())
+    st.session_state.room_code = None
+    st.session_state.room_seen_version = -1
+    get_game().back_to_config()
+
+
+def _watch_room(room: Room) -> None:
+    """
+    Fragmento que comprueba cada pocos segundos la versión de la sala y
+    sólo lanza un rerun completo si ha cambiado.
+    """
+    fragment = get_fragment_decorator()
+    if fragment is None:
+        if st.button(t("room.refresh")):
+            safe_rerun()
+        return
+
+    @fragment(run_every=ROOM_POLL_SECONDS)
+    def _room_watcher() -> None:
+        if room.version != st.session_state.room_seen_version:
+            safe_rerun()
+
+    _room_watcher()
+
+
+def _render_entry() -> None:
+    """Pantalla para crear una sala o unirse a una existente."""
+    registry = get_room_registry()
+
+    st.title(t("room.entry_title"))
+    st.markdown(t("room.entry_intro"))
+
+    name = st.text_input(t("room.your_name"), placeholder=t("common.name_placeholder"))
+    code = st.text_input(
+        t("room.code"),
+        value=st.query_params.get("sala", ""),
+        max_chars=8,
+    )
+
+    c1, c2 = st.columns(2)
+    with c1:
+        if st.button(t("room.create")):
+            try:
+                # Las palabras de la sala salen en el idioma del anfitrión
+                room = registry.create(_token(), name, get_locale())
+            except RoomError as e:
+                st.error(t(e.key))
+            else:
+                st.session_state.room_code = room.code
+                safe_rerun()
+                return
+    with c2:
+        if st.button(t("room.join")):
+            try:
+                room = registry.join(code, _token(), name)
+            except RoomError as e:
+                st.error(t(e.key))
+            else:
+                st.session_state.room_code = room.code
+                safe_rerun()
+                return
+
+    st.divider()
+    if st.button(t("common.back_to_menu")):
+        get_game().back_to_config()
+        safe_rerun()
+
+
+def _render_last_result(room: Room) -> None:
+    """Resultado de la última votación y la clasificación de la sala."""
+    result = room.last_result
+    if result is not None:
+        accused = ", ".join(room.players[i] for i in result.accused) or "—"
+        winners = t("vote.impostors_won") if result.impostors_won else t("vote.civilians_won")
+        st.markdown(f"**{winners}** · {t('vote.most_voted', names=accused, votes=result.top_votes)}")
+    if room.leaderboard.rounds:
+        render_leaderboard(room.leaderboard, me=room.members.get(_token()))
+        st.markdown("---")
+
+
+def _render_lobby(room: Room, is_host: bool) -> None:
+    _render_last_result(room)
+
+    members = room.member_names()
+    st.markdown(t("room.members", count=len(members), names=", ".join(members)))
+
+    if not is_host:
+        st.info(t("room.waiting_host"))
+        st.markdown(
+            t(
+                "room.summary",
+                impostors=room.num_impostors,
+                themes=", ".join(room.selected_themes) or "—",
+            )
+        )
+        return
+
+    num_players = len(members)
+    num_impostors = st.slider(
+        t("common.num_impostors"),
+        min_value=1,
+        max_value=max(2, num_players),
+        value=max(1, min(room.num_impostors, max(2, num_players))),
+    )
+    decoy_words = st.checkbox(
+        t("common.decoy_words"),
+        value=room.decoy_words,
+        help=t("common.decoy_words_help"),
+    )
+    hint_for_impostors = st.checkbox(
+        t("common.hint_for_impostors"),
+        value=room.hint_for_impostors,
+        disabled=decoy_words,
+    )
+    theme_names = get_theme_names(room.locale)
+    selected_themes = st.multiselect(
+        t("common.themes"),
+        options=theme_names,
+        default=[name for name in room.selected_themes if name in theme_names],
+    )
+    countdown_seconds = st.select_slider(
+        t("room.timer_seconds"),
+        options=list(range(60, 601, 30)),
+        value=room.countdown_seconds,
+    )
+
+    try:
+        changed, version_before = room.configure(
+            num_impostors=num_impostors,
+            hint_for_impostors=hint_for_impostors,
+            decoy_words=decoy_words,
+            selected_themes=tuple(selected_themes),
+            countdown_seconds=countdown_seconds,
+        )
+    except RoomError:
+        # La ronda ha empezado mientras dibujábamos el lobby
+        safe_rerun()
+        return
+    # Nuestro propio cambio no necesita otro rerun, pero sólo si la sala no
+    # había cambiado desde la versión que estamos dibujando
+    if changed and version_before == st.session_state.room_seen_version:
+        st.session_state.room_seen_version = version_before + 1
+
+    if st.button(t("common.start_game")):
+        try:
+            room.start_game()
+        except RoomError as e:
+            st.error(t(e.key))
+        else:
+            safe_rerun()
+
+
+def _render_reveal(room: Room, is_host: bool) -> None:
+    seat = room.seat_of(_token())
+    first_name = room.players[room.start_index] if room.players else t("common.someone")
+
+    if seat is None:
+        st.info(t("room.already_started"))
+    elif st.session_state.room_revealed_round != room.round:
+        if st.button(t("common.show_role"), key="room_show_role_button"):
+            st.session_state.room_revealed_round = room.round
+            safe_rerun()
+    else:
+        render_role_card(
+            seat in room.impostor_indices,
+            room.theme_name,
+            room.civil_word,
+            room.impostor_hint,
+            room.decoy_word,
+        )
+        if st.button(t("room.hide"), key="room_hide_role_button"):
+            st.session_state.room_revealed_round = -1
+            safe_rerun()
+
+    st.markdown("---")
+    st.markdown(
+        f"<p style='text-align:center;'>{t('common.first_player', name=html.escape(first_name))}</p>",
+        unsafe_allow_html=True,
+    )
+
+    if is_host:
+        if st.button(t("common.start_timer")):
+            room.start_timer()
+            safe_rerun()
+    else:
+        st.caption(t("room.host_starts_timer"))
+
+
+def _render_play(room: Room, is_host: bool) -> None:
+    total = room.countdown_seconds
+    started_at = room.countdown_started_at or time.time()
+
+    def remaining_seconds() -> int:
+        return max(0, total - int(time.time() - started_at))
+
+    remaining = remaining_seconds()
+    render_countdown(remaining, total, label=t("play.remaining"))
+    schedule_rerun_at_expiry(remaining, remaining_seconds)
+
+    if remaining == 0:
+        st.markdown(
+            f"<p style='text-align:center; color:#ff5555;'><b>{t('common.time_up')}</b></p>",
+            unsafe_allow_html=True,
+        )
+
+    if is_host:
+        if st.button(t("play.vote"), key="room_vote_button"):
+            room.start_vote()
+            safe_rerun()
+        if st.button(t("room.end_round")):
+            room.end_round()
+            safe_rerun()
+
+
+def _render_vote_progress(room: Room) -> None:
+    """
+    Progreso de la votación. Los votos no suben la versión de la sala, así
+    que se refresca en su propio fragmento, que sólo lee un contador.
+    """
+    fragment = get_fragment_decorator()
+
+    def progress() -> None:
+        st.caption(t("vote.progress", cast=room.tally.votes_cast, total=len(room.players)))
+
+    if fragment is None:
+        progress()
+    else:
+        fragment(run_every=ROOM_POLL_SECONDS)(progress)()
+
+
+def _render_vote(room: Room, is_host: bool) -> None:
+    seat = room.seat_of(_token())
+    _render_vote_progress(room)
+
+    if seat is None:
+        st.info(t("room.already_started"))
+    else:
+        current = room.tally.ballots.get(_token())
+        target = st.selectbox(
+            t("vote.who"),
+            options=[i for i in range(len(room.players)) if i != seat],
+            format_func=room.players.__getitem__,
+            index=None,
+            placeholder=t("vote.placeholder"),
+            key=f"room_vote_target_{room.round}",
+        )
+        if st.button(t("vote.confirm"), key="room_vote_confirm_button", disabled=target is None):
+            room.vote(_token(), target)
+            safe_rerun()
+        if current is not None:
+            st.caption(t("vote.your_vote", name=room.players[current]))
+
+    if is_host and st.button(t("vote.close"), key="room_vote_close_button"):
+        room.close_vote()
+        safe_rerun()
+
+
+def render_room_screen() -> None:
+    room = get_room_registry().get(st.session_state.room_code or "")
+    token = _token()
+
+    if room is None or token not in room.members:
+        st.session_state.room_code = None
+        _render_entry()
+        return
+
+    # Lo que dibujamos ahora corresponde a esta versión de la sala
+    st.session_state.room_seen_version = room.version
+    is_host = room.is_host(token)
+
+    c = _center_column()
+    with c:
+        st.markdown(
+            f"<h1 style='text-align:center;'>{t('room.title', code=room.code)}</h1>",
+            unsafe_allow_html=True,
+        )
+        st.caption(
+            t("room.share_code", code=room.code)
+            + (t("room.you_are_host") if is_host else "")
+        )
+        st.markdown("---")
+
+        if room.phase == ROOM_LOBBY:
+            _render_lobby(room, is_host)
+        elif room.phase == ROOM_REVEAL:
+            _render_reveal(room, is_host)
+        elif room.phase == ROOM_PLAY:
+            _render_play(room, is_host)
+        elif room.phase == ROOM_VOTE:
+            _render_vote(room, is_host)
+
+        st.markdown("---")
+        if st.button(t("room.leave")):
+            _leave_to_menu()
+            safe_rerun()
+            return
+
+    _watch_room(room)
@@ -0,0 +1,95 @@
+import html
+
+import streamlit as st
+
+from components.leaderboard import render_leaderboard
+from game_logic import end_vote, finish_vote, get_vote_tally
+from i18n import t
+from state import get_game, reset_to_menu, safe_rerun
+
+
+def _center_column():
+    col1, col2, col3 = st.columns([1, 2, 1])
+    return col2
+
+
+def _render_result(players) -> None:
+    result = st.session_state.vote_result
+    game = get_game()
+
+    if result.accused:
+        accused = ", ".join(players[i] for i in result.accused)
+        st.markdown(
+            f"<h3 style='text-align:center;'>"
+            f"{t('vote.most_voted', names=html.escape(accused), votes=result.top_votes)}</h3>",
+            unsafe_allow_html=True,
+        )
+    winners = t("vote.impostors_won") if result.impostors_won else t("vote.civilians_won")
+    st.markdown(f"<h2 style='text-align:center;'>{winners}</h2>", unsafe_allow_html=True)
+
+    impostors = ", ".join(players[i] for i in game.impostors)
+    st.markdown(
+        f"<p style='text-align:center;'>"
+        f"{t('vote.reveal', impostors=html.escape(impostors), word=html.escape(game.civil_word))}</p>",
+        unsafe_allow_html=True,
+    )
+
+    st.markdown("---")
+    render_leaderboard(st.session_state.leaderboard)
+
+
+def render_vote_screen() -> None:
+    players = st.session_state.players
+    game = get_game()
+
+    if not players or not game.num_players or game.num_players > len(players):
+        st.warning(t("common.game_problem"))
+        reset_to_menu()
+        return
+
+    tally = get_vote_tally()
+
+    c = _center_column()
+    with c:
+        st.markdown(
+            f"<h1 style='text-align:center;'>{t('vote.title')}</h1>",
+            unsafe_allow_html=True,
+        )
+        st.markdown("---")
+
+        if st.session_state.vote_result is not None:
+            _render_result(players)
+            b1, b2, b3 = st.columns([1, 2, 1])
+            with b2:
+                if st.button(t("common.back_to_menu"), key="vote_back_button"):
+                    end_vote()
+                    safe_rerun()
+            return
+
+        # Se vota en el mismo orden en que se revelaron los roles, pasando el móvil
+        voter = game.reveal_order[tally.votes_cast]
+        st.markdown(
+            f"<h3 style='text-align:center;'>{t('vote.turn', name=html.escape(players[voter]))}</h3>",
+            unsafe_allow_html=True,
+        )
+        st.caption(t("vote.progress", cast=tally.votes_cast, total=game.num_players))
+
+        target = st.selectbox(
+            t("vote.who"),
+            options=[i for i in range(game.num_players) if i != voter],
+            format_func=players.__getitem__,
+            index=None,
+            placeholder=t("vote.placeholder"),
+            key=f"vote_target_{tally.votes_cast}",
+        )
+        if st.button(t("vote.confirm"), key="vote_confirm_button", disabled=target is None):
+            tally.cast(voter, target)
+            if tally.votes_cast >= game.num_players:
+                finish_vote()
+            safe_rerun()
+            return
+
+        st.markdown("---")
+        if st.button(t("vote.close"), key="vote_close_button"):
+            finish_vote()
+            safe_rerun()
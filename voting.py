@@ -0,0 +1,164 @@
+"""
+Votaciones al acabar el temporizador y clasificación acumulada.
+
+Cada jugador vota a quién cree que es impostor. Los votos se cuentan según
+llegan: `VoteTally` guarda el voto de cada votante (para poder cambiarlo)
+y cuántos votos lleva cada jugador, y mantiene el máximo con un contador
+por número de votos, así que votar o cambiar el voto es O(1) y saber a
+cuántos votos va el más votado también. Sólo al cerrar la votación se
+mira quién es (una pasada, O(n)).
+
+Puntos de cada ronda:
+
+- Si el más votado (sin empate) es impostor, ganan los civiles: cada civil
+  suma CIVILIAN_WIN y los que votaron a un impostor, además, GOOD_VOTE.
+- Si no (empate o expulsan a un civil), cada impostor suma IMPOSTOR_WIN.
+
+`Leaderboard` acumula los puntos ronda a ronda en una lista ordenada:
+sumar puntos a un jugador es O(log n) más un desplazamiento en C, y el
+top-k y la posición de un jugador no dependen de cuántos haya.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from roles import ImpostorSet
+
+CIVILIAN_WIN = 1
+GOOD_VOTE = 1
+IMPOSTOR_WIN = 2
+
+
+class VoteResult(NamedTuple):
+    accused: Tuple[int, ...]     # los más votados (más de uno si hay empate)
+    top_votes: int
+    votes_cast: int
+    impostors_won: bool
+    points: Dict[int, int]       # jugador -> puntos de esta ronda
+
+
+class VoteTally:
+    """Recuento incremental de una votación entre `num_players` jugadores."""
+
+    __slots__ = ("num_players", "ballots", "counts", "levels", "top")
+
+    def __init__(self, num_players: int) -> None:
+        self.num_players = num_players
+        self.ballots: Dict[Hashable, int] = {}           # votante -> jugador votado
+        self.counts = array("I", bytes(4 * num_players))  # votos de cada jugador
+        # levels[c]: cuántos jugadores llevan c votos (c >= 1)
+        self.levels = array("I", bytes(4 * (num_players + 1)))
+        self.top = 0
+
+    @property
+    def votes_cast(self) -> int:
+        return len(self.ballots)
+
+    def _move(self, target: int, delta: int) -> None:
+        counts, levels = self.counts, self.levels
+        before = counts[target]
+        after = before + delta
+        counts[target] = after
+        if before:
+            levels[before] -= 1
+        if after:
+            if after >= len(levels):
+                levels.append(0)
+            levels[after] += 1
+        if after > self.top:
+            self.top = after
+        elif before == self.top and not levels[before]:
+            # El máximo sólo puede bajar de uno en uno (y `after` lo ocupa)
+            self.top = after
+
+    def cast(self, voter: Hashable, target: int) -> None:
+        """Apunta (o cambia) el voto de `voter`."""
+        if not 0 <= target < self.num_players:
+            raise IndexError(f"jugador {target} fuera de rango (0..{self.num_players - 1})")
+        previous = self.ballots.get(voter)
+        if previous == target:
+            return
+        if previous is not None:
+            self._move(previous, -1)
+        self.ballots[voter] = target
+        self._move(target, 1)
+
+    def retract(self, voter: Hashable) -> None:
+        previous = self.ballots.pop(voter, None)
+        if previous is not None:
+            self._move(previous, -1)
+
+    def votes_for(self, target: int) -> int:
+        return self.counts[target]
+
+    def leaders(self) -> Tuple[int, ...]:
+        """Los jugadores con más votos (vacío si nadie ha votado)."""
+        if not self.top:
+            return ()
+        top, counts = self.top, self.counts
+        return tuple(i for i in range(self.num_players) if counts[i] == top)
+
+    def result(self, impostors: ImpostorSet, voter_seats: Optional[Dict[Hashable, int]] = None) -> VoteResult:
+        """
+        Cierra el recuento y reparte los puntos. Si los votantes no son los
+        propios índices de jugador (p. ej. tokens de una sala),
+        `voter_seats` dice qué jugador es cada uno.
+        """
+        accused = self.leaders()
+        impostors_won = len(accused) != 1 or accused[0] not in impostors
+
+        points: Dict[int, int] = {}
+        if impostors_won:
+            for p in impostors:
+                points[p] = IMPOSTOR_WIN
+        else:
+            for p in range(self.num_players):
+                if p not in impostors:
+                    points[p] = CIVILIAN_WIN
+            for voter, target in self.ballots.items():
+                seat = voter if voter_seats is None else voter_seats.get(voter)
+                if seat is not None and seat in points and target in impostors:
+                    points[seat] += GOOD_VOTE
+        return VoteResult(accused, self.top, self.votes_cast, impostors_won, points)
+
+
+class Leaderboard:
+    """Puntos acumulados por jugador, siempre ordenados de más a menos."""
+
+    __slots__ = ("scores", "_order", "rounds")
+
+    def __init__(self) -> None:
+        self.scores: Dict[str, int] = {}
+        self._order: List[Tuple[int, str]] = []  # (-puntos, nombre), ordenada
+        self.rounds = 0
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add(self, name: str, points: int) -> None:
+        old = self.scores.get(name)
+        if old is not None:
+            del self._order[bisect_left(self._order, (-old, name))]
+        new = (old or 0) + points
+        self.scores[name] = new
+        insort(self._order, (-new, name))
+
+    def apply(self, players: Sequence[str], result: VoteResult) -> None:
+        """Suma los puntos de una ronda; los que juegan sin puntuar entran con 0."""
+        for seat, name in enumerate(players):
+            points = result.points.get(seat, 0)
+            if points or name not in self.scores:
+                self.add(name, points)
+        self.rounds += 1
+
+    def top(self, k: int = 10) -> List[Tuple[str, int]]:
+        return [(name, -score) for score, name in self._order[:k]]
+
+    def rank(self, name: str) -> Optional[int]:
+        """Puesto del jugador (1 = primero; empatados comparten puesto)."""
+        score = self.scores.get(name)
+        if score is None:
+            return None
+        return bisect_left(self._order, (-score, "")) + 1
+